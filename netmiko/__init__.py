@@ -1,4 +1,6 @@
+import importlib
 import logging
+import sys
 
 # Logging configuration
 log = logging.getLogger(__name__)  # noqa
@@ -9,16 +11,38 @@ from netmiko.ssh_dispatcher import ssh_dispatcher
 from netmiko.ssh_dispatcher import redispatch
 from netmiko.ssh_dispatcher import platforms
 from netmiko.ssh_dispatcher import FileTransfer
-from netmiko.scp_handler import SCPConn
-from netmiko.cisco.cisco_ios import InLineTransfer
-from netmiko.ssh_exception import NetmikoTimeoutException, NetMikoTimeoutException
-from netmiko.ssh_exception import (
-    NetmikoAuthenticationException,
-    NetMikoAuthenticationException,
-)
-from netmiko.ssh_autodetect import SSHDetect
-from netmiko.base_connection import BaseConnection
-from netmiko.scp_functions import file_transfer
+
+# These are imported on first access; they pull in Paramiko, scp, pyserial, and telnetlib.
+_LAZY_IMPORTS = {
+    "SCPConn": "netmiko.scp_handler",
+    "InLineTransfer": "netmiko.cisco.cisco_ios",
+    "NetmikoTimeoutException": "netmiko.ssh_exception",
+    "NetMikoTimeoutException": "netmiko.ssh_exception",
+    "NetmikoAuthenticationException": "netmiko.ssh_exception",
+    "NetMikoAuthenticationException": "netmiko.ssh_exception",
+    "SSHDetect": "netmiko.ssh_autodetect",
+    "BaseConnection": "netmiko.base_connection",
+    "file_transfer": "netmiko.scp_functions",
+    "AsyncConnectHandler": "netmiko.async_connection",
+    "ReplayConnectHandler": "netmiko.recording",
+}
+
+
+def __getattr__(name):
+    """Import the lazily loaded netmiko objects on first access (PEP 562)."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ requires Python 3.7
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
 
 # Alternate naming
 Netmiko = ConnectHandler
@@ -42,6 +66,8 @@ __all__ = (
     "BaseConnection",
     "Netmiko",
     "file_transfer",
+    "AsyncConnectHandler",
+    "ReplayConnectHandler",
 )
 
 # Cisco cntl-shift-six sequence
@@ -0,0 +1,377 @@
+"""
+asyncio API for Netmiko connections.
+
+The connection is established (including the driver's session_preparation) in an executor and
+then all the reads are driven by the event loop: the channel's file descriptor (Paramiko
+channel or telnet socket) is registered with the loop and the data is read when it becomes
+available. Once a session is connected, no executor thread is blocked waiting for its output,
+so many sessions can share a small executor; note that Paramiko still runs a reader thread per
+SSH transport.
+
+The prompt handling, command normalization and output sanitization of the driver class are
+reused. Mode changes (config_mode, exit_config_mode) and disconnect are run in the executor.
+
+Example:
+------------------
+import asyncio
+from netmiko.async_connection import AsyncConnectHandler
+
+async def show_version(device):
+    net_connect = await AsyncConnectHandler(**device)
+    async with net_connect:
+        return await net_connect.send_command("show version")
+
+outputs = asyncio.get_event_loop().run_until_complete(
+    asyncio.gather(*[show_version(device) for device in devices])
+)
+------------------
+
+The connections are established using the loop's default executor unless an executor is
+passed to AsyncConnectHandler; its number of workers limits how many connections are
+established in parallel.
+"""
+import asyncio
+import re
+import time
+from collections import deque
+from functools import partial
+
+from netmiko import log
+from netmiko.ssh_dispatcher import ConnectHandler
+from netmiko.ssh_exception import NetmikoTimeoutException
+
+
+async def AsyncConnectHandler(*args, executor=None, **kwargs):
+    """
+    Create a Netmiko connection and return it as an AsyncConnection.
+
+    Accepts the same arguments as ConnectHandler.
+
+    :param executor: concurrent.futures executor used to establish the connection and to run
+        the blocking operations (default: the loop's default executor).
+    """
+    loop = asyncio.get_event_loop()
+    connection = await loop.run_in_executor(
+        executor, partial(ConnectHandler, *args, **kwargs)
+    )
+    return AsyncConnection(connection, executor=executor)
+
+
+class AsyncConnection(object):
+    """
+    asyncio wrapper of a connected Netmiko connection (SSH or telnet).
+
+    :param connection: A connected Netmiko connection object.
+    :type connection: BaseConnection
+
+    :param executor: concurrent.futures executor used to run the blocking operations (default:
+        the loop's default executor).
+    """
+
+    def __init__(self, connection, executor=None):
+        if connection.protocol not in ("ssh", "telnet"):
+            raise ValueError("AsyncConnection only supports SSH and telnet connections")
+        self.connection = connection
+        self.executor = executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+    @property
+    def base_prompt(self):
+        return self.connection.base_prompt
+
+    async def run_in_executor(self, func, *args, **kwargs):
+        """Run a blocking method of the connection in the executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def _wait_readable(self, timeout=None):
+        """Wait until the channel is readable or timeout seconds have elapsed."""
+        loop = asyncio.get_event_loop()
+        fileno = self.connection.remote_conn.fileno()
+        readable = loop.create_future()
+
+        def set_readable():
+            if not readable.done():
+                readable.set_result(None)
+
+        loop.add_reader(fileno, set_readable)
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(fileno)
+
+    def write_channel(self, out_data):
+        """Write out_data to the channel."""
+        self.connection.write_channel(out_data)
+
+    async def read_channel(self, timeout=None):
+        """
+        Read the data available on the channel.
+
+        :param timeout: If no data is available, wait up to timeout seconds for some to arrive
+            (None waits until data arrives, 0 does not wait).
+        :type timeout: float
+        """
+        output = self.connection.read_channel()
+        if output or timeout == 0:
+            return output
+        await self._wait_readable(timeout)
+        return self.connection.read_channel()
+
+    async def _read_channel_timing(self, quiet_time):
+        """Read the channel until no data is received for quiet_time seconds."""
+        output = ""
+        while True:
+            new_data = await self.read_channel(timeout=quiet_time)
+            if not new_data:
+                return output
+            output += new_data
+
+    async def clear_buffer(self):
+        """Read (and discard) any data available in the channel."""
+        return await self._read_channel_timing(
+            quiet_time=0.1 * self.connection.global_delay_factor
+        )
+
+    async def read_until_pattern(self, pattern, re_flags=0, timeout=None):
+        """
+        Read channel until pattern detected. Return ALL data available.
+
+        :param pattern: Regular expression pattern to look for.
+        :type pattern: str
+
+        :param re_flags: regex flags used in conjunction with pattern (defaults to no flags)
+        :type re_flags: int
+
+        :param timeout: Seconds to wait for the pattern (default: the connection's timeout).
+        :type timeout: float
+        """
+        if timeout is None:
+            timeout = self.connection.timeout
+        deadline = time.time() + timeout
+        output = ""
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise NetmikoTimeoutException(
+                    f"Timed-out reading channel, pattern not found in output: {pattern}"
+                )
+            output += await self.read_channel(timeout=remaining)
+            if re.search(pattern, output, flags=re_flags):
+                log.debug(f"Pattern found: {pattern} {output}")
+                return output
+
+    async def find_prompt(self, delay_factor=1):
+        """Finds the current network device prompt, last line only.
+
+        :param delay_factor: See __init__: global_delay_factor
+        :type delay_factor: int
+        """
+        connection = self.connection
+        delay_factor = connection.select_delay_factor(delay_factor)
+        await self.clear_buffer()
+        self.write_channel(connection.RETURN)
+        sleep_time = delay_factor * 0.1
+
+        # Check if the only thing you received was a newline
+        count = 0
+        prompt = ""
+        while count <= 12 and not prompt:
+            prompt = (await self.read_channel(timeout=sleep_time)).strip()
+            if not prompt:
+                self.write_channel(connection.RETURN)
+                if sleep_time <= 3:
+                    # Double the sleep_time when it is small
+                    sleep_time *= 2
+                else:
+                    sleep_time += 1
+            count += 1
+        # The prompt might arrive in several reads
+        prompt += await self._read_channel_timing(quiet_time=delay_factor * 0.1)
+
+        # If multiple lines in the output take the last line
+        prompt = connection.normalize_linefeeds(prompt)
+        prompt = prompt.split(connection.RESPONSE_RETURN)[-1]
+        prompt = prompt.strip()
+        if not prompt:
+            raise ValueError(f"Unable to find prompt: {prompt}")
+        log.debug(f"[find_prompt()]: prompt is {prompt}")
+        return prompt
+
+    async def send_command(
+        self,
+        command_string,
+        expect_string=None,
+        delay_factor=1,
+        auto_find_prompt=True,
+        strip_prompt=True,
+        strip_command=True,
+        normalize=True,
+        use_textfsm=False,
+        textfsm_template=None,
+        use_genie=False,
+        cmd_verify=True,
+    ):
+        """Execute command_string on the channel and read until the prompt (or expect_string)
+        is detected. See BaseConnection.send_command for the arguments.
+
+        Parsing (use_textfsm/use_genie) is run in the executor.
+        """
+        connection = self.connection
+        delay_factor = connection.select_delay_factor(delay_factor)
+        timeout = connection.timeout * delay_factor
+        start = time.time()
+
+        # Find the current router prompt
+        if expect_string is None:
+            if auto_find_prompt:
+                try:
+                    prompt = await self.find_prompt(delay_factor=delay_factor)
+                except ValueError:
+                    prompt = connection.base_prompt
+            else:
+                prompt = connection.base_prompt
+            search_pattern = re.escape(prompt.strip())
+        else:
+            search_pattern = expect_string
+
+        if normalize:
+            command_string = connection.normalize_cmd(command_string)
+
+        await self.clear_buffer()
+        self.write_channel(command_string)
+        new_data = ""
+
+        cmd = command_string.strip()
+        # if cmd is just an "enter" skip this section
+        if cmd and cmd_verify:
+            # Make sure you read until you detect the command echo (avoid getting out of sync)
+            new_data = await self.read_until_pattern(pattern=re.escape(cmd))
+            new_data = connection.normalize_linefeeds(new_data)
+            # Strip off everything before the command echo (to avoid false positives on the prompt)
+            if new_data.count(cmd) == 1:
+                new_data = new_data.split(cmd)[1:]
+                new_data = connection.RESPONSE_RETURN.join(new_data)
+                new_data = new_data.lstrip()
+                new_data = f"{cmd}{connection.RESPONSE_RETURN}{new_data}"
+
+        output = ""
+        past_three_reads = deque(maxlen=3)
+        first_line_processed = False
+
+        # Keep reading data until search_pattern is found or until the timeout is reached.
+        while True:
+            if new_data:
+                output += new_data
+                past_three_reads.append(new_data)
+
+                # Case where we haven't processed the first_line yet (there is a potential issue
+                # in the first line (in cases where the line is repainted).
+                if not first_line_processed:
+                    output, first_line_processed = connection._first_line_handler(
+                        output, search_pattern
+                    )
+                    # Check if we have already found our pattern
+                    if re.search(search_pattern, output):
+                        break
+
+                else:
+                    # Check if pattern is in the past three reads
+                    if re.search(search_pattern, "".join(past_three_reads)):
+                        break
+
+            remaining = start + timeout - time.time()
+            if remaining <= 0:
+                raise IOError(
+                    "Search pattern never detected in send_command: {}".format(
+                        search_pattern
+                    )
+                )
+            new_data = await self.read_channel(timeout=remaining)
+
+        output = connection._sanitize_output(
+            output,
+            strip_command=strip_command,
+            command_string=command_string,
+            strip_prompt=strip_prompt,
+        )
+
+        if use_textfsm or use_genie:
+            return await self.run_in_executor(
+                connection._parse_output,
+                output,
+                command_string,
+                use_textfsm=use_textfsm,
+                textfsm_template=textfsm_template,
+                use_genie=use_genie,
+            )
+        return output
+
+    async def send_config_set(
+        self,
+        config_commands=None,
+        exit_config_mode=True,
+        delay_factor=1,
+        config_mode_command=None,
+        cmd_verify=True,
+        enter_config_mode=True,
+    ):
+        """Send configuration commands down the channel. See BaseConnection.send_config_set for
+        the arguments.
+
+        Entering and exiting configuration mode is run in the executor.
+        """
+        connection = self.connection
+        delay_factor = connection.select_delay_factor(delay_factor)
+        if config_commands is None:
+            return ""
+        elif isinstance(config_commands, str):
+            config_commands = (config_commands,)
+
+        if not hasattr(config_commands, "__iter__"):
+            raise ValueError("Invalid argument passed into send_config_set")
+
+        # Send config commands
+        output = ""
+        if enter_config_mode:
+            cfg_mode_args = (config_mode_command,) if config_mode_command else tuple()
+            output = await self.run_in_executor(connection.config_mode, *cfg_mode_args)
+
+        if connection.fast_cli or not cmd_verify:
+            for cmd in config_commands:
+                self.write_channel(connection.normalize_cmd(cmd))
+            # Gather output
+            output += await self._read_channel_timing(quiet_time=2 * delay_factor)
+        else:
+            for cmd in config_commands:
+                self.write_channel(connection.normalize_cmd(cmd))
+
+                # Make sure command is echoed
+                new_output = await self.read_until_pattern(
+                    pattern=re.escape(cmd.strip())
+                )
+                output += new_output
+
+                # We might capture next prompt in the original read
+                pattern = f"(?:{re.escape(connection.base_prompt)}|#)"
+                if not re.search(pattern, new_output):
+                    # Make sure trailing prompt comes back (after command)
+                    new_output = await self.read_until_pattern(pattern=pattern)
+                    output += new_output
+
+        if exit_config_mode:
+            output += await self.run_in_executor(connection.exit_config_mode)
+        output = connection._sanitize_output(output)
+        log.debug(f"{output}")
+        return output
+
+    async def disconnect(self):
+        """Try to gracefully close the connection."""
+        await self.run_in_executor(self.connection.disconnect)
@@ -0,0 +1,91 @@
+"""
+Remember which SSH authentication method succeeded for each device.
+
+With use_keys=True or allow_agent=True, Paramiko tries every key (agent and key files) before the
+password. On AAA backed devices which reject keys, each of these attempts costs a round trip and
+can trigger lockout throttling. When an auth_cache is passed to the connection, the method that
+succeeded is recorded (per host:port, or per auth_group for devices sharing the same AAA policy)
+and, if it was the password, the following connections try the password first. If that fails,
+all the methods are tried again, as usual.
+
+The cache is in memory (shared by the process) unless a path is given, in which case it is also
+persisted to a JSON file.
+
+Example:
+------------------
+from netmiko import ConnectHandler
+from netmiko.auth_cache import AuthMethodCache
+
+auth_cache = AuthMethodCache(path="~/.netmiko/auth_methods.json")
+for device in devices:
+    with ConnectHandler(**device, use_keys=True, auth_cache=auth_cache) as net_connect:
+        print(net_connect.send_command("show version"))
+------------------
+"""
+import json
+import os
+import threading
+
+from netmiko import log
+from netmiko.utilities import ensure_dir_exists
+
+PASSWORD = "password"
+PUBLICKEY = "publickey"
+
+
+class AuthMethodCache(object):
+    """
+    Authentication method (PASSWORD or PUBLICKEY) that succeeded, by host or by auth group.
+
+    :param path: JSON file the cache is loaded from and saved to (default: None, in memory).
+    :type path: str
+    """
+
+    def __init__(self, path=None):
+        self.path = os.path.expanduser(path) if path else None
+        self._lock = threading.Lock()
+        self._methods = {}
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path) as f:
+                    self._methods = json.load(f)
+            except ValueError:
+                log.debug(f"Ignoring the invalid auth method cache: {self.path}")
+
+    def get(self, key):
+        """Return the method that succeeded for key, or None."""
+        with self._lock:
+            return self._methods.get(key)
+
+    def set(self, key, method):
+        """Record the method that succeeded for key."""
+        with self._lock:
+            if self._methods.get(key) == method:
+                return
+            self._methods[key] = method
+            self._save()
+
+    def delete(self, key):
+        """Forget the method of key."""
+        with self._lock:
+            if self._methods.pop(key, None) is not None:
+                self._save()
+
+    def clear(self):
+        """Forget all the methods."""
+        with self._lock:
+            self._methods.clear()
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        ensure_dir_exists(os.path.dirname(os.path.abspath(self.path)))
+        # Write to a temporary file first so a crash never leaves a truncated cache
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._methods, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+auth_method_cache = AuthMethodCache()
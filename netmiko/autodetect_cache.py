@@ -0,0 +1,107 @@
+"""
+Persistent cache of SSHDetect/SNMPDetect results.
+
+Devices rarely change platform, so rediscovering a large inventory again and again mostly
+repeats the same probes. The AutodetectCache stores the detected device_type in a SQLite database
+(by default ~/.netmiko/autodetect_cache.sqlite) keyed by host:port and a fingerprint of the
+device (the SSH host key or a hash of the login banner).
+
+A cached result is only used if it is younger than the TTL and the fingerprint is unchanged. It is
+also verified cheaply before the probes are skipped: SSHDetect compares the prompt received at
+login and SNMPDetect does a single GET of the cached device_type's OID.
+
+Example:
+------------------
+from netmiko.autodetect_cache import AutodetectCache
+from netmiko.ssh_autodetect import SSHDetect
+
+cache = AutodetectCache(ttl=7 * 86400)
+guesser = SSHDetect(**remote_device, autodetect_cache=cache)
+best_match = guesser.autodetect()
+------------------
+"""
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from netmiko.utilities import find_netmiko_dir, ensure_dir_exists
+
+
+def banner_fingerprint(banner):
+    """Return a fingerprint of a login banner (used when there is no SSH host key)."""
+    return hashlib.sha1(banner.encode("utf-8", "ignore")).hexdigest()
+
+
+class AutodetectCache(object):
+    """
+    SQLite backed cache of autodetected device_types.
+
+    :param path: SQLite database file (default: autodetect_cache.sqlite in the netmiko directory,
+        see NETMIKO_DIR).
+    :type path: str
+
+    :param ttl: Seconds an entry stays valid (default: one day).
+    :type ttl: int
+    """
+
+    def __init__(self, path=None, ttl=86400):
+        if path is None:
+            netmiko_base_dir, _ = find_netmiko_dir()
+            path = os.path.join(netmiko_base_dir, "autodetect_cache.sqlite")
+        ensure_dir_exists(os.path.dirname(os.path.abspath(path)))
+        self.path = path
+        self.ttl = ttl
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS autodetect ("
+                "method TEXT, host TEXT, port INTEGER, fingerprint TEXT, "
+                "device_type TEXT, verify TEXT, timestamp REAL, "
+                "PRIMARY KEY (method, host, port))"
+            )
+
+    def _connect(self):
+        # A new SQLite connection per operation so the cache can be shared by threads
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    def get(self, method, host, port, fingerprint=""):
+        """
+        Return (device_type, verify) for host:port or None.
+
+        None is returned if there is no entry, the entry is older than the TTL, or the
+        fingerprint doesn't match.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fingerprint, device_type, verify, timestamp FROM autodetect "
+                "WHERE method = ? AND host = ? AND port = ?",
+                (method, host, port),
+            ).fetchone()
+        if row is None:
+            return None
+        cached_fingerprint, device_type, verify, timestamp = row
+        if cached_fingerprint != fingerprint or time.time() - timestamp > self.ttl:
+            return None
+        return device_type, verify
+
+    def set(self, method, host, port, device_type, fingerprint="", verify=""):
+        """Store the device_type detected for host:port."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO autodetect VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (method, host, port, fingerprint, device_type, verify, time.time()),
+            )
+
+    def delete(self, method, host, port):
+        """Remove the entry for host:port (for example when verification failed)."""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM autodetect WHERE method = ? AND host = ? AND port = ?",
+                (method, host, port),
+            )
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM autodetect")
@@ -6,29 +6,48 @@ platforms (Cisco and non-Cisco).
 
 Also defines methods that should generally be supported by child classes
 """
+
+import codecs
+import copy
+import getpass
 import io
 import re
 import socket
-import telnetlib
 import time
 from collections import deque
 from os import path
 from threading import Lock
 
 import paramiko
-import serial
 
-from netmiko import log
+from netmiko import log, tracing
+from netmiko.auth_cache import PASSWORD, PUBLICKEY, auth_method_cache
+from netmiko.debug_log import debug_enabled, log_data, summarize, wire_enabled
+from netmiko.instrumentation import (
+    NULL_PHASE,
+    PhaseTimings,
+    command_hook,
+    connect_phase,
+)
+from netmiko.jump_host import jump_host_pool, parse_jump_host
 from netmiko.netmiko_globals import MAX_BUFFER, BACKSPACE_CHAR
+from netmiko.recording import RecordingChannel, SessionRecorder
+from netmiko.session_log import SessionLog
 from netmiko.ssh_exception import (
     NetmikoTimeoutException,
     NetmikoAuthenticationException,
 )
+from netmiko.ssh_cache import (
+    copy_host_keys,
+    load_host_keys,
+    load_private_key,
+    load_ssh_config,
+)
 from netmiko.utilities import (
     write_bytes,
     check_serial_port,
-    get_structured_data,
-    get_structured_data_genie,
+    structured_data_converter,
+    TextFSMStreamParser,
 )
 
 
@@ -39,6 +58,18 @@ class BaseConnection(object):
     Otherwise method left as a stub method.
     """
 
+    # Defaults for the objects not built by __init__ (mocks, test fakes)
+    use_exec = False
+    _parent_connection = None
+    hooks = ()
+    _command_record = None
+    session_recorder = None
+    # Time the TCP connection, key exchange and authentication separately (see _open)
+    _connect_detailed = False
+    # Background writer of the session_log (see _start_session_log)
+    _session_log_writer = None
+    _session_log_close = False
+
     def __init__(
         self,
         ip="",
@@ -60,6 +91,9 @@ class BaseConnection(object):
         alt_host_keys=False,
         alt_key_file="",
         ssh_config_file=None,
+        shared_jump_host=False,
+        auth_cache=None,
+        auth_group=None,
         timeout=100,
         session_timeout=60,
         auth_timeout=None,
@@ -70,12 +104,16 @@ class BaseConnection(object):
         response_return=None,
         serial_settings=None,
         fast_cli=False,
+        parse_pool=None,
+        use_exec=False,
         session_log=None,
         session_log_record_writes=False,
         session_log_file_mode="write",
         allow_auto_change=False,
         encoding="ascii",
         sock=None,
+        hooks=None,
+        session_recording=None,
     ):
         """
         Initialize attributes for establishing connection to target device.
@@ -145,6 +183,21 @@ class BaseConnection(object):
         :param ssh_config_file: File name of OpenSSH configuration file.
         :type ssh_config_file: str
 
+        :param shared_jump_host: Tunnel the connection in a channel of an SSH connection to the
+                ProxyJump host (from ssh_config_file) shared by all the connections of the
+                process, instead of starting an `ssh -W` subprocess (default: False). As with
+                OpenSSH, the jump host user defaults to the local user.
+        :type shared_jump_host: bool
+
+        :param auth_cache: Record the SSH authentication method that succeeded and try the
+                password first on the next connections if keys were rejected. True uses the
+                process-wide cache (default: None, no cache).
+        :type auth_cache: netmiko.auth_cache.AuthMethodCache or bool
+
+        :param auth_group: auth_cache key shared by the devices with the same authentication
+                policy (default: None, the key is host:port).
+        :type auth_group: str
+
         :param timeout: Connection timeout.
         :type timeout: float
 
@@ -174,7 +227,18 @@ class BaseConnection(object):
                 (default: False)
         :type fast_cli: boolean
 
-        :param session_log: File path or BufferedIOBase subclass object to write the session log to.
+        :param parse_pool: Process pool used for TextFSM/Genie parsing of command output
+                (default: None, parse in the calling thread).
+        :type parse_pool: netmiko.parse_pool.ParsePool
+
+        :param use_exec: send_command runs each command in a new SSH exec channel and reads its
+                output until EOF, instead of using the interactive session (default: False).
+        :type use_exec: bool
+
+        :param session_log: File path or BufferedIOBase subclass object to write the session log to,
+                or a SessionLog (netmiko.session_log) for a compressed or rotated log. The log is
+                written by a background thread. The session_log attribute is the object passed
+                (for a file path, the SessionLog writing the file, reset to None on disconnect).
         :type session_log: str
 
         :param session_log_record_writes: The session log generally only records channel reads due
@@ -197,6 +261,14 @@ class BaseConnection(object):
         :param sock: An open socket or socket-like object (such as a `.Channel`) to use for
                 communication to the target host (default: None).
         :type sock: socket
+
+        :param hooks: Objects notified of the connection events, see
+                netmiko.instrumentation.ConnectionHook (default: None).
+        :type hooks: list
+
+        :param session_recording: File path or SessionRecorder to record the raw channel reads
+                and writes with their timing to, see netmiko.recording (default: None).
+        :type session_recording: str
         """
         self.remote_conn = None
 
@@ -242,6 +314,7 @@ class BaseConnection(object):
 
         # Netmiko will close the session_log if we open the file
         self.session_log = None
+        self._session_log_writer = None
         self.session_log_record_writes = session_log_record_writes
         self._session_log_close = False
         # Ensures last write operations prior to disconnect are recorded.
@@ -251,21 +324,29 @@ class BaseConnection(object):
                 # If session_log is a string, open a file corresponding to string name.
                 self.open_session_log(filename=session_log, mode=session_log_file_mode)
             elif isinstance(session_log, io.BufferedIOBase):
-                # In-memory buffer or an already open file handle
+                # In-memory buffer or an already open file handle (flushed but not closed)
+                self._start_session_log(SessionLog(buffered_io=session_log))
+                self.session_log = session_log
+            elif isinstance(session_log, SessionLog):
+                self._start_session_log(session_log)
                 self.session_log = session_log
             else:
                 raise ValueError(
                     "session_log must be a path to a file, a file handle, "
-                    "or a BufferedIOBase subclass."
+                    "a BufferedIOBase subclass or a SessionLog."
                 )
+        if isinstance(session_recording, str):
+            session_recording = SessionRecorder(session_recording)
+        self.session_recorder = session_recording
 
-        # Default values
+        # Default values (pyserial EIGHTBITS, PARITY_NONE, STOPBITS_ONE); pyserial itself is only
+        # imported when a serial connection is established.
         self.serial_settings = {
             "port": "COM1",
             "baudrate": 9600,
-            "bytesize": serial.EIGHTBITS,
-            "parity": serial.PARITY_NONE,
-            "stopbits": serial.STOPBITS_ONE,
+            "bytesize": 8,
+            "parity": "N",
+            "stopbits": 1,
         }
         if serial_settings is None:
             serial_settings = {}
@@ -279,6 +360,10 @@ class BaseConnection(object):
             self.serial_settings.update({"port": comm_port})
 
         self.fast_cli = fast_cli
+        self.parse_pool = parse_pool
+        self.use_exec = use_exec
+        # Exit status of the last command sent with send_command_exec()
+        self.exit_status = None
         self.global_delay_factor = global_delay_factor
         if self.fast_cli and self.global_delay_factor == 1:
             self.global_delay_factor = 0.1
@@ -286,6 +371,15 @@ class BaseConnection(object):
         # set in set_base_prompt method
         self.base_prompt = ""
         self._session_locker = Lock()
+        # set on the connections returned by open_channel()
+        self._parent_connection = None
+
+        # Instrumentation, connect_timings is set when the connection is established
+        self.hooks = list(hooks) if hooks else []
+        self.connect_timings = None
+        self._connect_timer = None
+        # CommandRecord of the command being sent (only when there are hooks)
+        self._command_record = None
 
         # determine if telnet or SSH
         if "_telnet" in device_type:
@@ -314,15 +408,89 @@ class BaseConnection(object):
 
             # For SSH proxy support
             self.ssh_config_file = ssh_config_file
+            self.shared_jump_host = shared_jump_host
+
+            # Authentication method ordering
+            if auth_cache is True:
+                auth_cache = auth_method_cache
+            self.auth_cache = auth_cache
+            self.auth_group = auth_group
 
         # Establish the remote connection
         self._open()
 
     def _open(self):
         """Decouple connection creation from __init__ for mocking."""
-        self._modify_connection_params()
-        self.establish_connection()
-        self._try_session_preparation()
+        self.connect_timings = self._connect_timer = PhaseTimings()
+        span = tracing.start_span("connect", self) if tracing.enabled() else None
+        # The TCP connection, key exchange and authentication are only timed separately when
+        # the timings are read
+        self._connect_detailed = bool(self.hooks) or span is not None
+        try:
+            self._modify_connection_params()
+            self.establish_connection()
+            with self._connect_phase("session_preparation"):
+                self._try_session_preparation()
+        except Exception as e:
+            self.connect_timings.stop()
+            if span is not None:
+                tracing.end_span(span, self.connect_timings, e)
+            for hook in self.hooks:
+                hook.on_connect_error(self, e, self.connect_timings)
+            raise
+        finally:
+            self._connect_timer = None
+            self._connect_detailed = False
+        self.connect_timings.stop()
+        log.debug(f"Connection timings: {self.connect_timings}")
+        if span is not None:
+            tracing.end_span(span, self.connect_timings)
+        for hook in self.hooks:
+            hook.on_connect(self, self.connect_timings)
+
+    def _record_channel(self, channel):
+        """Return the channel, wrapped to record its data if there is a session_recorder."""
+        if self.session_recorder is None:
+            return channel
+        self.session_recorder.start(
+            secrets=(self.password, self.secret),
+            device_type=self.device_type,
+            host=self.host,
+            port=self.port,
+        )
+        return RecordingChannel(channel, self.session_recorder)
+
+    def _connect_phase(self, name):
+        """Context manager recording the duration of a phase of the connection establishment.
+
+        :param name: Name of the phase in connect_timings
+        :type name: str
+        """
+        timer = getattr(self, "_connect_timer", None)
+        if timer is None:
+            return NULL_PHASE
+        return timer.phase(name)
+
+    def _command_phase(self, name):
+        """Context manager recording the duration of a phase of the current command.
+
+        :param name: Name of the phase in the CommandRecord
+        :type name: str
+        """
+        record = self._command_record
+        if record is None:
+            return NULL_PHASE
+        return record.phase(name)
+
+    def _record_chunk(self, data):
+        """Count data read during a command and pass it to the on_chunk hooks.
+
+        :param data: Data read from the channel
+        :type data: str
+        """
+        self._command_record.add_chunk(data)
+        for hook in self.hooks:
+            hook.on_chunk(self, data)
 
     def __enter__(self):
         """Establish a session using a Context Manager."""
@@ -382,21 +550,18 @@ class BaseConnection(object):
         :param out_data: data to be written to the channel
         :type out_data: str (can be either unicode/byte string)
         """
+        data = write_bytes(out_data, encoding=self.encoding)
         if self.protocol == "ssh":
-            self.remote_conn.sendall(write_bytes(out_data, encoding=self.encoding))
+            self.remote_conn.sendall(data)
         elif self.protocol == "telnet":
-            self.remote_conn.write(write_bytes(out_data, encoding=self.encoding))
+            self.remote_conn.write(data)
         elif self.protocol == "serial":
-            self.remote_conn.write(write_bytes(out_data, encoding=self.encoding))
+            self.remote_conn.write(data)
             self.remote_conn.flush()
         else:
             raise ValueError("Invalid protocol specified")
+        log_data("write_channel", data, ">>")
         try:
-            log.debug(
-                "write_channel: {}".format(
-                    write_bytes(out_data, encoding=self.encoding)
-                )
-            )
             if self._session_log_fin or self.session_log_record_writes:
                 self._write_session_log(out_data)
         except UnicodeDecodeError:
@@ -404,18 +569,10 @@ class BaseConnection(object):
             pass
 
     def _write_session_log(self, data):
-        if self.session_log is not None and len(data) > 0:
-            # Hide the password and secret in the session_log
-            if self.password:
-                data = data.replace(self.password, "********")
-            if self.secret:
-                data = data.replace(self.secret, "********")
-            if isinstance(self.session_log, io.BufferedIOBase):
-                data = self.normalize_linefeeds(data)
-                self.session_log.write(write_bytes(data, encoding=self.encoding))
-            else:
-                self.session_log.write(self.normalize_linefeeds(data))
-            self.session_log.flush()
+        # The password and secret are masked and the linefeeds normalized by the
+        # session_log writer thread
+        if self._session_log_writer is not None and len(data) > 0:
+            self._session_log_writer.write(data)
 
     def write_channel(self, out_data):
         """Generic handler that will write to both SSH and telnet channel.
@@ -437,6 +594,8 @@ class BaseConnection(object):
             log.error("Connection is not initialised, is_alive returns False")
             return False
         if self.protocol == "telnet":
+            import telnetlib
+
             try:
                 # Try sending IAC + NOP (IAC is telnet way of sending command)
                 # IAC = Interpret as Command; it comes before the NOP.
@@ -483,8 +642,11 @@ class BaseConnection(object):
                 )
         if self.ansi_escape_codes:
             output = self.strip_ansi_escape_codes(output)
-        log.debug(f"read_channel: {output}")
+        if output:
+            log_data("read_channel", output)
         self._write_session_log(output)
+        if output and self._command_record is not None:
+            self._record_chunk(output)
         return output
 
     def read_channel(self):
@@ -526,7 +688,10 @@ class BaseConnection(object):
         output = ""
         if not pattern:
             pattern = re.escape(self.base_prompt)
-        log.debug(f"Pattern is: {pattern}")
+        debug = debug_enabled()
+        trace_data = debug or wire_enabled()
+        if debug:
+            log.debug(f"Pattern is: {pattern}")
 
         i = 1
         loop_delay = 0.1
@@ -545,9 +710,12 @@ class BaseConnection(object):
                     new_data = new_data.decode("utf-8", "ignore")
                     if self.ansi_escape_codes:
                         new_data = self.strip_ansi_escape_codes(new_data)
-                    log.debug(f"_read_channel_expect read_data: {new_data}")
+                    if trace_data:
+                        log_data("_read_channel_expect read_data", new_data)
                     output += new_data
                     self._write_session_log(new_data)
+                    if self._command_record is not None:
+                        self._record_chunk(new_data)
                 except socket.timeout:
                     raise NetmikoTimeoutException(
                         "Timed-out reading channel, data not available."
@@ -557,7 +725,8 @@ class BaseConnection(object):
             elif self.protocol == "telnet" or "serial":
                 output += self.read_channel()
             if re.search(pattern, output, flags=re_flags):
-                log.debug(f"Pattern found: {pattern} {output}")
+                if debug:
+                    log.debug(f"Pattern found: {pattern} {summarize(output)}")
                 return output
             time.sleep(loop_delay * self.global_delay_factor)
             i += 1
@@ -784,10 +953,8 @@ class BaseConnection(object):
         # Use SSHConfig to generate source content.
         full_path = path.abspath(path.expanduser(self.ssh_config_file))
         if path.exists(full_path):
-            ssh_config_instance = paramiko.SSHConfig()
-            with io.open(full_path, "rt", encoding="utf-8") as f:
-                ssh_config_instance.parse(f)
-                source = ssh_config_instance.lookup(self.host)
+            ssh_config_instance = load_ssh_config(full_path)
+            source = ssh_config_instance.lookup(self.host)
         else:
             source = {}
 
@@ -802,9 +969,14 @@ class BaseConnection(object):
                 )
             port = source.get("port", self.port)
             host = source.get("hostname", self.host)
-            # -F {full_path} forces the continued use of the same SSH config file
-            cmd = "ssh -F {} -W {}:{} {}".format(full_path, host, port, hops[0])
-            proxy = paramiko.ProxyCommand(cmd)
+            if self.shared_jump_host:
+                proxy = self._open_jump_host_channel(
+                    ssh_config_instance, hops[0], host, int(port)
+                )
+            else:
+                # -F {full_path} forces the continued use of the same SSH config file
+                cmd = "ssh -F {} -W {}:{} {}".format(full_path, host, port, hops[0])
+                proxy = paramiko.ProxyCommand(cmd)
         else:
             proxy = None
 
@@ -820,6 +992,81 @@ class BaseConnection(object):
 
         return connect_dict
 
+    def _open_jump_host_channel(self, ssh_config, jump_host, host, port):
+        """Open a channel to host:port through the shared connection to the jump host.
+
+        :param ssh_config: Parsed SSH config file
+        :type ssh_config: paramiko.SSHConfig
+
+        :param jump_host: ProxyJump entry ([user@]host[:port])
+        :type jump_host: str
+
+        :param host: Hostname (or IP address) of the device
+        :type host: str
+
+        :param port: SSH port of the device
+        :type port: int
+        """
+        user, jump_hostname, jump_port = parse_jump_host(jump_host)
+        source = ssh_config.lookup(jump_hostname)
+        identities_only = source.get("identitiesonly", "no").lower() == "yes"
+        jump_params = {
+            "hostname": source.get("hostname", jump_hostname),
+            "port": jump_port or int(source.get("port", 22)),
+            # Like OpenSSH (and the `ssh -W` ProxyCommand), default to the local user
+            "username": user or source.get("user") or getpass.getuser(),
+            "key_filename": source.get("identityfile"),
+            "look_for_keys": not identities_only,
+            "allow_agent": not identities_only,
+            "timeout": self.timeout,
+            "auth_timeout": self.auth_timeout,
+            "banner_timeout": self.banner_timeout,
+        }
+        key = (jump_params["hostname"], jump_params["port"], jump_params["username"])
+
+        def connect():
+            client = self._build_ssh_client()
+            try:
+                client.connect(**jump_params)
+            except Exception:
+                client.close()
+                raise
+            return client
+
+        try:
+            return jump_host_pool.open_channel(
+                key, connect, (host, port), timeout=self.timeout
+            )
+        except paramiko.ssh_exception.AuthenticationException as auth_err:
+            msg = f"Authentication failure: unable to connect to jump host {key[0]}"
+            msg += self.RETURN + str(auth_err)
+            raise NetmikoAuthenticationException(msg)
+        except (socket.error, paramiko.SSHException) as e:
+            msg = (
+                f"Connection to device through jump host {key[0]} failed: "
+                f"{self.device_type} {host}:{port}"
+            )
+            msg += self.RETURN + str(e)
+            raise NetmikoTimeoutException(msg)
+
+    def _load_key_file(self):
+        """Return the decrypted key of key_file from the process-wide cache.
+
+        Returns None if the key can't be loaded; Paramiko then loads key_file itself (and reports
+        the error).
+        """
+        if not isinstance(self.key_file, str):
+            return None
+        if path.isfile(path.expanduser(self.key_file) + "-cert.pub"):
+            # Let Paramiko load the certificate along with the key
+            return None
+        passphrase = self.passphrase if self.passphrase is not None else self.password
+        try:
+            return load_private_key(self.key_file, passphrase)
+        except (IOError, paramiko.SSHException) as e:
+            log.debug(f"Unable to load key_file {self.key_file}: {e}")
+            return None
+
     def _connect_params_dict(self):
         """Generate dictionary of Paramiko connection parameters."""
         conn_dict = {
@@ -837,6 +1084,12 @@ class BaseConnection(object):
             "banner_timeout": self.banner_timeout,
             "sock": self.sock,
         }
+        if self.key_file and self.pkey is None:
+            pkey = self._load_key_file()
+            if pkey is not None:
+                # Paramiko would load and decrypt key_file again on every connection
+                conn_dict["pkey"] = pkey
+                conn_dict["key_filename"] = None
 
         # Check if using SSH 'config' file mainly for SSH proxy support
         if self.ssh_config_file:
@@ -877,20 +1130,41 @@ class BaseConnection(object):
         :type height: int
         """
         if self.protocol == "telnet":
-            self.remote_conn = telnetlib.Telnet(
-                self.host, port=self.port, timeout=self.timeout
-            )
-            self.telnet_login()
+            import telnetlib
+
+            with self._connect_phase("tcp_connect"):
+                self.remote_conn = telnetlib.Telnet(
+                    self.host, port=self.port, timeout=self.timeout
+                )
+            self.remote_conn = self._record_channel(self.remote_conn)
+            with self._connect_phase("telnet_login"):
+                self.telnet_login()
         elif self.protocol == "serial":
-            self.remote_conn = serial.Serial(**self.serial_settings)
-            self.serial_login()
+            import serial
+
+            self.remote_conn = self._record_channel(
+                serial.Serial(**self.serial_settings)
+            )
+            with self._connect_phase("serial_login"):
+                self.serial_login()
         elif self.protocol == "ssh":
-            ssh_connect_params = self._connect_params_dict()
             self.remote_conn_pre = self._build_ssh_client()
 
             # initiate SSH connection
             try:
-                self.remote_conn_pre.connect(**ssh_connect_params)
+                with self._connect_phase("connect_params"):
+                    ssh_connect_params = self._connect_params_dict()
+                if self._connect_detailed and ssh_connect_params["sock"] is None:
+                    # Opened here instead of by Paramiko to time the TCP connection
+                    with self._connect_phase("tcp_connect"):
+                        ssh_connect_params["sock"] = socket.create_connection(
+                            (
+                                ssh_connect_params["hostname"],
+                                ssh_connect_params["port"],
+                            ),
+                            timeout=self.timeout,
+                        )
+                self._ssh_connect(ssh_connect_params)
             except socket.error:
                 self.paramiko_cleanup()
                 msg = "Connection to device timed-out: {device_type} {ip}:{port}".format(
@@ -909,21 +1183,153 @@ class BaseConnection(object):
                 print(f"SSH connection established to {self.host}:{self.port}")
 
             # Use invoke_shell to establish an 'interactive session'
-            if width and height:
-                self.remote_conn = self.remote_conn_pre.invoke_shell(
-                    term="vt100", width=width, height=height
-                )
-            else:
-                self.remote_conn = self.remote_conn_pre.invoke_shell()
+            with self._connect_phase("invoke_shell"):
+                if width and height:
+                    self.remote_conn = self.remote_conn_pre.invoke_shell(
+                        term="vt100", width=width, height=height
+                    )
+                else:
+                    self.remote_conn = self.remote_conn_pre.invoke_shell()
+            self.remote_conn = self._record_channel(self.remote_conn)
 
             self.remote_conn.settimeout(self.blocking_timeout)
             if self.keepalive:
                 self.remote_conn.transport.set_keepalive(self.keepalive)
-            self.special_login_handler()
+            with self._connect_phase("special_login_handler"):
+                self.special_login_handler()
             if self.verbose:
                 print("Interactive SSH session established")
         return ""
 
+    def _ssh_connect(self, ssh_connect_params):
+        """Connect and authenticate remote_conn_pre.
+
+        If auth_cache recorded that the password was accepted (and not the keys), the password
+        is tried first without the keys; all the methods are tried if it is rejected.
+
+        :param ssh_connect_params: Paramiko connection parameters
+        :type ssh_connect_params: dict
+        """
+        if self.auth_cache is None:
+            self._paramiko_connect(**ssh_connect_params)
+            return
+
+        auth_key = self.auth_group or f"{self.host}:{self.port}"
+        tries_keys = (
+            ssh_connect_params["look_for_keys"]
+            or ssh_connect_params["allow_agent"]
+            or ssh_connect_params["key_filename"]
+            or ssh_connect_params["pkey"]
+        )
+        # A sock passed by the user can't be reopened for the fallback connection
+        if (
+            tries_keys
+            and self.password
+            and self.sock is None
+            and self.auth_cache.get(auth_key) == PASSWORD
+        ):
+            password_params = dict(
+                ssh_connect_params,
+                look_for_keys=False,
+                allow_agent=False,
+                key_filename=None,
+                pkey=None,
+            )
+            try:
+                self._paramiko_connect(**password_params)
+            except paramiko.ssh_exception.AuthenticationException:
+                log.debug(f"Password rejected by {auth_key}, trying all the methods")
+                self.remote_conn_pre.close()
+                self._paramiko_connect(**self._connect_params_dict())
+        else:
+            self._paramiko_connect(**ssh_connect_params)
+
+        auth_method = self.remote_conn_pre.get_transport().auth_handler.auth_method
+        if auth_method == PUBLICKEY:
+            self.auth_cache.set(auth_key, PUBLICKEY)
+        elif auth_method in ("password", "keyboard-interactive"):
+            self.auth_cache.set(auth_key, PASSWORD)
+
+    def _paramiko_connect(self, **ssh_connect_params):
+        """Call remote_conn_pre.connect(), timing the key exchange and the authentication.
+
+        The key exchange and the authentication are only timed separately when the timings are
+        read (hooks registered or tracing enabled); otherwise Paramiko's connect() is timed as a
+        whole, as the ssh_connect phase.
+        """
+        timer = getattr(self, "_connect_timer", None)
+        if timer is None:
+            self.remote_conn_pre.connect(**ssh_connect_params)
+            return
+        if not self._connect_detailed:
+            with timer.phase("ssh_connect"):
+                self.remote_conn_pre.connect(**ssh_connect_params)
+            return
+
+        # Paramiko calls SSHClient._auth() once the key exchange and host key checks are done
+        client = self.remote_conn_pre
+        paramiko_auth = client._auth
+        start = time.monotonic()
+        auth_start = []
+
+        def _auth(*args, **kwargs):
+            auth_start.append(time.monotonic())
+            return paramiko_auth(*args, **kwargs)
+
+        client._auth = _auth
+        try:
+            client.connect(**ssh_connect_params)
+        finally:
+            del client._auth
+            end = time.monotonic()
+            if auth_start:
+                timer.add("kex", auth_start[0] - start, start)
+                timer.add("auth", end - auth_start[0], auth_start[0])
+            else:
+                timer.add("kex", end - start, start)
+
+    def open_channel(self, width=None, height=None, session_prep=True):
+        """Open another interactive session on the existing SSH transport.
+
+        Returns a new connection object (of the same class) with its own shell channel, lock, and
+        prompt; no new TCP connection or authentication is needed. Commands sent on different
+        channels (from different threads) run in parallel on devices that allow several sessions
+        per SSH connection.
+
+        Disconnecting the returned object only closes its channel; disconnecting this connection
+        closes the SSH transport (and all the channels opened on it). The session_log is not
+        shared with the new channel.
+
+        :param width: Specified width of the VT100 terminal window
+        :type width: int
+
+        :param height: Specified height of the VT100 terminal window
+        :type height: int
+
+        :param session_prep: Run session_preparation() on the new channel (default: True).
+        :type session_prep: bool
+        """
+        if self.protocol != "ssh":
+            raise ValueError("open_channel() requires an SSH connection")
+        new_conn = copy.copy(self)
+        new_conn._parent_connection = self
+        new_conn._session_locker = Lock()
+        new_conn.session_log = None
+        new_conn._session_log_writer = None
+        new_conn._session_log_close = False
+        new_conn.session_recorder = None
+        if width and height:
+            new_conn.remote_conn = self.remote_conn_pre.invoke_shell(
+                term="vt100", width=width, height=height
+            )
+        else:
+            new_conn.remote_conn = self.remote_conn_pre.invoke_shell()
+        new_conn.remote_conn.settimeout(self.blocking_timeout)
+        new_conn.special_login_handler()
+        if session_prep:
+            new_conn._try_session_preparation()
+        return new_conn
+
     def _test_channel_read(self, count=40, pattern=""):
         """Try to read the channel (generally post login) verify you receive data back.
 
@@ -970,11 +1376,16 @@ class BaseConnection(object):
         # Create instance of SSHClient object
         remote_conn_pre = paramiko.SSHClient()
 
-        # Load host_keys for better SSH security
+        # Load host_keys for better SSH security; the files are parsed once per process
         if self.system_host_keys:
-            remote_conn_pre.load_system_host_keys()
+            # Read-only for Paramiko, so shared by all the connections
+            remote_conn_pre._system_host_keys = load_host_keys()
         if self.alt_host_keys and path.isfile(self.alt_key_file):
-            remote_conn_pre.load_host_keys(self.alt_key_file)
+            # Same as load_host_keys(), with a copy as new keys can be added to it
+            remote_conn_pre._host_keys = copy_host_keys(
+                load_host_keys(self.alt_key_file)
+            )
+            remote_conn_pre._host_keys_filename = self.alt_key_file
 
         # Default is to automatically add untrusted hosts (make sure appropriate for your env)
         remote_conn_pre.set_missing_host_key_policy(self.key_policy)
@@ -1003,6 +1414,7 @@ class BaseConnection(object):
         """Handler for devices like WLC, Extreme ERS that throw up characters prior to login."""
         pass
 
+    @connect_phase("disable_paging")
     def disable_paging(self, command="terminal length 0", delay_factor=1):
         """Disable paging default to a Cisco CLI method.
 
@@ -1025,6 +1437,7 @@ class BaseConnection(object):
         log.debug("Exiting disable_paging")
         return output
 
+    @connect_phase("set_terminal_width")
     def set_terminal_width(self, command="", delay_factor=1):
         """CLI terminals try to automatically adjust the line based on the width of the terminal.
         This causes the output to get distorted when accessed programmatically.
@@ -1046,6 +1459,7 @@ class BaseConnection(object):
         output = self.read_until_pattern(pattern=re.escape(command.strip()))
         return output
 
+    @connect_phase("set_base_prompt")
     def set_base_prompt(
         self, pri_prompt_terminator="#", alt_prompt_terminator=">", delay_factor=1
     ):
@@ -1131,6 +1545,7 @@ class BaseConnection(object):
                 sleep_time *= 2
                 sleep_time = 3 if sleep_time >= 3 else sleep_time
 
+    @command_hook("command_string")
     def send_command_timing(
         self,
         command_string,
@@ -1189,17 +1604,20 @@ class BaseConnection(object):
 
         output = ""
         delay_factor = self.select_delay_factor(delay_factor)
-        self.clear_buffer()
+        with self._command_phase("clear_buffer"):
+            self.clear_buffer()
         if normalize:
             command_string = self.normalize_cmd(command_string)
 
-        self.write_channel(command_string)
+        with self._command_phase("write"):
+            self.write_channel(command_string)
 
         cmd = command_string.strip()
         # if cmd is just an "enter" skip this section
         if cmd and cmd_echo:
             # Make sure you read until you detect the command echo (avoid getting out of sync)
-            new_data = self.read_until_pattern(pattern=re.escape(cmd))
+            with self._command_phase("echo_wait"):
+                new_data = self.read_until_pattern(pattern=re.escape(cmd))
             new_data = self.normalize_linefeeds(new_data)
 
             # Strip off everything before the command echo
@@ -1212,38 +1630,33 @@ class BaseConnection(object):
                 # cmd is in the actual output (not just echoed)
                 output = new_data
 
-        log.debug(f"send_command_timing current output: {output}")
-
-        output += self._read_channel_timing(
-            delay_factor=delay_factor, max_loops=max_loops
-        )
-        output = self._sanitize_output(
-            output,
-            strip_command=strip_command,
-            command_string=command_string,
-            strip_prompt=strip_prompt,
-        )
+        debug = debug_enabled()
+        if debug:
+            log.debug(f"send_command_timing current output: {summarize(output)}")
 
-        # If both TextFSM and Genie are set, try TextFSM then Genie
-        if use_textfsm:
-            structured_output = get_structured_data(
-                output,
-                platform=self.device_type,
-                command=command_string.strip(),
-                template=textfsm_template,
+        with self._command_phase("output_wait"):
+            output += self._read_channel_timing(
+                delay_factor=delay_factor, max_loops=max_loops
             )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
-        if use_genie:
-            structured_output = get_structured_data_genie(
-                output, platform=self.device_type, command=command_string.strip()
+        with self._command_phase("sanitize"):
+            output = self._sanitize_output(
+                output,
+                strip_command=strip_command,
+                command_string=command_string,
+                strip_prompt=strip_prompt,
             )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
 
-        log.debug(f"send_command_timing final output: {output}")
+        if debug:
+            log.debug(f"send_command_timing final output: {summarize(output)}")
+        if use_textfsm or use_genie:
+            with self._command_phase("parse"):
+                return self._parse_output(
+                    output,
+                    command_string,
+                    use_textfsm=use_textfsm,
+                    textfsm_template=textfsm_template,
+                    use_genie=use_genie,
+                )
         return output
 
     def strip_prompt(self, a_string):
@@ -1286,6 +1699,7 @@ class BaseConnection(object):
         except IndexError:
             return (data, False)
 
+    @command_hook("command_string")
     def send_command(
         self,
         command_string,
@@ -1341,6 +1755,14 @@ class BaseConnection(object):
         :param cmd_verify: Verify command echo before proceeding (default: True).
         :type cmd_verify: bool
         """
+        if self.use_exec:
+            return self.send_command_exec(
+                command_string,
+                use_textfsm=use_textfsm,
+                textfsm_template=textfsm_template,
+                use_genie=use_genie,
+            )
+
         # Time to delay in each read loop
         loop_delay = 0.2
 
@@ -1355,7 +1777,8 @@ class BaseConnection(object):
         if expect_string is None:
             if auto_find_prompt:
                 try:
-                    prompt = self.find_prompt(delay_factor=delay_factor)
+                    with self._command_phase("prompt_discovery"):
+                        prompt = self.find_prompt(delay_factor=delay_factor)
                 except ValueError:
                     prompt = self.base_prompt
             else:
@@ -1367,16 +1790,19 @@ class BaseConnection(object):
         if normalize:
             command_string = self.normalize_cmd(command_string)
 
-        time.sleep(delay_factor * loop_delay)
-        self.clear_buffer()
-        self.write_channel(command_string)
+        with self._command_phase("clear_buffer"):
+            time.sleep(delay_factor * loop_delay)
+            self.clear_buffer()
+        with self._command_phase("write"):
+            self.write_channel(command_string)
         new_data = ""
 
         cmd = command_string.strip()
         # if cmd is just an "enter" skip this section
         if cmd and cmd_verify:
             # Make sure you read until you detect the command echo (avoid getting out of sync)
-            new_data = self.read_until_pattern(pattern=re.escape(cmd))
+            with self._command_phase("echo_wait"):
+                new_data = self.read_until_pattern(pattern=re.escape(cmd))
             new_data = self.normalize_linefeeds(new_data)
             # Strip off everything before the command echo (to avoid false positives on the prompt)
             if new_data.count(cmd) == 1:
@@ -1390,62 +1816,169 @@ class BaseConnection(object):
         past_three_reads = deque(maxlen=3)
         first_line_processed = False
 
-        # Keep reading data until search_pattern is found or until max_loops is reached.
-        while i <= max_loops:
-            if new_data:
-                output += new_data
-                past_three_reads.append(new_data)
-
-                # Case where we haven't processed the first_line yet (there is a potential issue
-                # in the first line (in cases where the line is repainted).
-                if not first_line_processed:
-                    output, first_line_processed = self._first_line_handler(
-                        output, search_pattern
+        with self._command_phase("prompt_wait"):
+            # Keep reading data until search_pattern is found or max_loops is reached.
+            while i <= max_loops:
+                if new_data:
+                    output += new_data
+                    past_three_reads.append(new_data)
+
+                    # Case where we haven't processed the first_line yet (there is a
+                    # potential issue in the first line (in cases where the line is
+                    # repainted).
+                    if not first_line_processed:
+                        output, first_line_processed = self._first_line_handler(
+                            output, search_pattern
+                        )
+                        # Check if we have already found our pattern
+                        if re.search(search_pattern, output):
+                            break
+
+                    else:
+                        # Check if pattern is in the past three reads
+                        if re.search(search_pattern, "".join(past_three_reads)):
+                            break
+
+                time.sleep(delay_factor * loop_delay)
+                i += 1
+                new_data = self.read_channel()
+            else:  # nobreak
+                raise IOError(
+                    "Search pattern never detected in send_command_expect: {}".format(
+                        search_pattern
                     )
-                    # Check if we have already found our pattern
-                    if re.search(search_pattern, output):
-                        break
+                )
 
-                else:
-                    # Check if pattern is in the past three reads
-                    if re.search(search_pattern, "".join(past_three_reads)):
-                        break
+        with self._command_phase("sanitize"):
+            output = self._sanitize_output(
+                output,
+                strip_command=strip_command,
+                command_string=command_string,
+                strip_prompt=strip_prompt,
+            )
 
-            time.sleep(delay_factor * loop_delay)
-            i += 1
-            new_data = self.read_channel()
-        else:  # nobreak
-            raise IOError(
-                "Search pattern never detected in send_command_expect: {}".format(
-                    search_pattern
+        if use_textfsm or use_genie:
+            with self._command_phase("parse"):
+                return self._parse_output(
+                    output,
+                    command_string,
+                    use_textfsm=use_textfsm,
+                    textfsm_template=textfsm_template,
+                    use_genie=use_genie,
                 )
-            )
+        return output
 
-        output = self._sanitize_output(
-            output,
-            strip_command=strip_command,
-            command_string=command_string,
-            strip_prompt=strip_prompt,
-        )
+    def _parse_output(
+        self,
+        output,
+        command_string,
+        use_textfsm=False,
+        textfsm_template=None,
+        use_genie=False,
+    ):
+        """Convert command output to structured data (TextFSM then Genie).
 
-        # If both TextFSM and Genie are set, try TextFSM then Genie
-        if use_textfsm:
-            structured_output = get_structured_data(
+        Parsing runs in self.parse_pool when one is set; in that case a Future is returned if the
+        pool is not blocking. Raw output is returned if no structured data could be produced.
+        """
+        command = command_string.strip()
+        if self.parse_pool is not None:
+            return self.parse_pool.parse(
                 output,
-                platform=self.device_type,
-                command=command_string.strip(),
-                template=textfsm_template,
-            )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
-        if use_genie:
-            structured_output = get_structured_data_genie(
-                output, platform=self.device_type, command=command_string.strip()
+                self.device_type,
+                command,
+                use_textfsm=use_textfsm,
+                textfsm_template=textfsm_template,
+                use_genie=use_genie,
             )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
+        return structured_data_converter(
+            output,
+            self.device_type,
+            command,
+            use_textfsm=use_textfsm,
+            textfsm_template=textfsm_template,
+            use_genie=use_genie,
+        )
+
+    @command_hook("command_string")
+    def send_command_exec(
+        self,
+        command_string,
+        timeout=None,
+        use_textfsm=False,
+        textfsm_template=None,
+        use_genie=False,
+    ):
+        """Execute command_string in a new SSH exec channel on the existing transport.
+
+        The output (stdout and stderr) is read until the channel is closed by the remote end; no
+        prompt detection, echo stripping, or paging handling is needed. The exit status of the
+        command is stored in self.exit_status. Requires SSH exec support on the device (Linux,
+        NX-OS, EOS, Junos...).
+
+        :param command_string: The command to be executed on the remote device.
+        :type command_string: str
+
+        :param timeout: Seconds to wait for data from the channel (default: self.timeout).
+        :type timeout: float
+
+        :param use_textfsm: Process command output through TextFSM template (default: False).
+        :type use_textfsm: bool
+
+        :param textfsm_template: Name of template to parse output with; can be fully qualified
+            path, relative path, or name of file in current directory. (default: None).
+
+        :param use_genie: Process command output through PyATS/Genie parser (default: False).
+        :type use_genie: bool
+        """
+        if self.protocol != "ssh":
+            raise ValueError("send_command_exec() requires an SSH connection")
+        if timeout is None:
+            timeout = self.timeout
+        command_string = command_string.strip()
+        with self._command_phase("write"):
+            channel = self.remote_conn.get_transport().open_session()
+        # A multi-byte character may be split across two reads
+        decoder = codecs.getincrementaldecoder(self.encoding)("ignore")
+        output = []
+        try:
+            with self._command_phase("write"):
+                channel.settimeout(timeout)
+                channel.set_combine_stderr(True)
+                channel.exec_command(command_string)
+            with self._command_phase("output_wait"):
+                while True:
+                    try:
+                        new_data = channel.recv(MAX_BUFFER)
+                    except socket.timeout:
+                        raise NetmikoTimeoutException(
+                            f"Timed-out reading exec channel: {command_string}"
+                        )
+                    if not new_data:
+                        break
+                    new_data = decoder.decode(new_data)
+                    if not new_data:
+                        continue
+                    self._write_session_log(new_data)
+                    if self._command_record is not None:
+                        self._record_chunk(new_data)
+                    output.append(new_data)
+                self.exit_status = channel.recv_exit_status()
+        finally:
+            channel.close()
+        log.debug(f"send_command_exec: {command_string} (exit {self.exit_status})")
+
+        with self._command_phase("sanitize"):
+            output = self.normalize_linefeeds("".join(output))
+        if use_textfsm or use_genie:
+            with self._command_phase("parse"):
+                return self._parse_output(
+                    output,
+                    command_string,
+                    use_textfsm=use_textfsm,
+                    textfsm_template=textfsm_template,
+                    use_genie=use_genie,
+                )
         return output
 
     def send_command_expect(self, *args, **kwargs):
@@ -1459,6 +1992,120 @@ class BaseConnection(object):
         """
         return self.send_command(*args, **kwargs)
 
+    def send_command_stream(
+        self,
+        command_string,
+        expect_string=None,
+        delay_factor=1,
+        max_loops=500,
+        auto_find_prompt=True,
+        normalize=True,
+        textfsm_template=None,
+    ):
+        """Execute command_string and incrementally parse the output using TextFSM.
+
+        This is a generator. Output lines are fed to the TextFSM state machine as they are read
+        from the channel and each record (as a dictionary) is yielded as soon as the template's
+        Record action fires. The command echo and the trailing prompt are never fed to the
+        parser. Template selection is the same as send_command(use_textfsm=True).
+
+        :param command_string: The command to be executed on the remote device.
+        :type command_string: str
+
+        :param expect_string: Regular expression pattern to use for determining end of output.
+            If left blank will default to being based on router prompt.
+        :type expect_string: str
+
+        :param delay_factor: Multiplying factor used to adjust delays (default: 1).
+        :type delay_factor: int
+
+        :param max_loops: Controls wait time in conjunction with delay_factor. Will default to be
+            based upon self.timeout.
+        :type max_loops: int
+
+        :param auto_find_prompt: Determine the current prompt prior to sending the command
+            (default: True).
+        :type auto_find_prompt: bool
+
+        :param normalize: Ensure the proper enter is sent at end of command (default: True).
+        :type normalize: bool
+
+        :param textfsm_template: Name of template to parse output with; can be fully qualified
+            path, relative path, or name of file in current directory. (default: None).
+        :type textfsm_template: str
+        """
+        loop_delay = 0.2
+        delay_factor = self.select_delay_factor(delay_factor)
+        if delay_factor == 1 and max_loops == 500:
+            max_loops = int(self.timeout / loop_delay)
+
+        # Resolve the template before touching the channel (raises CliTableError if none)
+        parser = TextFSMStreamParser(
+            platform=self.device_type,
+            command=command_string.strip(),
+            template=textfsm_template,
+        )
+
+        if expect_string is None:
+            if auto_find_prompt:
+                try:
+                    prompt = self.find_prompt(delay_factor=delay_factor)
+                except ValueError:
+                    prompt = self.base_prompt
+            else:
+                prompt = self.base_prompt
+            search_pattern = re.escape(prompt.strip())
+        else:
+            search_pattern = expect_string
+
+        if normalize:
+            command_string = self.normalize_cmd(command_string)
+
+        time.sleep(delay_factor * loop_delay)
+        self.clear_buffer()
+        self.write_channel(command_string)
+
+        cmd = command_string.strip()
+        echo_found = not cmd
+        pending = ""
+        i = 1
+        while i <= max_loops:
+            new_data = self.read_channel()
+            if new_data:
+                pending += self.normalize_linefeeds(new_data)
+                if not echo_found:
+                    # Drop everything up to the end of the command echo line
+                    pending = self.strip_backspaces(pending)
+                    cmd_index = pending.find(cmd)
+                    eol_index = pending.find(self.RESPONSE_RETURN, cmd_index)
+                    if cmd_index == -1 or eol_index == -1:
+                        i += 1
+                        time.sleep(delay_factor * loop_delay)
+                        continue
+                    start = eol_index + len(self.RESPONSE_RETURN)
+                    pending = pending[start:]
+                    echo_found = True
+
+                # Only complete lines go to the parser; the last (partial) line might be
+                # the trailing prompt.
+                complete, sep, pending = pending.rpartition(self.RESPONSE_RETURN)
+                if sep:
+                    yield from parser.feed(complete + "\n")
+                if re.search(search_pattern, pending) or (
+                    expect_string is not None and re.search(search_pattern, complete)
+                ):
+                    break
+            time.sleep(delay_factor * loop_delay)
+            i += 1
+        else:  # nobreak
+            raise IOError(
+                "Search pattern never detected in send_command_stream: {}".format(
+                    search_pattern
+                )
+            )
+
+        yield from parser.close()
+
     @staticmethod
     def strip_backspaces(output):
         """Strip any backspace characters out of the output.
@@ -1654,6 +2301,7 @@ class BaseConnection(object):
         with io.open(config_file, "rt", encoding="utf-8") as cfg_file:
             return self.send_config_set(cfg_file, **kwargs)
 
+    @command_hook("config_commands")
     def send_config_set(
         self,
         config_commands=None,
@@ -1715,29 +2363,36 @@ class BaseConnection(object):
         output = ""
         if enter_config_mode:
             cfg_mode_args = (config_mode_command,) if config_mode_command else tuple()
-            output = self.config_mode(*cfg_mode_args)
+            with self._command_phase("config_mode"):
+                output = self.config_mode(*cfg_mode_args)
 
         if self.fast_cli:
-            for cmd in config_commands:
-                self.write_channel(self.normalize_cmd(cmd))
+            with self._command_phase("write"):
+                for cmd in config_commands:
+                    self.write_channel(self.normalize_cmd(cmd))
             # Gather output
-            output += self._read_channel_timing(
-                delay_factor=delay_factor, max_loops=max_loops
-            )
+            with self._command_phase("output_wait"):
+                output += self._read_channel_timing(
+                    delay_factor=delay_factor, max_loops=max_loops
+                )
         elif not cmd_verify:
-            for cmd in config_commands:
-                self.write_channel(self.normalize_cmd(cmd))
-                time.sleep(delay_factor * 0.05)
+            with self._command_phase("write"):
+                for cmd in config_commands:
+                    self.write_channel(self.normalize_cmd(cmd))
+                    time.sleep(delay_factor * 0.05)
             # Gather output
-            output += self._read_channel_timing(
-                delay_factor=delay_factor, max_loops=max_loops
-            )
+            with self._command_phase("output_wait"):
+                output += self._read_channel_timing(
+                    delay_factor=delay_factor, max_loops=max_loops
+                )
         else:
             for cmd in config_commands:
-                self.write_channel(self.normalize_cmd(cmd))
+                with self._command_phase("write"):
+                    self.write_channel(self.normalize_cmd(cmd))
 
                 # Make sure command is echoed
-                new_output = self.read_until_pattern(pattern=re.escape(cmd.strip()))
+                with self._command_phase("echo_wait"):
+                    new_output = self.read_until_pattern(pattern=re.escape(cmd.strip()))
                 output += new_output
 
                 # We might capture next prompt in the original read
@@ -1746,13 +2401,17 @@ class BaseConnection(object):
                     # Make sure trailing prompt comes back (after command)
                     # NX-OS has fast-buffering problem where it immediately echoes command
                     # Even though the device hasn't caught up with processing command.
-                    new_output = self.read_until_pattern(pattern=pattern)
+                    with self._command_phase("prompt_wait"):
+                        new_output = self.read_until_pattern(pattern=pattern)
                     output += new_output
 
         if exit_config_mode:
-            output += self.exit_config_mode()
-        output = self._sanitize_output(output)
-        log.debug(f"{output}")
+            with self._command_phase("exit_config_mode"):
+                output += self.exit_config_mode()
+        with self._command_phase("sanitize"):
+            output = self._sanitize_output(output)
+        if debug_enabled():
+            log.debug(f"send_config_set output: {summarize(output)}")
         return output
 
     def strip_ansi_escape_codes(self, string_buffer):
@@ -1785,8 +2444,9 @@ class BaseConnection(object):
         :param string_buffer: The string to be processed to remove ANSI escape codes
         :type string_buffer: str
         """  # noqa
-        log.debug("In strip_ansi_escape_codes")
-        log.debug(f"repr = {repr(string_buffer)}")
+        debug = debug_enabled()
+        if debug:
+            log.debug(f"In strip_ansi_escape_codes: {summarize(string_buffer)}")
 
         code_position_cursor = chr(27) + r"\[\d+;\d+H"
         code_show_cursor = chr(27) + r"\[\?25h"
@@ -1842,9 +2502,8 @@ class BaseConnection(object):
         # CODE_NEXT_LINE must substitute with return
         output = re.sub(code_next_line, self.RETURN, output)
 
-        log.debug("Stripping ANSI escape codes")
-        log.debug(f"new_output = {output}")
-        log.debug(f"repr = {repr(output)}")
+        if debug:
+            log.debug(f"Stripped ANSI escape codes: {summarize(output)}")
 
         return output
 
@@ -1854,26 +2513,33 @@ class BaseConnection(object):
 
     def paramiko_cleanup(self):
         """Cleanup Paramiko to try to gracefully handle SSH session ending."""
+        if self._parent_connection is not None:
+            # Channel from open_channel(), the SSH transport belongs to the parent connection
+            self.remote_conn.close()
+            return
         self.remote_conn_pre.close()
         del self.remote_conn_pre
 
     def disconnect(self):
         """Try to gracefully close the SSH connection."""
-        try:
-            self.cleanup()
-            if self.protocol == "ssh":
-                self.paramiko_cleanup()
-            elif self.protocol == "telnet":
-                self.remote_conn.close()
-            elif self.protocol == "serial":
-                self.remote_conn.close()
-        except Exception:
-            # There have been race conditions observed on disconnect.
-            pass
-        finally:
-            self.remote_conn_pre = None
-            self.remote_conn = None
-            self.close_session_log()
+        with tracing.span("disconnect", self):
+            try:
+                self.cleanup()
+                if self.protocol == "ssh":
+                    self.paramiko_cleanup()
+                elif self.protocol == "telnet":
+                    self.remote_conn.close()
+                elif self.protocol == "serial":
+                    self.remote_conn.close()
+            except Exception:
+                # There have been race conditions observed on disconnect.
+                pass
+            finally:
+                self.remote_conn_pre = None
+                self.remote_conn = None
+                self.close_session_log()
+                if self.session_recorder is not None:
+                    self.session_recorder.close()
 
     def commit(self):
         """Commit method for platforms that support this."""
@@ -1885,17 +2551,27 @@ class BaseConnection(object):
 
     def open_session_log(self, filename, mode="write"):
         """Open the session_log file."""
-        if mode == "append":
-            self.session_log = open(filename, mode="a")
-        else:
-            self.session_log = open(filename, mode="w")
+        self.session_log = SessionLog(file_name=filename, file_mode=mode)
+        self._start_session_log(self.session_log)
         self._session_log_close = True
 
+    def _start_session_log(self, writer):
+        """Start the background writer of the session_log, it is closed on disconnect."""
+        writer.start(
+            secrets=(self.password, self.secret),
+            normalize=self.normalize_linefeeds,
+            encoding=self.encoding,
+        )
+        self._session_log_writer = writer
+
     def close_session_log(self):
-        """Close the session_log file (if it is a file that we opened)."""
-        if self.session_log is not None and self._session_log_close:
-            self.session_log.close()
+        """Close the session_log (a BufferedIOBase passed as session_log is flushed, not closed)."""
+        writer, self._session_log_writer = self._session_log_writer, None
+        if writer is not None:
+            writer.close()
+        if self._session_log_close:
             self.session_log = None
+            self._session_log_close = False
 
 
 class TelnetConnection(BaseConnection):
@@ -0,0 +1,74 @@
+"""
+Cheap debug logging of the channel data.
+
+The data read from and written to the channel can be megabytes long: the netmiko logger only
+gets a summary of it (its repr truncated to DEBUG_PAYLOAD_LIMIT characters, and its length),
+while the full data is logged to the 'netmiko.wire' logger. The wire trace is high volume, so it
+is disabled unless that logger's level is lowered:
+
+------------------
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+logging.getLogger("netmiko.wire").setLevel(logging.DEBUG)
+------------------
+
+Callers check debug_enabled() / wire_enabled() once per operation and only then build their
+messages, so nothing is formatted when debug logging is off.
+"""
+import logging
+
+from netmiko import log
+
+# Number of characters of the channel data in the netmiko debug messages
+DEBUG_PAYLOAD_LIMIT = 1000
+
+wire_log = log.getChild("wire")
+wire_log.setLevel(logging.WARNING)
+
+
+def debug_enabled():
+    """Return True when the netmiko logger is enabled for DEBUG."""
+    return log.isEnabledFor(logging.DEBUG)
+
+
+def wire_enabled():
+    """Return True when the netmiko.wire logger is enabled for DEBUG."""
+    return wire_log.isEnabledFor(logging.DEBUG)
+
+
+def summarize(data, limit=None):
+    """
+    Return the repr of data, truncated to limit characters (with the length of data) if longer.
+
+    :param data: Data read from or written to the channel.
+    :type data: str or bytes
+
+    :param limit: Maximum number of characters of data in the summary (default:
+        DEBUG_PAYLOAD_LIMIT).
+    :type limit: int
+    """
+    if limit is None:
+        limit = DEBUG_PAYLOAD_LIMIT
+    if len(data) <= limit:
+        return repr(data)
+    return f"{data[:limit]!r}... ({len(data)} characters)"
+
+
+def log_data(message, data, direction="<<"):
+    """
+    Log channel data: summarized to the netmiko logger and in full to the wire trace.
+
+    :param message: Prefix of the netmiko debug message.
+    :type message: str
+
+    :param data: Data read from or written to the channel.
+    :type data: str or bytes
+
+    :param direction: '<<' for the data read, '>>' for the data written.
+    :type direction: str
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("%s: %s", message, summarize(data))
+    if wire_log.isEnabledFor(logging.DEBUG):
+        wire_log.debug("%s %r", direction, data)
@@ -0,0 +1,207 @@
+"""
+Run a task against many devices with bounded concurrency.
+
+The FleetExecutor takes an inventory in the same format as load_devices() (device name to
+device dict, group name to list of device names), connects to the devices from a thread pool
+and runs a task function (or a list of show commands) on each of them. Results are returned as an
+iterator in completion order.
+
+Connection rate limits can be set per group (for example per site) to avoid overwhelming
+AAA/TACACS servers, and a per-device timeout aborts devices that take too long.
+
+Example:
+------------------
+from netmiko.fleet import FleetExecutor
+from netmiko.utilities import load_devices
+
+fleet = FleetExecutor(load_devices(), max_workers=50, rate_limits={"site1": 5})
+for result in fleet.run(commands=["show version"], group="all"):
+    print(result.name, result.exception or result.result["show version"])
+------------------
+"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from netmiko import log
+from netmiko.ssh_dispatcher import ConnectHandler
+from netmiko.ssh_exception import NetmikoTimeoutException
+from netmiko.utilities import obtain_all_devices
+
+FleetResult = namedtuple("FleetResult", "name result exception elapsed")
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket used to rate limit connections.
+
+    :param rate: Tokens added per second.
+    :type rate: float
+
+    :param burst: Maximum number of tokens (default: 1).
+    :type burst: int
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _send_commands(connection, commands):
+    """Default task: send each show command, return a dict of command to output."""
+    return {command: connection.send_command(command) for command in commands}
+
+
+class FleetExecutor(object):
+    """
+    Run a task on the devices of an inventory using a thread pool.
+
+    :param inventory: Inventory in the load_devices() format.
+    :type inventory: dict
+
+    :param max_workers: Maximum number of devices handled concurrently (default: 10).
+    :type max_workers: int
+
+    :param rate_limits: Dict of group name to connections per second, or to a
+        (connections per second, burst) tuple. A device in several groups is limited by all of
+        them.
+    :type rate_limits: dict
+
+    :param device_timeout: Seconds after which a device is aborted (its connection is closed)
+        and a NetmikoTimeoutException is returned, counted once the rate limits let it connect
+        (default: None, no limit).
+    :type device_timeout: float
+    """
+
+    def __init__(
+        self, inventory, max_workers=10, rate_limits=None, device_timeout=None
+    ):
+        self.inventory = inventory
+        self.max_workers = max_workers
+        self.device_timeout = device_timeout
+        self.rate_limits = {}
+        for group, rate_limit in (rate_limits or {}).items():
+            if group not in inventory or not isinstance(inventory[group], list):
+                raise ValueError(f"Invalid group in rate_limits: {group}")
+            if not isinstance(rate_limit, (tuple, list)):
+                rate_limit = (rate_limit,)
+            self.rate_limits[group] = TokenBucket(*rate_limit)
+
+    def select(self, group="all"):
+        """
+        Return a dict of device name to device dict.
+
+        :param group: 'all', a group name, a device name, or a list of device names.
+        """
+        all_devices = obtain_all_devices(self.inventory)
+        if isinstance(group, (list, tuple)):
+            names = group
+        elif group == "all":
+            return all_devices
+        elif isinstance(self.inventory.get(group), list):
+            names = self.inventory[group]
+        elif group in all_devices:
+            names = [group]
+        else:
+            raise ValueError(f"Unknown group or device: {group}")
+        return {name: all_devices[name] for name in names}
+
+    def _buckets(self, name):
+        return [
+            bucket
+            for group, bucket in self.rate_limits.items()
+            if name in self.inventory[group]
+        ]
+
+    def _run_device(self, name, device, task):
+        """Connect to a device and run the task, always returns a FleetResult."""
+        connection = None
+        watchdog = None
+        for bucket in self._buckets(name):
+            bucket.acquire()
+        # The wait for the rate limits doesn't count against the device timeout
+        start = time.time()
+        try:
+            connection = ConnectHandler(**device)
+            if self.device_timeout is not None:
+                remaining = max(0, start + self.device_timeout - time.time())
+                # Closing the connection makes the task fail instead of waiting forever
+                watchdog = threading.Timer(remaining, connection.disconnect)
+                watchdog.daemon = True
+                watchdog.start()
+            result = task(connection)
+            exception = None
+        except Exception as e:
+            log.debug(f"FleetExecutor: {name} failed: {e}")
+            result = None
+            exception = e
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            if connection is not None:
+                connection.disconnect()
+        elapsed = time.time() - start
+        if self.device_timeout is not None and elapsed > self.device_timeout:
+            msg = f"{name}: exceeded the device timeout ({self.device_timeout} seconds)"
+            result, exception = None, NetmikoTimeoutException(msg)
+        return FleetResult(name, result, exception, elapsed)
+
+    def run(self, task=None, commands=None, group="all"):
+        """
+        Run task (or send commands) on the devices, yield FleetResult in completion order.
+
+        FleetResult is a (name, result, exception, elapsed) namedtuple. If the device failed,
+        result is None and exception is set.
+
+        :param task: Function called with the connection, its return value is the result.
+        :type task: callable
+
+        :param commands: Show commands to send instead of task, the result is a dict of command
+            to output.
+        :type commands: list
+
+        :param group: 'all', a group name, a device name, or a list of device names.
+        """
+        if (task is None) == (commands is None):
+            raise ValueError("Either task or commands must be specified")
+        if commands is not None:
+            commands = list(commands)
+
+            def task(connection):
+                return _send_commands(connection, commands)
+
+        devices = self.select(group)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = [
+            executor.submit(self._run_device, name, device, task)
+            for name, device in devices.items()
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Don't start the remaining devices if the caller stops iterating
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
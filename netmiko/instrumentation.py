@@ -0,0 +1,312 @@
+"""
+Timing instrumentation of Netmiko connections.
+
+While a connection is established, the duration of each phase is recorded in a PhaseTimings
+record available as the connect_timings attribute of the connection:
+
+    connect_params          Building the SSH connection parameters (private key decryption,
+                            SSH config file, jump host)
+    tcp_connect             TCP connection (or proxy / jump host channel) to the device
+    kex                     SSH banner, key exchange and host key verification
+    auth                    SSH authentication
+    ssh_connect             TCP connection, key exchange and authentication, when they are not
+                            timed separately
+    invoke_shell            Opening of the interactive SSH session
+    special_login_handler   Driver specific login handling
+    telnet_login            Telnet login (telnet only)
+    serial_login            Serial login (serial only)
+    session_preparation     The driver's session_preparation, with the nested phases
+                            session_preparation.set_base_prompt, .disable_paging and
+                            .set_terminal_width
+
+Splitting the SSH connection into tcp_connect, kex and auth means opening the socket instead of
+Paramiko and intercepting its authentication: it is only done when the timings are read (hooks
+registered or tracing enabled). Otherwise Paramiko connects as usual and the whole connection
+is recorded as ssh_connect (telnet connections are always recorded as tcp_connect).
+
+When hooks are registered, send_command, send_command_timing, send_command_exec and
+send_config_set also record a CommandRecord for each call, with the phases of the command:
+
+    prompt_discovery        find_prompt() (send_command without expect_string)
+    clear_buffer            Delay and read of the pending data before the command is written
+    config_mode             Entering configuration mode (send_config_set)
+    write                   Writing the command(s) to the channel
+    echo_wait               Waiting for the command echo
+    prompt_wait             Waiting for the prompt (or expect_string)
+    output_wait             Reading until the channel is quiet (send_command_timing,
+                            send_config_set without cmd_verify, send_command_exec)
+    exit_config_mode        Exiting configuration mode (send_config_set)
+    sanitize                Stripping the command echo, the prompt and normalizing linefeeds
+    parse                   TextFSM/Genie parsing
+
+along with the number of chunks and bytes read from the channel. Without hooks (and with
+tracing disabled, see netmiko.tracing), nothing is recorded.
+
+Hooks are objects implementing (some of) the ConnectionHook methods, passed to the connection
+with the 'hooks' argument:
+
+------------------
+from netmiko import ConnectHandler
+from netmiko.instrumentation import ConnectionHook
+
+class PrintTimings(ConnectionHook):
+    def on_connect(self, connection, timings):
+        print(connection.host, timings.as_dict())
+
+    def after_command(self, connection, record):
+        print(connection.host, record.command, record.total, record.bytes_received)
+
+net_connect = ConnectHandler(**device, hooks=[PrintTimings()])
+------------------
+"""
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+from netmiko import tracing
+
+
+class PhaseTimings(object):
+    """
+    Duration (in seconds) of each phase of an operation.
+
+    phases is an OrderedDict of phase name to seconds (in the order the phases started); nested
+    phases are named 'parent.child'. offsets is a dict of phase name to the seconds elapsed
+    between the start of the operation and the (first) start of the phase. start is the epoch
+    time the operation started and total the duration of the whole operation (None until stop()
+    is called).
+    """
+
+    def __init__(self):
+        self.start = time.time()
+        self.total = None
+        self.phases = OrderedDict()
+        self.offsets = {}
+        self._start = time.monotonic()
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager recording the duration of the phase name."""
+        self._stack.append(name)
+        full_name = ".".join(self._stack)
+        self.phases.setdefault(full_name, 0.0)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.add(full_name, time.monotonic() - start, start)
+
+    def add(self, name, seconds, start=None):
+        """Add seconds to the duration of the phase name (started at time.monotonic() start)."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if start is not None:
+            self.offsets.setdefault(name, start - self._start)
+
+    def stop(self):
+        """Record the total duration."""
+        self.total = time.monotonic() - self._start
+
+    def as_dict(self):
+        """Return the timings as a dict (phases, start and total)."""
+        return {"start": self.start, "total": self.total, "phases": dict(self.phases)}
+
+    def __repr__(self):
+        phases = ", ".join(
+            f"{name}={seconds:.3f}" for name, seconds in self.phases.items()
+        )
+        return f"{type(self).__name__}(total={self.total}, {phases})"
+
+
+class CommandRecord(PhaseTimings):
+    """
+    Timings and byte counts of a command.
+
+    method is the connection method called (send_command...), command the command string (or
+    the list of configuration commands), bytes_received and chunks the amount of data and the
+    number of reads returning data, and exception the exception raised by the command (if any).
+    """
+
+    def __init__(self, method, command):
+        super().__init__()
+        self.method = method
+        self.command = command
+        self.bytes_received = 0
+        self.chunks = 0
+        self.exception = None
+
+    def add_chunk(self, data):
+        """Count data read from the channel."""
+        self.chunks += 1
+        self.bytes_received += len(data.encode("utf-8"))
+
+    def as_dict(self):
+        """Return the record as a dict."""
+        record = super().as_dict()
+        record.update(
+            method=self.method,
+            command=self.command,
+            bytes_received=self.bytes_received,
+            chunks=self.chunks,
+            exception=repr(self.exception) if self.exception is not None else None,
+        )
+        return record
+
+
+class _NullPhase(object):
+    """Context manager doing nothing, used when no timings are recorded."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_PHASE = _NullPhase()
+
+
+def connect_phase(name):
+    """
+    Decorator recording the duration of a connection method in connect_timings.
+
+    The duration is only recorded while the connection is being established (for example
+    disable_paging called by session_preparation, not when it is called later).
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            timer = getattr(self, "_connect_timer", None)
+            if timer is None:
+                return func(self, *args, **kwargs)
+            with timer.phase(name):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def command_hook(argument):
+    """
+    Decorator recording a CommandRecord for each call of a connection command method.
+
+    The command is also traced when tracing is enabled. Does nothing more than a truth test and
+    tracing.enabled() when the connection has no hooks.
+
+    :param argument: Name of the method's first argument (the command).
+    :type argument: str
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            trace = tracing.enabled()
+            if not self.hooks and not trace:
+                return func(self, *args, **kwargs)
+            command = args[0] if args else kwargs.get(argument)
+            record = CommandRecord(func.__name__, command)
+            parent = self._command_record
+            self._command_record = record
+            span = tracing.start_span(func.__name__, self) if trace else None
+            for hook in self.hooks:
+                hook.before_command(self, record)
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                record.exception = e
+                raise
+            finally:
+                record.stop()
+                if span is not None:
+                    span.attributes.update(
+                        command=record.command,
+                        bytes_received=record.bytes_received,
+                        chunks=record.chunks,
+                    )
+                    tracing.end_span(span, record, record.exception)
+                self._command_record = parent
+                if parent is not None:
+                    parent.chunks += record.chunks
+                    parent.bytes_received += record.bytes_received
+                for hook in self.hooks:
+                    hook.after_command(self, record)
+
+        return wrapper
+
+    return decorator
+
+
+class ConnectionHook(object):
+    """
+    Base class of the connection hooks, all the methods do nothing.
+
+    Subclasses override the methods for the events they are interested in. An exception raised
+    by a hook is not caught.
+    """
+
+    def on_connect(self, connection, timings):
+        """
+        Called when the connection is established (after session_preparation).
+
+        :param connection: The Netmiko connection.
+        :type connection: BaseConnection
+
+        :param timings: The connection's connect_timings.
+        :type timings: PhaseTimings
+        """
+        pass
+
+    def on_connect_error(self, connection, exception, timings):
+        """
+        Called when the connection fails (the exception is then raised to the caller).
+
+        :param connection: The Netmiko connection.
+        :type connection: BaseConnection
+
+        :param exception: The exception raised.
+        :type exception: Exception
+
+        :param timings: The phases completed before the failure.
+        :type timings: PhaseTimings
+        """
+        pass
+
+    def before_command(self, connection, record):
+        """
+        Called before a command is sent.
+
+        :param connection: The Netmiko connection.
+        :type connection: BaseConnection
+
+        :param record: The record of the command (its phases are filled in later).
+        :type record: CommandRecord
+        """
+        pass
+
+    def after_command(self, connection, record):
+        """
+        Called once the command has completed or failed (record.exception is then set).
+
+        :param connection: The Netmiko connection.
+        :type connection: BaseConnection
+
+        :param record: The record of the command.
+        :type record: CommandRecord
+        """
+        pass
+
+    def on_chunk(self, connection, data):
+        """
+        Called for each chunk of data read from the channel during a command.
+
+        :param connection: The Netmiko connection.
+        :type connection: BaseConnection
+
+        :param data: The data read.
+        :type data: str
+        """
+        pass
@@ -0,0 +1,120 @@
+"""
+Shared SSH connections to jump hosts.
+
+By default a ProxyJump entry of the ssh_config_file is handled with an `ssh -W` subprocess per
+device connection: one OpenSSH process and one jump host authentication for every device. With
+shared_jump_host=True, Netmiko instead keeps a single authenticated Paramiko transport per jump
+host and tunnels each device connection in a direct-tcpip channel of that transport.
+
+The jump host transports stay open (and are reused by the following connections) until
+jump_host_pool.close() is called or until they die, in which case they are reopened on the next
+connection.
+
+Example:
+------------------
+from netmiko import ConnectHandler
+from netmiko.jump_host import jump_host_pool
+
+for device in devices:
+    device.update(ssh_config_file="~/.ssh/config", shared_jump_host=True)
+    with ConnectHandler(**device) as net_connect:
+        print(net_connect.send_command("show version"))
+jump_host_pool.close()
+------------------
+"""
+import threading
+
+from netmiko import log
+
+
+def parse_jump_host(jump_host):
+    """
+    Split a ProxyJump entry ([user@]host[:port]) into (user, host, port).
+
+    user and port are None when they are not specified.
+    """
+    user = port = None
+    if "@" in jump_host:
+        user, jump_host = jump_host.rsplit("@", 1)
+    if jump_host.startswith("["):
+        # IPv6 address with a port: [2001:db8::1]:2222
+        host, _, port = jump_host[1:].partition("]")
+        port = port.lstrip(":") or None
+    elif jump_host.count(":") == 1:
+        host, port = jump_host.split(":")
+    else:
+        host = jump_host
+    return user, host, int(port) if port else None
+
+
+class JumpHostPool(object):
+    """Authenticated SSH connections to jump hosts, shared by the device connections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._host_locks = {}
+
+    def _host_lock(self, key):
+        with self._lock:
+            return self._host_locks.setdefault(key, threading.Lock())
+
+    def get_client(self, key, connect):
+        """
+        Return the connected SSHClient for key, calling connect() to create it if needed.
+
+        Concurrent callers with the same key wait for a single connect() call.
+
+        :param key: Identifies the jump host, for example (hostname, port, username).
+        :type key: tuple
+
+        :param connect: Function returning a new connected paramiko.SSHClient.
+        :type connect: callable
+        """
+        with self._host_lock(key):
+            client = self._clients.get(key)
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    return client
+                log.debug(f"Jump host connection to {key} is not active, reconnecting")
+                client.close()
+                del self._clients[key]
+            client = connect()
+            self._clients[key] = client
+            return client
+
+    def open_channel(self, key, connect, dest_addr, timeout=None):
+        """
+        Open a direct-tcpip channel to dest_addr through the jump host.
+
+        The channel can be used as the sock of a paramiko.SSHClient.connect() call.
+
+        :param key: Identifies the jump host, for example (hostname, port, username).
+        :type key: tuple
+
+        :param connect: Function returning a new connected paramiko.SSHClient.
+        :type connect: callable
+
+        :param dest_addr: (host, port) of the device.
+        :type dest_addr: tuple
+
+        :param timeout: Seconds to wait for the channel to be opened.
+        :type timeout: float
+        """
+        transport = self.get_client(key, connect).get_transport()
+        log.debug(f"Opening a channel to {dest_addr} through the jump host {key}")
+        return transport.open_channel(
+            "direct-tcpip", dest_addr, ("127.0.0.1", 0), timeout=timeout
+        )
+
+    def close(self):
+        """Close all the jump host connections."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+jump_host_pool = JumpHostPool()
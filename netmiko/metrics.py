@@ -0,0 +1,344 @@
+"""
+In-process metrics of Netmiko connections.
+
+A MetricsRegistry holds counters and histograms that can be rendered in the Prometheus text
+exposition format or as JSON; no external service or library is needed. The MetricsHook
+(a connection hook, see netmiko.instrumentation) updates these metrics:
+
+    netmiko_connects_total              Connections established, by device_type
+    netmiko_connect_failures_total      Connection failures, by device_type and reason
+                                        (auth, timeout or error)
+    netmiko_connect_seconds             Connection establishment duration, by device_type
+    netmiko_command_seconds             Command duration, by device_type, method and command
+    netmiko_command_failures_total      Failed commands, by device_type, method and reason
+    netmiko_bytes_received_total        Bytes read from the devices, by device_type
+
+Example:
+------------------
+from netmiko import ConnectHandler
+from netmiko.metrics import MetricsHook, REGISTRY, start_http_server
+
+start_http_server(9100)
+with ConnectHandler(**device, hooks=[MetricsHook()]) as net_connect:
+    net_connect.send_command("show version")
+print(REGISTRY.to_prometheus())
+------------------
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from netmiko.instrumentation import ConnectionHook
+from netmiko.ssh_exception import (
+    NetmikoAuthenticationException,
+    NetmikoTimeoutException,
+)
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _escape(value):
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(object):
+    """Base class of the metrics, samples are stored by label values."""
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name}: expected the labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key):
+        return list(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """A value that only goes up."""
+
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        """Increment the counter of the labels by amount."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels):
+        """Return the value of the counter of the labels."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        """Return a list of (name, labels, value), labels being a list of (name, value)."""
+        with self._lock:
+            values = sorted(self._values.items())
+        return [(self.name, self._labels(key), value) for key, value in values]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in buckets (cumulative, like Prometheus)."""
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        """Record an observation for the labels."""
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    def get(self, **labels):
+        """Return (count, sum) of the observations of the labels."""
+        with self._lock:
+            counts, total = self._values.get(self._key(labels), ([0], 0.0))
+            return counts[-1], total
+
+    def samples(self):
+        """Return a list of (name, labels, value), labels being a list of (name, value)."""
+        samples = []
+        with self._lock:
+            values = sorted((key, (list(c), t)) for key, (c, t) in self._values.items())
+        for key, (counts, total) in values:
+            labels = self._labels(key)
+            for bound, count in zip(self.buckets, counts):
+                bucket_labels = labels + [("le", _format_value(bound))]
+                samples.append((f"{self.name}_bucket", bucket_labels, count))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, counts[-1]))
+        return samples
+
+
+class MetricsRegistry(object):
+    """Collection of metrics, rendered with to_prometheus() or to_json()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, metric_class, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, *args, **kwargs)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"{name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Return the counter name (created if needed)."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Return the histogram name (created if needed)."""
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name):
+        """Return the metric name (or None)."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def metrics(self):
+        """Return the registered metrics, sorted by name."""
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def clear(self):
+        """Remove all the metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def as_dict(self):
+        """Return the metrics as a dict of metric name to type, help and samples."""
+        result = {}
+        for metric in self.metrics():
+            result[metric.name] = {
+                "type": metric.type,
+                "help": metric.documentation,
+                "samples": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for name, labels, value in metric.samples()
+                ],
+            }
+        return result
+
+    def to_json(self, **kwargs):
+        """Render the metrics as JSON (kwargs are passed to json.dumps)."""
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _failure_reason(exception):
+    if isinstance(exception, NetmikoAuthenticationException):
+        return "auth"
+    if isinstance(exception, NetmikoTimeoutException):
+        return "timeout"
+    return "error"
+
+
+class MetricsHook(ConnectionHook):
+    """
+    Connection hook updating the Netmiko metrics of a registry.
+
+    :param registry: Registry updated (default: REGISTRY).
+    :type registry: MetricsRegistry
+
+    :param command_label: Label the command metrics with the command string; disable it to
+        limit the number of series when many different commands are sent (default: True).
+    :type command_label: bool
+
+    :param buckets: Histogram buckets in seconds.
+    :type buckets: tuple
+    """
+
+    def __init__(self, registry=None, command_label=True, buckets=DEFAULT_BUCKETS):
+        self.registry = registry = REGISTRY if registry is None else registry
+        self.command_label = command_label
+        self.connects = registry.counter(
+            "netmiko_connects_total", "Connections established.", ["device_type"]
+        )
+        self.connect_failures = registry.counter(
+            "netmiko_connect_failures_total",
+            "Connection failures.",
+            ["device_type", "reason"],
+        )
+        self.connect_seconds = registry.histogram(
+            "netmiko_connect_seconds",
+            "Connection establishment duration in seconds.",
+            ["device_type"],
+            buckets,
+        )
+        self.command_seconds = registry.histogram(
+            "netmiko_command_seconds",
+            "Command duration in seconds.",
+            ["device_type", "method", "command"],
+            buckets,
+        )
+        self.command_failures = registry.counter(
+            "netmiko_command_failures_total",
+            "Failed commands.",
+            ["device_type", "method", "reason"],
+        )
+        self.bytes_received = registry.counter(
+            "netmiko_bytes_received_total",
+            "Bytes read from the devices during commands.",
+            ["device_type"],
+        )
+
+    def on_connect(self, connection, timings):
+        self.connects.inc(device_type=connection.device_type)
+        self.connect_seconds.observe(timings.total, device_type=connection.device_type)
+
+    def on_connect_error(self, connection, exception, timings):
+        self.connect_failures.inc(
+            device_type=connection.device_type, reason=_failure_reason(exception)
+        )
+
+    def after_command(self, connection, record):
+        device_type = connection.device_type
+        if self.command_label and isinstance(record.command, str):
+            command = record.command.strip()
+        else:
+            command = ""
+        self.command_seconds.observe(
+            record.total, device_type=device_type, method=record.method, command=command
+        )
+        if record.exception is not None:
+            self.command_failures.inc(
+                device_type=device_type,
+                method=record.method,
+                reason=_failure_reason(record.exception),
+            )
+        # Nested commands are already counted in the outer command
+        if connection._command_record is None:
+            self.bytes_received.inc(record.bytes_received, device_type=device_type)
+
+
+def start_http_server(port, addr="", registry=None):
+    """
+    Serve the metrics from a daemon thread: in the Prometheus text format, or as JSON for the
+    paths ending with '.json'.
+
+    Returns the HTTP server (call its shutdown() method to stop it).
+
+    :param port: TCP port to listen on (0 picks a free port, see server.server_port).
+    :type port: int
+
+    :param addr: Address to listen on (default: all the addresses).
+    :type addr: str
+
+    :param registry: Registry rendered (default: REGISTRY).
+    :type registry: MetricsRegistry
+    """
+    registry = REGISTRY if registry is None else registry
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.endswith(".json"):
+                body, content_type = registry.to_json(), "application/json"
+            else:
+                body = registry.to_prometheus()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            body = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    class MetricsServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    server = MetricsServer((addr, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
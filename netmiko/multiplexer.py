@@ -0,0 +1,255 @@
+"""
+Send the same commands to many devices from a single thread.
+
+Instead of one thread (or process) per device, the channels of all the connections are
+registered with a selector and each session advances as a small state machine: the command is
+written, its echo is awaited, then the prompt is awaited, then the next command is written. Only
+one thread is used no matter how many devices there are.
+
+The connections must already be established (for example with ConnectHandler in a thread pool).
+The driver's base_prompt, normalize_cmd, and output sanitization are used for each session.
+
+Example:
+------------------
+from netmiko.multiplexer import send_commands
+
+for result in send_commands(connections, ["show version", "show ip int brief"]):
+    if result.exception is None:
+        print(result.connection.host, result.command, result.output)
+------------------
+"""
+import re
+import selectors
+import time
+from collections import deque, namedtuple
+
+from netmiko import log
+from netmiko.ssh_exception import NetmikoTimeoutException
+
+CommandResult = namedtuple("CommandResult", "connection command output exception")
+
+
+class _Session(object):
+    """State machine sending a list of commands to one connection."""
+
+    WRITE, ECHO, PROMPT, DONE = range(4)
+
+    def __init__(
+        self,
+        connection,
+        commands,
+        expect_string=None,
+        timeout=None,
+        strip_prompt=True,
+        strip_command=True,
+        normalize=True,
+        cmd_verify=True,
+        use_textfsm=False,
+        textfsm_template=None,
+    ):
+        self.connection = connection
+        self.commands = list(commands)
+        if expect_string is None:
+            expect_string = re.escape(connection.base_prompt.strip())
+        self.search_pattern = expect_string
+        self.timeout = connection.timeout if timeout is None else timeout
+        self.strip_prompt = strip_prompt
+        self.strip_command = strip_command
+        self.normalize = normalize
+        self.cmd_verify = cmd_verify
+        self.use_textfsm = use_textfsm
+        self.textfsm_template = textfsm_template
+        self.index = 0
+        self.state = self.WRITE
+
+    @property
+    def command(self):
+        return self.commands[self.index]
+
+    def write(self):
+        """Write the current command and wait for its echo (or directly for the prompt)."""
+        # Discard any data left over from the previous command
+        self.connection.read_channel()
+        self.command_string = self.command
+        if self.normalize:
+            self.command_string = self.connection.normalize_cmd(self.command_string)
+        self.connection.write_channel(self.command_string)
+        self.output = ""
+        self.past_three_reads = deque(maxlen=3)
+        self.first_line_processed = False
+        self.deadline = time.time() + self.timeout
+        cmd = self.command_string.strip()
+        self.state = self.ECHO if cmd and self.cmd_verify else self.PROMPT
+
+    def feed(self, new_data):
+        """
+        Process data read from the channel.
+
+        Returns a CommandResult when the current command is complete (the next command is then
+        written), otherwise None.
+        """
+        if self.state == self.ECHO:
+            self.output += new_data
+            cmd = self.command_string.strip()
+            if not re.search(re.escape(cmd), self.output):
+                return None
+            # Strip off everything before the command echo (to avoid false positives on the
+            # prompt)
+            new_data = self.connection.normalize_linefeeds(self.output)
+            self.output = ""
+            if new_data.count(cmd) == 1:
+                new_data = new_data.split(cmd)[1:]
+                new_data = self.connection.RESPONSE_RETURN.join(new_data)
+                new_data = new_data.lstrip()
+                new_data = f"{cmd}{self.connection.RESPONSE_RETURN}{new_data}"
+            self.state = self.PROMPT
+
+        if not new_data:
+            return None
+        self.output += new_data
+        self.past_three_reads.append(new_data)
+        if not self.first_line_processed:
+            self.output, self.first_line_processed = self.connection._first_line_handler(
+                self.output, self.search_pattern
+            )
+            found = re.search(self.search_pattern, self.output)
+        else:
+            found = re.search(self.search_pattern, "".join(self.past_three_reads))
+        if not found:
+            return None
+
+        output = self.connection._sanitize_output(
+            self.output,
+            strip_command=self.strip_command,
+            command_string=self.command_string,
+            strip_prompt=self.strip_prompt,
+        )
+        if self.use_textfsm:
+            output = self.connection._parse_output(
+                output,
+                self.command_string,
+                use_textfsm=True,
+                textfsm_template=self.textfsm_template,
+            )
+        result = CommandResult(self.connection, self.command, output, None)
+        self.next_command()
+        return result
+
+    def next_command(self):
+        """Move to the next command (or to DONE)."""
+        self.index += 1
+        if self.index < len(self.commands):
+            self.write()
+        else:
+            self.state = self.DONE
+
+    def fail(self, exception):
+        """Abort the session, returns the CommandResult of the current command."""
+        result = CommandResult(self.connection, self.command, None, exception)
+        self.state = self.DONE
+        return result
+
+
+def send_commands(
+    connections,
+    commands,
+    expect_string=None,
+    timeout=None,
+    strip_prompt=True,
+    strip_command=True,
+    normalize=True,
+    cmd_verify=True,
+    use_textfsm=False,
+    textfsm_template=None,
+):
+    """
+    Send commands to all the connections from a single thread.
+
+    Yields a CommandResult(connection, command, output, exception) as soon as each command
+    completes. If a command fails (timeout, closed channel...) the exception is set and the
+    remaining commands for that connection are skipped.
+
+    :param connections: Established Netmiko SSH or telnet connections.
+    :type connections: list
+
+    :param commands: Commands sent (in order) to every connection.
+    :type commands: list
+
+    :param expect_string: Regular expression pattern to use for determining end of output
+        (default: the base_prompt of each connection).
+    :type expect_string: str
+
+    :param timeout: Seconds to wait for each command to complete (default: the timeout of each
+        connection).
+    :type timeout: float
+
+    :param strip_prompt: Remove the trailing router prompt from the output (default: True).
+    :type strip_prompt: bool
+
+    :param strip_command: Remove the echo of the command from the output (default: True).
+    :type strip_command: bool
+
+    :param normalize: Ensure the proper enter is sent at end of command (default: True).
+    :type normalize: bool
+
+    :param cmd_verify: Verify command echo before waiting for the prompt (default: True).
+    :type cmd_verify: bool
+
+    :param use_textfsm: Process command output through TextFSM template (default: False).
+    :type use_textfsm: bool
+
+    :param textfsm_template: Name of template to parse output with (default: None).
+    :type textfsm_template: str
+    """
+    commands = list(commands)
+    if not commands:
+        return
+    selector = selectors.DefaultSelector()
+    sessions = []
+    for connection in connections:
+        if connection.protocol not in ("ssh", "telnet"):
+            raise ValueError("send_commands only supports SSH and telnet connections")
+        session = _Session(
+            connection,
+            commands,
+            expect_string=expect_string,
+            timeout=timeout,
+            strip_prompt=strip_prompt,
+            strip_command=strip_command,
+            normalize=normalize,
+            cmd_verify=cmd_verify,
+            use_textfsm=use_textfsm,
+            textfsm_template=textfsm_template,
+        )
+        session.write()
+        selector.register(
+            connection.remote_conn.fileno(), selectors.EVENT_READ, session
+        )
+        sessions.append(session)
+
+    try:
+        while sessions:
+            now = time.time()
+            select_timeout = max(0, min(s.deadline for s in sessions) - now)
+            for key, _ in selector.select(select_timeout):
+                session = key.data
+                try:
+                    new_data = session.connection.read_channel()
+                    result = session.feed(new_data)
+                except Exception as e:
+                    log.debug(f"send_commands: {session.connection.host} failed: {e}")
+                    result = session.fail(e)
+                if result is not None:
+                    yield result
+
+            now = time.time()
+            for session in sessions:
+                if session.state != session.DONE and session.deadline < now:
+                    msg = f"Search pattern never detected: {session.search_pattern}"
+                    yield session.fail(NetmikoTimeoutException(msg))
+
+            for session in [s for s in sessions if s.state == s.DONE]:
+                selector.unregister(session.connection.remote_conn.fileno())
+                sessions.remove(session)
+    finally:
+        selector.close()
@@ -0,0 +1,133 @@
+"""
+Offload TextFSM/Genie parsing to a pool of worker processes.
+
+TextFSM and Genie parsing is CPU bound and holds the GIL; in threaded collectors this stalls the
+threads that are reading from SSH channels. A ParsePool moves the parsing into separate processes.
+
+Example:
+------------------
+from netmiko import ConnectHandler
+from netmiko.parse_pool import ParsePool
+
+pool = ParsePool(max_workers=4, warm_commands=[("cisco_ios", "show ip int brief")])
+net_connect = ConnectHandler(**device, parse_pool=pool)
+output = net_connect.send_command("show ip int brief", use_textfsm=True)
+------------------
+
+With ParsePool(blocking=False), send_command(use_textfsm=True/use_genie=True) returns a
+concurrent.futures.Future of the parsed output instead of blocking until parsing is complete.
+
+A single ParsePool can (and generally should) be shared by all of the connections in a process.
+"""
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from netmiko import log
+from netmiko.utilities import (
+    structured_data_converter,
+    get_textfsm_templates,
+    _load_genie,
+    _genie_os,
+    _genie_parser,
+)
+
+
+def _warm_worker(warm_commands, warm_genie):
+    """Worker process initializer: load the TextFSM index and Genie parsers up front."""
+    for platform, command in warm_commands:
+        try:
+            # Parses (and caches at the class-level) the ntc-templates index
+            get_textfsm_templates(platform=platform, command=command)
+        except Exception:
+            log.debug(f"Unable to pre-load TextFSM template: {platform} {command}")
+        if warm_genie and _load_genie() is not None:
+            genie_os = _genie_os(platform)
+            if genie_os is not None:
+                _genie_parser(genie_os, command)
+
+
+class ParsePool(object):
+    """
+    Process pool for structured parsing shared by Netmiko connections.
+
+    :param max_workers: Number of worker processes (default: number of CPUs).
+    :type max_workers: int
+
+    :param blocking: If True (the default), send_command waits for the parsed result. If False,
+        send_command returns a concurrent.futures.Future.
+    :type blocking: bool
+
+    :param warm_commands: (platform, command) tuples whose templates/parsers are pre-loaded in
+        every worker when it starts (requires Python 3.7, ignored with a warning on 3.6).
+    :type warm_commands: list
+
+    :param warm_genie: Import Genie and pre-load the Genie parsers for warm_commands in the
+        workers (default: False).
+    :type warm_genie: bool
+
+    :param mp_context: multiprocessing context passed to ProcessPoolExecutor (requires Python
+        3.7).
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        blocking=True,
+        warm_commands=None,
+        warm_genie=False,
+        mp_context=None,
+    ):
+        self.blocking = blocking
+        self.warm_commands = list(warm_commands or [])
+        self.warm_genie = warm_genie
+        pool_kwargs = {"max_workers": max_workers}
+        # ProcessPoolExecutor initializer and mp_context require Python 3.7
+        if sys.version_info >= (3, 7):
+            pool_kwargs.update(
+                mp_context=mp_context,
+                initializer=_warm_worker,
+                initargs=(self.warm_commands, self.warm_genie),
+            )
+        elif self.warm_commands or self.warm_genie or mp_context is not None:
+            log.warning(
+                "ParsePool: warm_commands, warm_genie and mp_context require Python 3.7, "
+                "they are ignored"
+            )
+        self.executor = ProcessPoolExecutor(**pool_kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def submit(
+        self,
+        raw_output,
+        platform,
+        command,
+        use_textfsm=False,
+        textfsm_template=None,
+        use_genie=False,
+    ):
+        """Submit raw_output for parsing. Returns a concurrent.futures.Future."""
+        return self.executor.submit(
+            structured_data_converter,
+            raw_output,
+            platform,
+            command,
+            use_textfsm=use_textfsm,
+            textfsm_template=textfsm_template,
+            use_genie=use_genie,
+        )
+
+    def parse(self, *args, **kwargs):
+        """Parse in the pool. Returns a Future unless the pool is blocking."""
+        future = self.submit(*args, **kwargs)
+        if self.blocking:
+            return future.result()
+        return future
+
+    def shutdown(self, wait=True):
+        """Shutdown the worker processes."""
+        self.executor.shutdown(wait=wait)
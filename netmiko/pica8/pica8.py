@@ -239,6 +239,14 @@ class pica8Base(BaseConnection):
         :param cmd_verify: Verify command echo before proceeding (default: False).
         :type cmd_verify: bool
         """
+        if self.use_exec:
+            return self.send_command_exec(
+                command_string,
+                use_textfsm=use_textfsm,
+                textfsm_template=textfsm_template,
+                use_genie=use_genie,
+            )
+
         # Time to delay in each read loop
         loop_delay = 0.2
 
@@ -326,24 +334,14 @@ class pica8Base(BaseConnection):
             strip_prompt=strip_prompt,
         )
 
-        # If both TextFSM and Genie are set, try TextFSM then Genie
-        if use_textfsm:
-            structured_output = get_structured_data(
+        if use_textfsm or use_genie:
+            return self._parse_output(
                 output,
-                platform=self.device_type,
-                command=command_string.strip(),
-                template=textfsm_template,
-            )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
-        if use_genie:
-            structured_output = get_structured_data_genie(
-                output, platform=self.device_type, command=command_string.strip()
+                command_string,
+                use_textfsm=use_textfsm,
+                textfsm_template=textfsm_template,
+                use_genie=use_genie,
             )
-            # If we have structured data; return it.
-            if not isinstance(structured_output, str):
-                return structured_output
         return output
 
     def send_config_set(
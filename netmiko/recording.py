@@ -0,0 +1,438 @@
+"""
+Timestamped recording of the channel data, and replay of the recordings.
+
+Unlike the session_log, a recording keeps the raw bytes of each channel read and write with the
+time (monotonic, relative to the start of the recording) it happened, so a slow or broken
+session can be reproduced. Pass session_recording (a file path or a SessionRecorder) to the
+connection:
+
+------------------
+from netmiko import ConnectHandler
+
+with ConnectHandler(**device, session_recording="router1.nmrec") as net_connect:
+    net_connect.send_command("show version")
+------------------
+
+ReplayConnectHandler then runs the driver against the recording instead of a device, at the
+recorded speed (speed=1), faster (speed=10) or without any delay (speed=None):
+
+------------------
+from netmiko.recording import ReplayConnectHandler
+
+net_connect = ReplayConnectHandler("router1.nmrec", speed=None)
+print(net_connect.send_command("show version"))
+net_connect.disconnect()
+------------------
+
+The device's responses are released in the recorded order and timing, relative to the last
+command written: a response recorded after a write is only available once the driver has
+written that command.
+
+File format (integers are big-endian): the MAGIC bytes, the length (uint32) of a JSON header
+(device_type, host, port, start_time), the header, then a record per read or write: the
+direction (b"r" or b"w"), the timestamp in seconds (float64), the length of the data (uint32)
+and the data. The password and secret are masked in the data written.
+"""
+import json
+import socket
+import struct
+import threading
+import time
+from collections import namedtuple
+
+from netmiko.session_log import SECRET_MASK, secrets_pattern
+from netmiko.ssh_dispatcher import ssh_dispatcher
+
+MAGIC = b"NMREC\x01"
+READ = b"r"
+WRITE = b"w"
+
+# A read taking longer than this (in seconds) waited for the data
+BLOCKED_READ = 0.002
+
+_LENGTH = struct.Struct(">I")
+_RECORD = struct.Struct(">cdI")
+
+RecordedEvent = namedtuple("RecordedEvent", "direction timestamp data")
+
+
+class SessionRecorder(object):
+    """
+    Writer of a session recording.
+
+    :param file_name: File the recording is written to.
+    :type file_name: str
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self._file = None
+        self._start = None
+        self._mask = None
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def start(self, secrets=(), **header):
+        """
+        Open the file and write the header (does nothing if already started).
+
+        :param secrets: Strings masked in the data written (password, secret).
+        :type secrets: list
+
+        :param header: Metadata of the recording (device_type, host, port).
+        """
+        with self._lock:
+            if self._file is not None:
+                return
+            self._mask = secrets_pattern([s.encode("utf-8") for s in secrets if s])
+            header["start_time"] = time.time()
+            header = json.dumps(header).encode("utf-8")
+            self._file = open(self.file_name, "wb")
+            self._file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+            self._start = time.monotonic()
+
+    def record(self, direction, data, timestamp=None):
+        """
+        Record data read (READ) from or written (WRITE) to the channel.
+
+        :param timestamp: time.monotonic() of the event (default: now); it is never before the
+            previous event.
+        :type timestamp: float
+        """
+        if not data:
+            return
+        if direction == WRITE and self._mask is not None:
+            data = self._mask.sub(SECRET_MASK.encode("utf-8"), data)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            if self._file is not None:
+                self._last = max(self._last, timestamp - self._start)
+                record = _RECORD.pack(direction, self._last, len(data))
+                self._file.write(record + data)
+
+    def close(self):
+        """Close the recording."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingChannel(object):
+    """
+    Proxy of a Paramiko channel, telnetlib.Telnet or serial.Serial recording the data.
+
+    The data found by polling (recv_ready, read_very_eager) arrived after the last poll which
+    found nothing (or the last write), not when it is read: it is recorded at the time of that
+    poll, so the replay makes it available when the driver polls again, as it was. The data
+    returned by a recv() which blocked is recorded when it returns.
+    """
+
+    def __init__(self, channel, recorder):
+        self._channel = channel
+        self._recorder = recorder
+        self._idle = None
+
+    def __getattr__(self, name):
+        return getattr(self._channel, name)
+
+    def _record_read(self, data, start):
+        now = time.monotonic()
+        if not data:
+            self._idle = now
+            return
+        # Blocked in the read: the data has just arrived
+        blocked = now - start > BLOCKED_READ
+        self._recorder.record(READ, data, None if blocked else self._idle)
+        self._idle = None
+
+    def recv_ready(self):
+        ready = self._channel.recv_ready()
+        if not ready:
+            self._idle = time.monotonic()
+        return ready
+
+    def recv(self, nbytes):
+        start = time.monotonic()
+        data = self._channel.recv(nbytes)
+        self._record_read(data, start)
+        return data
+
+    def _record_write(self, data):
+        self._recorder.record(WRITE, data)
+        # The response arrives after the write
+        self._idle = time.monotonic()
+
+    def send(self, data):
+        sent = self._channel.send(data)
+        self._record_write(data[:sent])
+        return sent
+
+    def sendall(self, data):
+        self._channel.sendall(data)
+        self._record_write(data)
+
+    def read_very_eager(self):
+        start = time.monotonic()
+        data = self._channel.read_very_eager()
+        self._record_read(data, start)
+        return data
+
+    def read(self, size=1):
+        start = time.monotonic()
+        data = self._channel.read(size)
+        self._record_read(data, start)
+        return data
+
+    def write(self, data):
+        result = self._channel.write(data)
+        self._record_write(data)
+        return result
+
+
+class Recording(object):
+    """
+    A session recording: header is a dict (device_type, host, port, start_time) and events a
+    list of RecordedEvent (direction, timestamp, data).
+    """
+
+    def __init__(self, header, events):
+        self.header = header
+        self.events = events
+
+    @classmethod
+    def load(cls, file_name):
+        """Read a recording file."""
+        with open(file_name, "rb") as f:
+            content = f.read()
+        if not content.startswith(MAGIC):
+            raise ValueError(f"{file_name} is not a Netmiko session recording")
+        offset = len(MAGIC)
+        (length,) = _LENGTH.unpack_from(content, offset)
+        offset += _LENGTH.size
+        end = offset + length
+        header = json.loads(content[offset:end].decode("utf-8"))
+        offset = end
+        events = []
+        # A truncated last record (recording interrupted) is ignored
+        while offset + _RECORD.size <= len(content):
+            direction, timestamp, length = _RECORD.unpack_from(content, offset)
+            offset += _RECORD.size
+            end = offset + length
+            data = content[offset:end]
+            if len(data) < length:
+                break
+            offset = end
+            events.append(RecordedEvent(direction, timestamp, data))
+        return cls(header, events)
+
+    @property
+    def duration(self):
+        """Seconds between the start of the recording and the last event."""
+        return self.events[-1].timestamp if self.events else 0.0
+
+
+class ReplayChannel(object):
+    """
+    Channel replaying the reads of a recording (Paramiko channel and telnetlib.Telnet API).
+
+    The reads recorded after a write are released once that write is done, with the recorded
+    delays divided by speed.
+
+    :param recording: The recording.
+    :type recording: Recording
+
+    :param speed: Replay speed factor, None for no delays (default: 1, the recorded speed).
+    :type speed: float
+
+    :param strict: Raise ValueError when the data written differs from the recording
+        (default: False).
+    :type strict: bool
+
+    :param secrets: Strings masked in the recording (password, secret), for the strict check.
+    :type secrets: list
+    """
+
+    def __init__(self, recording, speed=1.0, strict=False, secrets=()):
+        self.events = recording.events
+        self.speed = speed
+        self.strict = strict
+        self.closed = False
+        self._mask = secrets_pattern([s.encode("utf-8") for s in secrets if s])
+        self._position = 0
+        self._buffer = bytearray()
+        self._timeout = None
+        self._cond = threading.Condition()
+        # Wall clock (monotonic) time of the recorded timestamp, reset by each write
+        self._anchor = (time.monotonic(), 0.0)
+
+    @property
+    def transport(self):
+        return self
+
+    def is_active(self):
+        return not self.closed
+
+    def settimeout(self, timeout):
+        self._timeout = timeout
+
+    def gettimeout(self):
+        return self._timeout
+
+    def close(self):
+        self.closed = True
+
+    def _release(self):
+        """
+        Move the reads that are due to the buffer; return the seconds until the next read is due
+        (None if the next event is a write, or if the recording is over).
+        """
+        wall, recorded = self._anchor
+        now = time.monotonic()
+        while self._position < len(self.events):
+            event = self.events[self._position]
+            if event.direction != READ:
+                return None
+            if self.speed:
+                due = wall + (event.timestamp - recorded) / self.speed
+                if due > now:
+                    return due - now
+            self._buffer += event.data
+            self._position += 1
+        return None
+
+    def _finished(self):
+        return self._position >= len(self.events) and not self._buffer
+
+    def recv_ready(self):
+        with self._cond:
+            self._release()
+            return len(self._buffer) > 0
+
+    def recv(self, nbytes):
+        with self._cond:
+            deadline = None
+            if self._timeout is not None:
+                deadline = time.monotonic() + self._timeout
+            while True:
+                delay = self._release()
+                if self._buffer:
+                    data = bytes(self._buffer[:nbytes])
+                    del self._buffer[:nbytes]
+                    return data
+                if self._finished() or self.closed:
+                    return b""
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise socket.timeout("Replay: no data before the next write")
+                    delay = remaining if delay is None else min(delay, remaining)
+                self._cond.wait(delay)
+
+    def sendall(self, data):
+        with self._cond:
+            if self._mask is not None:
+                data = self._mask.sub(SECRET_MASK.encode("utf-8"), data)
+            events = self.events
+            position = self._position
+            while position < len(events) and events[position].direction != WRITE:
+                position += 1
+            if position == len(events):
+                if self.strict:
+                    raise ValueError(f"Replay: unexpected write {data!r}")
+                return
+            event = events[position]
+            if self.strict and event.data != data:
+                raise ValueError(f"Replay: wrote {data!r} instead of {event.data!r}")
+            # The reads recorded before this write are available right away
+            start = self._position
+            for read in events[start:position]:
+                self._buffer += read.data
+            self._position = position + 1
+            self._anchor = (time.monotonic(), event.timestamp)
+            self._cond.notify_all()
+
+    def send(self, data):
+        self.sendall(data)
+        return len(data)
+
+    def read_very_eager(self):
+        with self._cond:
+            self._release()
+            if not self._buffer and self._finished():
+                raise EOFError("Replay: end of the recording")
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            return data
+
+    def write(self, data):
+        self.sendall(data)
+
+
+class ReplayConnectionMixin(object):
+    """
+    Connection mixin establishing the connection on a ReplayChannel.
+
+    A recording only holds the interactive session: the exec channels (use_exec,
+    send_command_exec) and the additional channels (open_channel) are not supported.
+    """
+
+    def __init__(self, replay_channel, **kwargs):
+        if kwargs.get("use_exec"):
+            raise ValueError("use_exec is not supported when replaying a recording")
+        self.replay_channel = replay_channel
+        super().__init__(**kwargs)
+
+    def send_command_exec(self, *args, **kwargs):
+        raise ValueError(
+            "send_command_exec() is not supported when replaying a recording"
+        )
+
+    def open_channel(self, *args, **kwargs):
+        raise ValueError("open_channel() is not supported when replaying a recording")
+
+    def establish_connection(self, width=None, height=None):
+        """Use the replay channel instead of connecting to the device."""
+        self.remote_conn_pre = self.remote_conn = self.replay_channel
+        if self.protocol == "telnet":
+            with self._connect_phase("telnet_login"):
+                self.telnet_login()
+        elif self.protocol == "ssh":
+            self.remote_conn.settimeout(self.blocking_timeout)
+            with self._connect_phase("special_login_handler"):
+                self.special_login_handler()
+        else:
+            raise ValueError(f"Replay is not supported for {self.protocol} connections")
+
+
+def ReplayConnectHandler(recording, speed=1.0, strict=False, **kwargs):
+    """
+    Create a connection of the driver class of the recording's device_type, running against the
+    recording.
+
+    :param recording: The recording (or its file name).
+    :type recording: Recording or str
+
+    :param speed: Replay speed factor, None for no delays (default: 1, the recorded speed).
+    :type speed: float
+
+    :param strict: Raise ValueError when the data written differs from the recording
+        (default: False).
+    :type strict: bool
+
+    :param kwargs: Arguments of the connection (device_type and host default to the recording's).
+    """
+    if isinstance(recording, str):
+        recording = Recording.load(recording)
+    kwargs.setdefault("device_type", recording.header.get("device_type"))
+    kwargs.setdefault("host", recording.header.get("host") or "replay")
+    ConnectionClass = ssh_dispatcher(kwargs["device_type"])
+    ReplayClass = type(
+        f"Replay{ConnectionClass.__name__}",
+        (ReplayConnectionMixin, ConnectionClass),
+        {},
+    )
+    secrets = (kwargs.get("password"), kwargs.get("secret"))
+    replay_channel = ReplayChannel(recording, speed, strict, secrets)
+    return ReplayClass(replay_channel=replay_channel, **kwargs)
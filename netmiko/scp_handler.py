@@ -14,6 +14,8 @@ import hashlib
 import scp
 import platform
 
+from netmiko import tracing
+
 
 class SCPConn(object):
     """
@@ -332,10 +334,19 @@ class BaseFileTransfer(object):
 
     def transfer_file(self):
         """SCP transfer file."""
-        if self.direction == "put":
-            self.put_file()
-        elif self.direction == "get":
-            self.get_file()
+        with tracing.span(
+            "file_transfer",
+            self.ssh_ctl_chan,
+            direction=self.direction,
+            source_file=self.source_file,
+            dest_file=self.dest_file,
+            file_system=self.file_system,
+            file_size=getattr(self, "file_size", None),
+        ):
+            if self.direction == "put":
+                self.put_file()
+            elif self.direction == "get":
+                self.get_file()
 
     def get_file(self):
         """SCP copy the file from the remote device to local system."""
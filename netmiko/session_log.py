@@ -0,0 +1,303 @@
+"""
+Background writer of the Netmiko session logs.
+
+The channel reads (and writes) are queued and a thread per session log writes them in batches:
+the password and secret are masked, the linefeeds normalized and the data encoded once per
+batch, and the file is flushed every flush_interval seconds rather than on every write. The
+queue is bounded, so a slow disk throttles the session instead of using unbounded memory.
+
+The session_log argument of the connection can still be a file path (opened according to
+session_log_file_mode) or a BufferedIOBase object; pass a SessionLog to compress or rotate the
+log:
+
+------------------
+from netmiko import ConnectHandler
+from netmiko.session_log import SessionLog
+
+session_log = SessionLog("router1.log.gz", compression="gzip", max_bytes=10 * 1024 * 1024)
+with ConnectHandler(**device, session_log=session_log) as net_connect:
+    net_connect.send_command("show tech-support")
+------------------
+
+The session log is flushed and closed when the connection is disconnected (a BufferedIOBase
+object is flushed, but left open).
+"""
+import atexit
+import gzip
+import os
+import queue
+import re
+import threading
+import time
+import weakref
+
+from netmiko import log
+from netmiko.utilities import write_bytes
+
+SECRET_MASK = "********"
+COMPRESSIONS = (None, "gzip", "zstd")
+
+_CLOSE = object()
+_open_session_logs = weakref.WeakSet()
+
+
+def secrets_pattern(secrets):
+    """
+    Return a compiled pattern matching any of the secrets (None if there is no secret).
+
+    :param secrets: Strings (or bytes) to mask (the empty ones and None are ignored).
+    :type secrets: list
+    """
+    secrets = sorted({s for s in secrets if s}, key=len, reverse=True)
+    if not secrets:
+        return None
+    separator = b"|" if isinstance(secrets[0], bytes) else "|"
+    return re.compile(separator.join(re.escape(s) for s in secrets))
+
+
+class SessionLog(object):
+    """
+    Session log written by a background thread.
+
+    :param file_name: File the session log is written to.
+    :type file_name: str
+
+    :param buffered_io: BufferedIOBase object the session log is written to instead (it is not
+        closed by Netmiko).
+    :type buffered_io: io.BufferedIOBase
+
+    :param file_mode: "write" or "append" (default: "write").
+    :type file_mode: str
+
+    :param compression: None, "gzip" or "zstd" (requires the zstandard package) to compress the
+        file (default: None).
+    :type compression: str
+
+    :param max_bytes: Rotate the file once this many bytes of log (before compression) have been
+        written to it; the previous files are renamed file_name.1, file_name.2... (default: None,
+        no rotation).
+    :type max_bytes: int
+
+    :param backup_count: Number of rotated files kept (default: 5).
+    :type backup_count: int
+
+    :param queue_size: Maximum number of writes waiting in the queue (default: 1000).
+    :type queue_size: int
+
+    :param flush_interval: Maximum seconds between a write and the file flush (default: 1).
+    :type flush_interval: float
+    """
+
+    def __init__(
+        self,
+        file_name=None,
+        buffered_io=None,
+        file_mode="write",
+        compression=None,
+        max_bytes=None,
+        backup_count=5,
+        queue_size=1000,
+        flush_interval=1.0,
+    ):
+        if (file_name is None) == (buffered_io is None):
+            raise ValueError("Either file_name or buffered_io must be set")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Invalid compression: {compression}")
+        if buffered_io is not None and (compression or max_bytes):
+            raise ValueError("compression and max_bytes require a file_name")
+        self.file_name = file_name
+        self.buffered_io = buffered_io
+        self.file_mode = file_mode
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.encoding = "utf-8"
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._mask = None
+        self._normalize = None
+        self._file = None
+        self._raw_file = None
+        self._size = 0
+        self._thread = None
+
+    @property
+    def name(self):
+        """Name of the file the session log is written to (None for a BufferedIOBase)."""
+        return self.file_name
+
+    @property
+    def closed(self):
+        """True until start() is called, and once the session log is closed."""
+        return self._thread is None
+
+    def start(self, secrets=(), normalize=None, encoding="utf-8"):
+        """
+        Open the file and start the writer thread.
+
+        :param secrets: Strings replaced by SECRET_MASK in the log (password, secret).
+        :type secrets: list
+
+        :param normalize: Called with the data to normalize its linefeeds.
+        :type normalize: callable
+
+        :param encoding: Encoding of the data written to a BufferedIOBase object (the files are
+            always written in UTF-8).
+        :type encoding: str
+        """
+        if self._thread is not None:
+            return
+        self._mask = secrets_pattern(secrets)
+        self._normalize = normalize
+        if self.buffered_io is not None:
+            self.encoding = encoding
+            self._file = self.buffered_io
+        else:
+            mode = "ab" if self.file_mode == "append" else "wb"
+            self._open_file(mode)
+        self._thread = threading.Thread(
+            target=self._run, name=f"netmiko-session-log-{self.file_name or id(self)}"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        _open_session_logs.add(self)
+
+    def write(self, data):
+        """Queue data to be written (blocks while the queue is full)."""
+        if self._thread is None:
+            raise ValueError("The session log is not started")
+        if isinstance(data, bytes):
+            data = data.decode(self.encoding, "ignore")
+        self._queue.put(data)
+
+    def flush(self):
+        """Wait until the queued data is written and flushed to the file."""
+        if self._thread is None:
+            return
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait()
+
+    def close(self):
+        """Write the queued data, stop the thread and close the file (if it was opened here)."""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        _open_session_logs.discard(self)
+        self._queue.put(_CLOSE)
+        thread.join()
+        if self.buffered_io is None:
+            self._close_file()
+
+    def _run(self):
+        last_flush = time.monotonic()
+        pending = False
+        while True:
+            # Block until there is data, or until the pending data is due to be flushed
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            # Write everything queued in one batch; the markers (flush events and _CLOSE)
+            # force a flush
+            batch, markers = [], []
+            while item is not None:
+                if item is _CLOSE or isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            now = time.monotonic()
+            try:
+                if batch:
+                    pending = True
+                    self._write_batch(batch)
+                if pending and (markers or now - last_flush >= self.flush_interval):
+                    last_flush, pending = now, False
+                    self._flush_file()
+            except Exception as e:
+                # Keep draining the queue, write() and flush() would block forever
+                log.error(f"Unable to write the session log {self.file_name}: {e}")
+            for marker in markers:
+                if marker is not _CLOSE:
+                    marker.set()
+            if _CLOSE in markers:
+                return
+
+    def _write_batch(self, batch):
+        data = "".join(batch)
+        if self._mask is not None:
+            data = self._mask.sub(SECRET_MASK, data)
+        if self._normalize is not None:
+            data = self._normalize(data)
+        try:
+            if self.buffered_io is not None:
+                self._file.write(write_bytes(data, encoding=self.encoding))
+                return
+            encoded = data.encode(self.encoding)
+            size = self._size + len(encoded)
+            if self.max_bytes and self._size and size > self.max_bytes:
+                self._rotate()
+            self._file.write(encoded)
+            self._size += len(encoded)
+        except (IOError, ValueError) as e:
+            log.error(f"Unable to write the session log {self.file_name}: {e}")
+
+    def _flush_file(self):
+        try:
+            self._file.flush()
+        except (IOError, ValueError) as e:
+            log.error(f"Unable to flush the session log {self.file_name}: {e}")
+
+    def _open_file(self, mode):
+        self._raw_file = open(self.file_name, mode)
+        if self.compression == "gzip":
+            self._file = gzip.GzipFile(fileobj=self._raw_file, mode=mode)
+        elif self.compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                self._raw_file.close()
+                raise ImportError("zstd compression requires the zstandard package")
+            self._file = zstandard.ZstdCompressor().stream_writer(
+                self._raw_file, closefd=False
+            )
+        else:
+            self._file = self._raw_file
+        if mode == "ab" and self.compression is None:
+            self._size = self._raw_file.tell()
+        else:
+            self._size = 0
+
+    def _close_file(self):
+        try:
+            if self._file is not self._raw_file:
+                self._file.close()
+            self._raw_file.close()
+        except (IOError, ValueError) as e:
+            log.error(f"Unable to close the session log {self.file_name}: {e}")
+
+    def _rotate(self):
+        self._close_file()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.file_name}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.file_name}.{i + 1}")
+            os.replace(self.file_name, f"{self.file_name}.1")
+        self._open_file("wb")
+
+
+def _close_all():
+    """Write the pending session logs at exit."""
+    for session_log in list(_open_session_logs):
+        session_log.close()
+
+
+atexit.register(_close_all)
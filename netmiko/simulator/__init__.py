@@ -0,0 +1,30 @@
+"""
+Offline simulator of network devices, to test and benchmark the Netmiko drivers.
+
+A DeviceSimulator is a local SSH server (Paramiko) emulating the CLI of a platform: prompts,
+paging ('--More--'), configuration mode, command echo, line wrapping with backspaces and ANSI
+codes, driven by a fixture per platform (see netmiko.simulator.platforms) mapping the commands
+to their output. The latency, jitter and throughput of the link can be set, so the drivers can
+be benchmarked under realistic conditions without any real device:
+
+------------------
+import time
+from netmiko import ConnectHandler
+from netmiko.simulator import DeviceSimulator
+
+with DeviceSimulator("juniper_junos", latency=0.05, jitter=0.01, throughput=64000) as sim:
+    start = time.monotonic()
+    with ConnectHandler(**sim.device()) as net_connect:
+        net_connect.send_command("show version")
+    print(f"{time.monotonic() - start:.2f}s")
+------------------
+
+A simulator can also be run from the command line (for example for a CI job):
+
+    python -m netmiko.simulator cisco_ios --port 2222 --latency 0.05
+"""
+from netmiko.simulator.cli import SimulatedCLI, get_platform
+from netmiko.simulator.platforms import PLATFORMS
+from netmiko.simulator.server import DeviceSimulator, ShapedLink
+
+__all__ = ("DeviceSimulator", "PLATFORMS", "ShapedLink", "SimulatedCLI", "get_platform")
@@ -0,0 +1,51 @@
+"""Run a device simulator: python -m netmiko.simulator <platform> [options]."""
+import argparse
+import time
+
+from netmiko.simulator.platforms import PLATFORMS
+from netmiko.simulator.server import DeviceSimulator
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m netmiko.simulator", description="Simulated network device (SSH)"
+    )
+    parser.add_argument("platform", choices=sorted(PLATFORMS))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--hostname", default="router1")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--throughput", type=float, help="bytes per second")
+    parser.add_argument("--seed", type=int)
+    options = parser.parse_args(args)
+
+    simulator = DeviceSimulator(
+        options.platform,
+        hostname=options.hostname,
+        username=options.username,
+        password=options.password,
+        latency=options.latency,
+        jitter=options.jitter,
+        throughput=options.throughput,
+        seed=options.seed,
+        host=options.host,
+        port=options.port,
+    )
+    port = simulator.start()
+    print(
+        f"{options.platform} simulator listening on {options.host}:{port}", flush=True
+    )
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
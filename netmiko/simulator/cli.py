@@ -0,0 +1,248 @@
+"""CLI state machine of the simulated devices (no I/O: keystrokes in, bytes out)."""
+import re
+
+from netmiko.simulator.platforms import DEFAULTS, PLATFORMS
+
+CRLF = "\r\n"
+
+# ANSI escape codes, ignored to compute the position of the cursor
+_ANSI = re.compile(r"\x1b(\[[0-9;?]*[A-Za-z]|[A-Za-z])")
+
+# States of the CLI
+LINE = "line"
+MORE = "more"
+ANY_KEY = "any_key"
+CONFIRM = "confirm"
+
+
+def get_platform(platform):
+    """
+    Return the fixture of a platform, completed with the DEFAULTS.
+
+    :param platform: Name of the platform (a key of PLATFORMS) or its fixture.
+    :type platform: str or dict
+    """
+    if isinstance(platform, str):
+        try:
+            platform = PLATFORMS[platform]
+        except KeyError:
+            raise ValueError(f"Unsupported simulator platform: {platform}")
+    fixture = dict(DEFAULTS)
+    fixture.update(platform)
+    return fixture
+
+
+class SimulatedCLI(object):
+    """
+    CLI of a simulated device: feed() takes the keystrokes received and returns the bytes to
+    send back (the echo, the output of the commands and the prompts).
+
+    :param platform: Name of the platform (a key of PLATFORMS) or its fixture.
+    :type platform: str or dict
+
+    :param hostname: Hostname in the prompt (default: 'router1').
+    :type hostname: str
+
+    :param username: Username in the prompt, for the platforms showing it (default: 'admin').
+    :type username: str
+
+    :param commands: Output of additional commands, or replacing the platform's ones.
+    :type commands: dict
+
+    :param width: Terminal width, the echo of longer lines is wrapped (default: 80).
+    :type width: int
+    """
+
+    def __init__(
+        self, platform, hostname="router1", username="admin", commands=None, width=80
+    ):
+        self.platform = get_platform(platform)
+        self.hostname = hostname
+        self.username = username
+        self.commands = dict(self.platform["commands"])
+        self.commands.update(commands or {})
+        self.width = width
+        self.paging = self.platform["more"] is not None
+        # None in exec mode, else the name of the configuration mode ('config', 'config-if')
+        self.mode = None
+        self.closed = False
+        self.state = ANY_KEY if self.platform["any_key"] else LINE
+        self._line = ""
+        self._column = 0
+        self._pending = []
+        self._skip_lf = False
+
+    def prompt(self):
+        """Return the current prompt."""
+        if self.mode is None:
+            template = self.platform["prompt"]
+        else:
+            template = self.platform["config_prompt"]
+        prompt = template.format(
+            hostname=self.hostname, username=self.username, mode=self.mode
+        )
+        return prompt.replace("\n", CRLF)
+
+    def start(self):
+        """Return the bytes sent when the session starts (banner and prompt)."""
+        output = self.platform["banner"].replace("\n", CRLF)
+        if self.state == LINE:
+            output += self.prompt()
+            self._column = self._prompt_length()
+        return output.encode("utf-8")
+
+    def feed(self, data):
+        """
+        Process the keystrokes received, return the bytes to send back.
+
+        :param data: Data received from the client.
+        :type data: bytes
+        """
+        output = []
+        for char in data.decode("utf-8", "ignore"):
+            if self.closed:
+                break
+            # '\r\n' is a single key press
+            if self._skip_lf and char == "\n":
+                self._skip_lf = False
+                continue
+            self._skip_lf = char == "\r"
+            if self.state == LINE:
+                output.append(self._line_key(char))
+            elif self.state == MORE:
+                output.append(self._more_key(char))
+            elif self.state == ANY_KEY:
+                self.state = LINE
+                output.append(CRLF + self.prompt())
+                self._column = self._prompt_length()
+            else:
+                output.append(self._confirm_key(char))
+        return "".join(output).encode("utf-8")
+
+    def run(self, command):
+        """
+        Return the output of a command, without the prompt nor the paging (exec channel).
+
+        :param command: The command.
+        :type command: str
+        """
+        output = self._exec_command(" ".join(command.split()))
+        return output.replace("\n", CRLF)
+
+    def _prompt_length(self):
+        return len(_ANSI.sub("", self.prompt()).split(CRLF)[-1])
+
+    def _line_key(self, char):
+        if char in "\r\n":
+            line, self._line = self._line, ""
+            return CRLF + self._execute(" ".join(line.split()))
+        if char in "\x08\x7f":
+            if not self._line:
+                return ""
+            self._line = self._line[:-1]
+            self._column -= 1
+            return "\x08 \x08"
+        if char == "\x03":
+            self._line = ""
+            return "^C" + CRLF + self._prompt_output("")
+        if char < " ":
+            return ""
+        self._line += char
+        self._column += 1
+        wrap = self.platform["wrap"]
+        if wrap is not None and self._column >= self.width:
+            self._column = 0
+            return char + wrap
+        return char
+
+    def _execute(self, command):
+        if not command:
+            return self._prompt_output("")
+        if self.mode is None:
+            output = self._exec_command(command)
+        else:
+            output = self._config_command(command)
+        if self.closed or self.state != LINE:
+            return output
+        return self._prompt_output(output)
+
+    def _exec_command(self, command):
+        platform = self.platform
+        if command in platform["logout"]:
+            if platform["logout_confirm"]:
+                self.state = CONFIRM
+                return platform["logout_confirm"]
+            self.closed = True
+            return ""
+        if command in platform["enter_config"]:
+            self.mode = "config"
+            return platform["enter_config"][command]
+        if command in platform["disable_paging"]:
+            self.paging = False
+            return platform["disable_paging"][command]
+        if platform["terminal_width"] is not None:
+            pattern, output = platform["terminal_width"]
+            match = re.search(pattern, command)
+            if match:
+                self.width = int(match.group(1))
+                return output.format(width=self.width)
+        if command in self.commands:
+            return self.commands[command]
+        return self._invalid(command)
+
+    def _config_command(self, command):
+        platform = self.platform
+        if command == "exit" and self.mode != "config":
+            self.mode = "config"
+            return ""
+        if command in platform["exit_config"]:
+            self.mode = None
+            return platform["exit_config"][command]
+        for pattern, mode in platform["config_submodes"].items():
+            if re.search(pattern, command):
+                self.mode = mode.format(*command.split()[1:])
+                return ""
+        return platform["config_commands"].get(command, "")
+
+    def _invalid(self, command):
+        marker = " " * self._prompt_length() + "^"
+        return self.platform["invalid"].format(command=command, marker=marker)
+
+    def _prompt_output(self, output):
+        """Return the output (paged if needed) followed by the prompt."""
+        lines = output.split("\n") if output else []
+        page = self.platform["page_length"] - 1
+        if self.paging and len(lines) > page:
+            self._pending = lines[page:]
+            self.state = MORE
+            return "".join(line + CRLF for line in lines[:page]) + self.platform["more"]
+        prompt = self.prompt()
+        self._column = self._prompt_length()
+        return "".join(line + CRLF for line in lines) + prompt
+
+    def _more_key(self, char):
+        if char == " ":
+            count = self.platform["page_length"] - 1
+        elif char in "\r\n":
+            count = 1
+        elif char in "qQ\x03":
+            count, self._pending = 0, []
+        else:
+            return ""
+        lines, self._pending = self._pending[:count], self._pending[count:]
+        output = self.platform["more_erase"]
+        output += "".join(line + CRLF for line in lines)
+        if self._pending:
+            return output + self.platform["more"]
+        self.state = LINE
+        self._column = self._prompt_length()
+        return output + self.prompt()
+
+    def _confirm_key(self, char):
+        if char in "yY":
+            self.closed = True
+            return char
+        if char in "nN":
+            self.state = LINE
+            return char + CRLF + self._prompt_output("")
+        return ""
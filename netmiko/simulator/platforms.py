@@ -0,0 +1,378 @@
+"""
+Fixtures of the simulated platforms.
+
+Each platform is a dict (the keys missing from a platform take the value of DEFAULTS):
+
+    prompt              Prompt template ({hostname} and {username} are replaced)
+    config_prompt       Configuration mode prompt template ({mode} is the current mode, for
+                        example 'config' or 'config-if')
+    banner              Sent when the session starts, before the prompt
+    any_key             Wait for a key press after the banner ('Press any key to continue')
+    enter_config        Commands entering the configuration mode, with their output
+    exit_config         Commands leaving the configuration mode, with their output
+    config_submodes     Regular expressions of the configuration commands entering a sub-mode,
+                        with the name of the sub-mode ({0} is replaced by the first argument
+                        of the command); 'exit' goes back to 'config'
+    config_commands     Output of configuration commands (the other ones are accepted silently)
+    disable_paging      Commands disabling the paging, with their output
+    terminal_width      Regular expression of the command setting the terminal width (the width
+                        is its first group), and the output of the command
+    more                Paging prompt (None: the platform doesn't page its output)
+    more_erase          Sent to erase the paging prompt when a key is pressed
+    page_length         Number of lines of a page (paging prompt included)
+    wrap                Inserted in the echo each time the cursor reaches the terminal width
+                        (None: no line wrapping)
+    logout              Commands closing the session
+    logout_confirm      Question asked before closing the session (answered with 'y' or 'n')
+    invalid             Output of an unknown command ({command} is the command and {marker} a
+                        caret under the start of the command)
+    commands            Output of the commands (the lines are separated by '\\n')
+
+New platforms can be added to PLATFORMS.
+"""
+
+DEFAULTS = {
+    "prompt": "{hostname}#",
+    "config_prompt": "{hostname}({mode})#",
+    "banner": "",
+    "any_key": False,
+    "enter_config": {},
+    "exit_config": {},
+    "config_submodes": {},
+    "config_commands": {},
+    "disable_paging": {},
+    "terminal_width": None,
+    "more": None,
+    "more_erase": "",
+    "page_length": 24,
+    "wrap": None,
+    "logout": ("exit", "logout", "quit"),
+    "logout_confirm": None,
+    "invalid": "{marker}\n% Invalid input detected at '^' marker.",
+    "commands": {},
+}
+
+# The IOS echo of a line longer than the terminal width is interleaved with backspaces
+IOS_WRAP = "\x08" * 10
+
+IOS_SUBMODES = {
+    r"^interface\s": "config-if",
+    r"^router\s": "config-router",
+    r"^line\s": "config-line",
+    r"^(ip access-list|ipv6 access-list)\s": "config-acl",
+    r"^vlan\s": "config-vlan",
+}
+
+
+def _running_config(header, interface, description, footer, count=48):
+    """Return a configuration with count interfaces (longer than a page)."""
+    lines = list(header)
+    for i in range(1, count + 1):
+        lines.append(interface.format(i))
+        lines.append(description.format(i))
+    lines.extend(footer)
+    return "\n".join(lines)
+
+
+CISCO_IOS_VERSION = """\
+Cisco IOS Software, C3750E Software (C3750E-UNIVERSALK9-M), Version 15.2(4)E10, \
+RELEASE SOFTWARE (fc2)
+Technical Support: http://www.cisco.com/techsupport
+Copyright (c) 1986-2020 by Cisco Systems, Inc.
+Compiled Tue 31-Mar-20 20:37 by prod_rel_team
+
+ROM: Bootstrap program is C3750E boot loader
+BOOTLDR: C3750E Boot Loader (C3750X-HBOOT-M) Version 15.2(3r)E, RELEASE SOFTWARE (fc1)
+
+router1 uptime is 2 years, 12 weeks, 3 days, 4 hours, 11 minutes
+System returned to ROM by power-on
+System image file is "flash:c3750e-universalk9-mz.152-4.E10.bin"
+
+cisco WS-C3750X-48P (PowerPC405) processor (revision W0) with 262144K bytes of memory.
+Processor board ID FDO1633Q14S
+Last reset from power-on
+1 Virtual Ethernet interface
+52 Gigabit Ethernet interfaces
+2 Ten Gigabit Ethernet interfaces
+512K bytes of flash-simulated non-volatile configuration memory.
+
+Configuration register is 0xF"""
+
+CISCO_IOS_INTERFACES = """\
+Interface              IP-Address      OK? Method Status                Protocol
+Vlan1                  unassigned      YES NVRAM  administratively down down
+Vlan10                 10.10.10.1      YES NVRAM  up                    up
+GigabitEthernet1/0/1   unassigned      YES unset  up                    up
+GigabitEthernet1/0/2   unassigned      YES unset  down                  down
+GigabitEthernet1/0/3   192.168.1.1     YES NVRAM  up                    up
+Loopback0              10.255.255.1    YES NVRAM  up                    up"""
+
+CISCO_IOS_RUNNING_CONFIG = _running_config(
+    [
+        "Building configuration...",
+        "",
+        "Current configuration : 8204 bytes",
+        "!",
+        "version 15.2",
+        "hostname router1",
+        "!",
+    ],
+    "interface GigabitEthernet1/0/{}",
+    " description port {}",
+    ["!", "line vty 0 4", " transport input ssh", "!", "end"],
+)
+
+CISCO_IOS = {
+    "prompt": "{hostname}#",
+    "config_prompt": "{hostname}({mode})#",
+    "enter_config": {
+        "configure terminal": "Enter configuration commands, one per line.  "
+        "End with CNTL/Z.",
+        "config term": "Enter configuration commands, one per line.  End with CNTL/Z.",
+        "conf t": "Enter configuration commands, one per line.  End with CNTL/Z.",
+    },
+    "exit_config": {"end": "", "exit": ""},
+    "config_submodes": IOS_SUBMODES,
+    "disable_paging": {"terminal length 0": ""},
+    "terminal_width": (r"^terminal width (\d+)$", ""),
+    "more": " --More-- ",
+    "more_erase": "\x08" * 9 + " " * 9 + "\x08" * 9,
+    "wrap": IOS_WRAP,
+    "commands": {
+        "show version": CISCO_IOS_VERSION,
+        "show ip interface brief": CISCO_IOS_INTERFACES,
+        "show running-config": CISCO_IOS_RUNNING_CONFIG,
+        "show clock": "*10:15:32.123 UTC Mon Oct 12 2026",
+        "write memory": "Building configuration...\n[OK]",
+    },
+}
+
+CISCO_NXOS_VERSION = """\
+Cisco Nexus Operating System (NX-OS) Software
+TAC support: http://www.cisco.com/tac
+Copyright (C) 2002-2020, Cisco and/or its affiliates.
+All rights reserved.
+
+Software
+  BIOS: version 07.68
+  NXOS: version 9.3(5)
+  BIOS compile time:  04/15/2020
+  NXOS image file is: bootflash:///nxos.9.3.5.bin
+  NXOS compile time:  7/20/2020 20:00:00 [07/21/2020 07:23:47]
+
+Hardware
+  cisco Nexus9000 C93180YC-EX chassis
+  Intel(R) Xeon(R) CPU  @ 1.80GHz with 24633496 kB of memory.
+  Processor Board ID FDO21120U5D
+
+  Device name: router1
+  bootflash: 53298520 kB
+
+Kernel uptime is 125 day(s), 3 hour(s), 11 minute(s), 48 second(s)"""
+
+CISCO_NXOS = {
+    "prompt": "{hostname}#",
+    "config_prompt": "{hostname}({mode})#",
+    "enter_config": {
+        "configure terminal": "Enter configuration commands, one per line. "
+        "End with CNTL/Z.",
+        "config term": "Enter configuration commands, one per line. End with CNTL/Z.",
+    },
+    "exit_config": {"end": "", "exit": ""},
+    "config_submodes": IOS_SUBMODES,
+    "disable_paging": {"terminal length 0": ""},
+    "terminal_width": (r"^terminal width (\d+)$", ""),
+    "more": " --More-- ",
+    "more_erase": "\r          \r",
+    "invalid": "{marker}\n% Invalid command at '^' marker.",
+    "commands": {
+        "show version": CISCO_NXOS_VERSION,
+        "show running-config": _running_config(
+            ["", "!Command: show running-config", "version 9.3(5)", "hostname router1"],
+            "interface Ethernet1/{}",
+            "  description port {}",
+            [],
+        ),
+    },
+}
+
+ARISTA_EOS_VERSION = """\
+Arista DCS-7050TX-64-R
+Hardware version:    01.11
+Serial number:       JPE16121234
+System MAC address:  001c.7312.3456
+
+Software image version: 4.24.2.4F
+Architecture:           i686
+Internal build version: 4.24.2.4F-19218540.42424F
+Internal build ID:      4a9a07e5-d54a-4c09-a4a7-7a6d4d2b6ef8
+
+Uptime:                 13 weeks, 4 days, 2 hours and 41 minutes
+Total memory:           3818208 kB
+Free memory:            2265260 kB"""
+
+ARISTA_EOS_INTERFACES = """\
+                                                                       Address
+Interface       IP Address          Status      Protocol        MTU    Owner
+--------------- ------------------- ----------- ------------- -------- -------
+Ethernet1       10.1.1.1/31         up          up              1500
+Ethernet2       10.1.1.3/31         up          up              1500
+Loopback0       10.255.255.2/32     up          up             65535
+Management1     192.168.100.2/24    up          up              1500"""
+
+ARISTA_EOS = {
+    "prompt": "{hostname}#",
+    "config_prompt": "{hostname}({mode})#",
+    "enter_config": {"configure terminal": "", "config term": "", "configure": ""},
+    "exit_config": {"end": "", "exit": ""},
+    "config_submodes": IOS_SUBMODES,
+    "disable_paging": {"terminal length 0": "Pagination disabled."},
+    "terminal_width": (r"^terminal width (\d+)$", "Width set to {width} columns."),
+    "more": " --More-- ",
+    "more_erase": "\r          \r",
+    "invalid": "% Invalid input",
+    "commands": {
+        "show version": ARISTA_EOS_VERSION,
+        "show ip interface brief": ARISTA_EOS_INTERFACES,
+        "show running-config": _running_config(
+            [
+                "! Command: show running-config",
+                "! device: router1",
+                "!",
+                "hostname router1",
+            ],
+            "interface Ethernet{}",
+            "   description port {}",
+            ["!", "end"],
+        ),
+    },
+}
+
+JUNIPER_JUNOS_VERSION = """\
+Hostname: router1
+Model: mx960
+Junos: 18.2R3-S3.11
+JUNOS OS Kernel 64-bit  [20191115.2a5d1ee_builder_stable_11]
+JUNOS OS libs [20191115.2a5d1ee_builder_stable_11]
+JUNOS OS runtime [20191115.2a5d1ee_builder_stable_11]
+JUNOS Routing Engine [20191115.2a5d1ee_builder_stable_11]"""
+
+JUNIPER_JUNOS_INTERFACES = """\
+Interface               Admin Link Proto    Local                 Remote
+ge-0/0/0                up    up
+ge-0/0/0.0              up    up   inet     10.0.0.1/30
+ge-0/0/1                up    down
+lo0                     up    up
+lo0.0                   up    up   inet     10.255.255.3        --> 0/0
+fxp0                    up    up
+fxp0.0                  up    up   inet     192.168.100.3/24"""
+
+JUNIPER_JUNOS = {
+    "prompt": "{username}@{hostname}> ",
+    # The configuration context is shown above the prompt
+    "config_prompt": "\n[edit]\n{username}@{hostname}# ",
+    "enter_config": {"configure": "Entering configuration mode", "edit": ""},
+    "exit_config": {
+        "exit configuration-mode": "Exiting configuration mode",
+        "exit": "Exiting configuration mode",
+        "quit": "Exiting configuration mode",
+    },
+    "config_commands": {
+        "commit": "commit complete",
+        "commit check": "configuration check succeeds",
+    },
+    "disable_paging": {"set cli screen-length 0": "Screen length set to 0"},
+    "terminal_width": (r"^set cli screen-width (\d+)$", "Screen width set to {width}"),
+    "more": "---(more)---",
+    "more_erase": "\r            \r",
+    "invalid": "{marker}\nunknown command.",
+    "commands": {
+        "show version": JUNIPER_JUNOS_VERSION,
+        "show interfaces terse": JUNIPER_JUNOS_INTERFACES,
+        "set cli complete-on-space off": "Disabling complete-on-space",
+        "show configuration": _running_config(
+            [
+                "## Last commit: 2026-10-12 10:15:32 UTC by admin",
+                "version 18.2R3-S3.11;",
+            ],
+            "interfaces ge-0/0/{} {{",
+            '    description "port {}";',
+            ["}"],
+        ),
+    },
+}
+
+# ProCurve redraws the screen with VT100 codes
+HP_PROCURVE_ANSI = "\x1b[24;1H\x1b[2K"
+
+HP_PROCURVE_VERSION = """\
+Image stamp:    /ws/swbuildm/rel_venice_qaoff/code/build/tam(swbuildm_rel_venice_qaoff_rel_venice)
+                Nov 22 2019 11:26:01
+                YA.16.08.0002
+                1223
+Boot Image:     Primary"""
+
+HP_PROCURVE = {
+    "prompt": HP_PROCURVE_ANSI + "{hostname}# \x1b[?25h",
+    "config_prompt": HP_PROCURVE_ANSI + "{hostname}({mode})# \x1b[?25h",
+    "banner": "\x1b[2J\x1b[?7l\x1b[3;23r\x1b[?6l\x1b[1;1H\x1b[?25l\x1b[1;1H"
+    "HP J9773A 2530-24G-PoEP Switch\n"
+    "Software revision YA.16.08.0002\n\n"
+    "(C) Copyright 2019 Hewlett Packard Enterprise Development LP\n\n"
+    "                   RESTRICTED RIGHTS LEGEND\n"
+    "Confidential computer software.\n\n"
+    "We'd like to keep you up to date about:\n"
+    "  * Software feature updates\n"
+    "  * New product announcements\n"
+    "  * Special events\n\n"
+    "Please register your products now at:  www.hpe.com/networking/register\n\n\n"
+    "Press any key to continue\n",
+    "any_key": True,
+    "enter_config": {"configure": "", "configure terminal": "", "config term": ""},
+    "exit_config": {"end": "", "exit": ""},
+    "config_submodes": {r"^interface\s": "eth-{0}", r"^vlan\s": "vlan-{0}"},
+    "disable_paging": {"no page": ""},
+    "terminal_width": (r"^terminal width (\d+)$", ""),
+    "more": HP_PROCURVE_ANSI
+    + "-- MORE --, next page: Space, next line: Enter, quit: Control-C",
+    "more_erase": HP_PROCURVE_ANSI,
+    "logout": ("logout", "exit"),
+    "logout_confirm": "Do you want to log out [y/n]? ",
+    "invalid": "Invalid input: {command}",
+    "commands": {
+        "show version": HP_PROCURVE_VERSION,
+        "show running-config": _running_config(
+            [
+                "Running configuration:",
+                "",
+                "; J9773A Configuration Editor; Created on release #YA.16.08.0002",
+                'hostname "router1"',
+            ],
+            "interface {}",
+            '   name "port {}"\n   exit',
+            [],
+        ),
+    },
+}
+
+LINUX = {
+    "prompt": "{username}@{hostname}:~$ ",
+    "invalid": "-bash: {command}: command not found",
+    "logout": ("exit", "logout"),
+    "commands": {
+        "uname -a": "Linux router1 5.4.0-88-generic #99-Ubuntu SMP Thu Sep 23 17:29:00 UTC "
+        "2021 x86_64 x86_64 x86_64 GNU/Linux",
+        "uptime": " 10:15:32 up 42 days,  3:11,  1 user,  load average: 0.00, 0.01, 0.05",
+        "whoami": "admin",
+    },
+}
+
+PLATFORMS = {
+    "arista_eos": ARISTA_EOS,
+    "cisco_ios": CISCO_IOS,
+    "cisco_nxos": CISCO_NXOS,
+    "cisco_xe": CISCO_IOS,
+    "hp_procurve": HP_PROCURVE,
+    "juniper_junos": JUNIPER_JUNOS,
+    "linux": LINUX,
+}
@@ -0,0 +1,365 @@
+"""Paramiko SSH server of the simulated devices, with latency, jitter and throughput limits."""
+import queue
+import random
+import socket
+import threading
+import time
+
+import paramiko
+
+from netmiko import log
+from netmiko.simulator.cli import SimulatedCLI, get_platform
+
+_host_key = None
+_host_key_lock = threading.Lock()
+
+
+def default_host_key():
+    """Return the host key of the simulators (an RSA key generated once per process)."""
+    global _host_key
+    with _host_key_lock:
+        if _host_key is None:
+            _host_key = paramiko.RSAKey.generate(2048)
+        return _host_key
+
+
+class ShapedLink(object):
+    """
+    Send the data on a channel after the latency (plus or minus a random jitter) and at most at
+    the throughput; the order of the data is kept.
+
+    :param channel: Paramiko channel.
+    :type channel: paramiko.Channel
+
+    :param latency: Delay in seconds before data is sent (default: 0).
+    :type latency: float
+
+    :param jitter: Maximum random variation of the latency, in seconds (default: 0).
+    :type jitter: float
+
+    :param throughput: Maximum bytes per second (default: None, unlimited).
+    :type throughput: float
+
+    :param chunk_size: Size of the packets sent when the throughput is limited (default: 1024).
+    :type chunk_size: int
+
+    :param rng: Random generator of the jitter.
+    :type rng: random.Random
+    """
+
+    def __init__(
+        self,
+        channel,
+        latency=0.0,
+        jitter=0.0,
+        throughput=None,
+        chunk_size=1024,
+        rng=None,
+    ):
+        self.channel = channel
+        self.latency = latency
+        self.jitter = jitter
+        self.throughput = throughput
+        self.chunk_size = chunk_size
+        self.rng = rng or random.Random()
+        self._queue = queue.Queue()
+        self._last_due = 0.0
+        self._thread = threading.Thread(
+            target=self._run, name=f"netmiko-simulator-link-{id(self)}"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def send(self, data):
+        """Queue data to be sent once the latency has elapsed."""
+        if not data:
+            return
+        delay = self.latency
+        if self.jitter:
+            delay += self.rng.uniform(-self.jitter, self.jitter)
+        due = time.monotonic() + max(0.0, delay)
+        # Data is never sent before the data queued earlier
+        self._last_due = due = max(due, self._last_due)
+        self._queue.put((due, data))
+
+    def close(self):
+        """Send the queued data and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        next_send = 0.0
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            due, data = item
+            try:
+                if self.throughput is None:
+                    self._sleep_until(due)
+                    self.channel.sendall(data)
+                    continue
+                for i in range(0, len(data), self.chunk_size):
+                    end = i + self.chunk_size
+                    chunk = data[i:end]
+                    next_send = max(next_send, due)
+                    self._sleep_until(next_send)
+                    self.channel.sendall(chunk)
+                    next_send += len(chunk) / self.throughput
+            except (socket.error, EOFError):
+                # The client is gone: drop the remaining data
+                log.debug("Simulator: channel closed, dropping the queued data")
+                while self._queue.get() is not None:
+                    pass
+                return
+
+    @staticmethod
+    def _sleep_until(deadline):
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class SimulatedServer(paramiko.ServerInterface):
+    """Paramiko server interface of a DeviceSimulator (one per SSH connection)."""
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+        self.widths = {}
+
+    def get_allowed_auths(self, username):
+        return "none" if self.simulator.password is None else "password"
+
+    def check_auth_none(self, username):
+        if self.simulator.password is None:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_auth_password(self, username, password):
+        simulator = self.simulator
+        if simulator.password is None or (
+            username == simulator.username and password == simulator.password
+        ):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(
+        self, channel, term, width, height, pixelwidth, pixelheight, modes
+    ):
+        self.widths[channel.get_id()] = width
+        return True
+
+    def check_channel_shell_request(self, channel):
+        width = self.widths.get(channel.get_id()) or 80
+        self.simulator._start_thread(self.simulator._shell, channel, width)
+        return True
+
+    def check_channel_exec_request(self, channel, command):
+        command = command.decode("utf-8", "ignore")
+        self.simulator._start_thread(self.simulator._exec, channel, command)
+        return True
+
+
+class DeviceSimulator(object):
+    """
+    SSH server emulating the CLI of a network device, for tests and benchmarks.
+
+    The CLI (prompts, paging, configuration mode, echo, line wrapping and ANSI codes) is driven
+    by the platform's fixture (see netmiko.simulator.platforms), and the data sent to the client
+    is delayed by the latency and jitter, and limited to the throughput.
+
+    :param platform: Name of the platform (a key of PLATFORMS, also the netmiko device_type).
+    :type platform: str
+
+    :param hostname: Hostname in the prompt (default: 'router1').
+    :type hostname: str
+
+    :param username: Username accepted (default: 'admin').
+    :type username: str
+
+    :param password: Password accepted, None to accept any password and the 'none'
+        authentication (default: 'password').
+    :type password: str
+
+    :param commands: Output of additional commands, or replacing the platform's ones.
+    :type commands: dict
+
+    :param latency: Delay in seconds of the data sent to the client (default: 0).
+    :type latency: float
+
+    :param jitter: Maximum random variation of the latency, in seconds (default: 0).
+    :type jitter: float
+
+    :param throughput: Maximum bytes per second sent to each client (default: None, unlimited).
+    :type throughput: float
+
+    :param seed: Seed of the jitter, for reproducible runs (default: None).
+    :type seed: int
+
+    :param host: Address to listen on (default: '127.0.0.1').
+    :type host: str
+
+    :param port: TCP port to listen on (default: 0, a free port, see the port attribute).
+    :type port: int
+
+    :param host_key: Host key of the server (default: an RSA key generated once per process).
+    :type host_key: paramiko.PKey
+    """
+
+    def __init__(
+        self,
+        platform="cisco_ios",
+        hostname="router1",
+        username="admin",
+        password="password",
+        commands=None,
+        latency=0.0,
+        jitter=0.0,
+        throughput=None,
+        seed=None,
+        host="127.0.0.1",
+        port=0,
+        host_key=None,
+    ):
+        # Fail early on an unknown platform
+        get_platform(platform)
+        self.platform = platform
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.commands = commands
+        self.latency = latency
+        self.jitter = jitter
+        self.throughput = throughput
+        self.host = host
+        self.port = port
+        self.host_key = host_key
+        self._rng = random.Random(seed)
+        self._socket = None
+        self._transports = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start listening (in a daemon thread), return the port."""
+        if self._socket is not None:
+            return self.port
+        if self.host_key is None:
+            self.host_key = default_host_key()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self._socket.listen(100)
+        self.port = self._socket.getsockname()[1]
+        self._start_thread(self._accept, self._socket)
+        return self.port
+
+    def stop(self):
+        """Stop listening and close the connections."""
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            sock.close()
+        with self._lock:
+            transports, self._transports = self._transports, []
+        for transport in transports:
+            transport.close()
+
+    def device(self, **kwargs):
+        """
+        Return the ConnectHandler arguments of the simulator (kwargs are added).
+
+        Example:
+        ------------------
+        with DeviceSimulator("arista_eos", latency=0.05) as simulator:
+            with ConnectHandler(**simulator.device(fast_cli=True)) as net_connect:
+                net_connect.send_command("show version")
+        ------------------
+        """
+        device = {
+            "device_type": self.platform,
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password or "",
+        }
+        device.update(kwargs)
+        return device
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def _start_thread(target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def _accept(self, sock):
+        while True:
+            try:
+                client, _ = sock.accept()
+            except OSError:
+                # stop() closed the socket
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self.host_key)
+            with self._lock:
+                self._transports.append(transport)
+            try:
+                transport.start_server(server=SimulatedServer(self))
+            except (paramiko.SSHException, EOFError, socket.error) as e:
+                log.debug(f"Simulator: SSH negotiation failed: {e}")
+                transport.close()
+
+    def _link(self, channel):
+        return ShapedLink(
+            channel, self.latency, self.jitter, self.throughput, rng=self._rng
+        )
+
+    def _new_cli(self, width=80):
+        return SimulatedCLI(
+            self.platform, self.hostname, self.username, self.commands, width
+        )
+
+    def _shell(self, channel, width):
+        cli = self._new_cli(width)
+        link = self._link(channel)
+        try:
+            link.send(cli.start())
+            while not cli.closed:
+                data = channel.recv(4096)
+                if not data:
+                    break
+                link.send(cli.feed(data))
+        except (socket.error, EOFError):
+            pass
+        finally:
+            link.close()
+            self._close_channel(channel)
+
+    def _exec(self, channel, command):
+        link = self._link(channel)
+        try:
+            link.send(self._new_cli().run(command).encode("utf-8"))
+        finally:
+            link.close()
+            self._close_channel(channel, exit_status=0)
+
+    @staticmethod
+    def _close_channel(channel, exit_status=None):
+        # The client may already be gone
+        try:
+            if exit_status is not None:
+                channel.send_exit_status(exit_status)
+            channel.close()
+        except (socket.error, EOFError):
+            pass
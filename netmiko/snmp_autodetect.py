@@ -15,12 +15,27 @@ device_type = my_snmp.autodetect()
 
 autodetect will return None if no match.
 
+A persistent cache of the results can be used with the 'autodetect_cache' argument (see
+netmiko.autodetect_cache). A cached device_type is verified with a single SNMP GET.
+
 SNMPDetect class defaults to SNMPv3
 
+To detect many devices at once, SNMPBulkDetect sends the SNMP GETs for all the hosts concurrently
+(sharing a single SNMP engine/dispatcher) and returns the results as they arrive:
+------------------
+from netmiko.snmp_autodetect import SNMPBulkDetect
+
+bulk_snmp = SNMPBulkDetect(hosts, snmp_version='v2c', community='public')
+for hostname, device_type in bulk_snmp.autodetect_iter():
+    print(hostname, device_type)
+------------------
+
 Note, pysnmp is a required dependency for SNMPDetect and is intentionally not included in
 netmiko requirements. So installation of pysnmp might be required.
 """
+import queue
 import re
+import threading
 
 try:
     from pysnmp.entity.rfc3413.oneliner import cmdgen
@@ -28,6 +43,7 @@ except ImportError:
     raise ImportError("pysnmp not installed; please install it: 'pip install pysnmp'")
 
 from netmiko.ssh_dispatcher import CLASS_MAPPER
+from netmiko.autodetect_cache import AutodetectCache
 
 
 # Higher priority indicates a better match.
@@ -116,6 +132,38 @@ for device_type in std_device_types:
     if SNMP_MAPPER_BASE.get(device_type):
         SNMP_MAPPER[device_type] = SNMP_MAPPER_BASE[device_type]
 
+# SNMP_MAPPER as a list of (device_type, mapper) sorted by priority (highest first)
+SNMP_MAPPER_LIST = list(
+    reversed(sorted(SNMP_MAPPER.items(), key=lambda x: x[1]["priority"]))
+)
+
+# The OIDs to query, in the order of the highest priority device_type using them
+SNMP_MAPPER_OIDS = []
+for _, v in SNMP_MAPPER_LIST:
+    if v["oid"] not in SNMP_MAPPER_OIDS:
+        SNMP_MAPPER_OIDS.append(v["oid"])
+
+
+def match_snmp_responses(responses):
+    """
+    Return the best device_type for the SNMP responses.
+
+    Parameters
+    ----------
+    responses : dict
+        Dict of (oid, response) with the OIDs used in SNMP_MAPPER.
+
+    Returns
+    -------
+    device_type : str or None
+        The highest priority device_type matching the responses.
+    """
+    for device_type, v in SNMP_MAPPER_LIST:
+        snmp_response = responses.get(v["oid"])
+        if snmp_response and re.search(v["expr"], snmp_response):
+            return device_type
+    return None
+
 
 class SNMPDetect(object):
     """
@@ -143,6 +191,9 @@ class SNMPDetect(object):
         The SNMPv3 authentication protocol (default: 'aes128')
     encrypt_proto : str, optional ('sha', 'md5')
         The SNMPv3 encryption protocol (default: 'sha')
+    autodetect_cache : netmiko.autodetect_cache.AutodetectCache or bool, optional
+        Cache used to skip the detection for known devices (True uses the default cache,
+        default: None)
 
     Attributes
     ----------
@@ -184,6 +235,7 @@ class SNMPDetect(object):
         encrypt_key="",
         auth_proto="sha",
         encrypt_proto="aes128",
+        autodetect_cache=None,
     ):
 
         # Check that the SNMP version is matching predefined type or raise ValueError
@@ -231,6 +283,10 @@ class SNMPDetect(object):
         self.auth_proto = self._snmp_v3_authentication[auth_proto]
         self.encryp_proto = self._snmp_v3_encryption[encrypt_proto]
         self._response_cache = {}
+        self._cmd_gen = None
+        if autodetect_cache is True:
+            autodetect_cache = AutodetectCache()
+        self.autodetect_cache = autodetect_cache
 
     def _get_snmpv3(self, oid):
         """
@@ -247,7 +303,7 @@ class SNMPDetect(object):
             The string as part of the value from the OID you are trying to retrieve.
         """
         snmp_target = (self.hostname, self.snmp_port)
-        cmd_gen = cmdgen.CommandGenerator()
+        cmd_gen = self._command_generator()
 
         (error_detected, error_status, error_index, snmp_data) = cmd_gen.getCmd(
             cmdgen.UsmUserData(
@@ -282,7 +338,7 @@ class SNMPDetect(object):
             The string as part of the value from the OID you are trying to retrieve.
         """
         snmp_target = (self.hostname, self.snmp_port)
-        cmd_gen = cmdgen.CommandGenerator()
+        cmd_gen = self._command_generator()
 
         (error_detected, error_status, error_index, snmp_data) = cmd_gen.getCmd(
             cmdgen.CommunityData(self.community),
@@ -296,6 +352,12 @@ class SNMPDetect(object):
             return str(snmp_data[0][1])
         return ""
 
+    def _command_generator(self):
+        """Return the CommandGenerator of this instance (created on first use)."""
+        if self._cmd_gen is None:
+            self._cmd_gen = cmdgen.CommandGenerator()
+        return self._cmd_gen
+
     def _get_snmp(self, oid):
         """Wrapper for generic SNMP call."""
         if self.snmp_version in ["v1", "v2c"]:
@@ -316,29 +378,248 @@ class SNMPDetect(object):
         potential_type : str
             The name of the device_type that must be running.
         """
-        # Convert SNMP_MAPPER to a list and sort by priority
-        snmp_mapper_list = []
-        for k, v in SNMP_MAPPER.items():
-            snmp_mapper_list.append({k: v})
-        snmp_mapper_list = sorted(
-            snmp_mapper_list, key=lambda x: list(x.values())[0]["priority"]
-        )
-        snmp_mapper_list.reverse()
+        cached_match = self._cached_match()
+        if cached_match is not None:
+            return cached_match
+
+        potential_type = self._autodetect()
+        if potential_type is not None and self.autodetect_cache is not None:
+            self.autodetect_cache.set(
+                "snmp", self.hostname, self.snmp_port, potential_type
+            )
+        return potential_type
+
+    def _cached_match(self):
+        """
+        Return the cached device_type if a single GET of its OID still matches its regex.
 
-        for entry in snmp_mapper_list:
-            for device_type, v in entry.items():
-                oid = v["oid"]
-                regex = v["expr"]
+        Returns
+        -------
+        device_type : str or None
+            The cached device_type or None if there is no valid entry.
+        """
+        if self.autodetect_cache is None:
+            return None
+        entry = self.autodetect_cache.get("snmp", self.hostname, self.snmp_port)
+        if entry is None:
+            return None
+        device_type, _ = entry
+        mapper = SNMP_MAPPER.get(device_type)
+        if mapper is not None:
+            snmp_response = self._get_snmp(mapper["oid"])
+            self._response_cache[mapper["oid"]] = snmp_response
+            if re.search(mapper["expr"], snmp_response):
+                return device_type
+        self.autodetect_cache.delete("snmp", self.hostname, self.snmp_port)
+        return None
 
-                # Used cache data if we already queryied this OID
-                if self._response_cache.get(oid):
-                    snmp_response = self._response_cache.get(oid)
-                else:
-                    snmp_response = self._get_snmp(oid)
-                    self._response_cache[oid] = snmp_response
+    def _autodetect(self):
+        """Query the SNMP_MAPPER OIDs by priority and return the first matching device_type."""
+        for device_type, v in SNMP_MAPPER_LIST:
+            oid = v["oid"]
+            regex = v["expr"]
 
-                # See if we had a match
-                if re.search(regex, snmp_response):
-                    return device_type
+            # Used cache data if we already queryied this OID
+            if self._response_cache.get(oid):
+                snmp_response = self._response_cache.get(oid)
+            else:
+                snmp_response = self._get_snmp(oid)
+                self._response_cache[oid] = snmp_response
+
+            # See if we had a match
+            if re.search(regex, snmp_response):
+                return device_type
 
         return None
+
+
+class SNMPBulkDetect(SNMPDetect):
+    """
+    The SNMPBulkDetect class determines the device type of many hosts concurrently.
+
+    The SNMP GETs for all the OIDs used in SNMP_MAPPER are sent in a single request per host.
+    Requests for all the hosts share one SNMP engine and dispatcher (up to max_concurrency
+    requests are outstanding at any time) and the results are returned as the responses arrive.
+
+    Parameters
+    ----------
+    hosts : list
+        The names or IP addresses of the devices we want to guess the type
+    max_concurrency : int, optional
+        The maximum number of outstanding SNMP requests (default: 500)
+    timeout : float, optional
+        The SNMP request timeout in seconds (default: 1.5)
+    retries : int, optional
+        The number of SNMP request retries (default: 2)
+    **kwargs : dict
+        The other arguments of SNMPDetect (snmp_version, snmp_port, community, user...)
+
+    Methods
+    -------
+    autodetect()
+        Determine the device type of all the hosts.
+    autodetect_iter()
+        Generator of (hostname, device_type) in the order the responses arrive.
+    """
+
+    def __init__(self, hosts, max_concurrency=500, timeout=1.5, retries=2, **kwargs):
+        super().__init__(hostname=None, **kwargs)
+        self.hosts = list(hosts)
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+
+    def _auth_data(self):
+        """Return the pysnmp authentication data for the configured SNMP version."""
+        if self.snmp_version in ["v1", "v2c"]:
+            mp_model = 0 if self.snmp_version == "v1" else 1
+            return cmdgen.CommunityData(self.community, mpModel=mp_model)
+        return cmdgen.UsmUserData(
+            self.user,
+            self.auth_key,
+            self.encrypt_key,
+            authProtocol=self.auth_proto,
+            privProtocol=self.encryp_proto,
+        )
+
+    def autodetect(self):
+        """
+        Try to guess the device_type of all the hosts.
+
+        Returns
+        -------
+        device_types : dict
+            Dict of (hostname, device_type), device_type is None if there was no match.
+        """
+        return dict(self.autodetect_iter())
+
+    def autodetect_iter(self):
+        """
+        Try to guess the device_type of all the hosts, yielding the results as they arrive.
+
+        A host with an autodetect_cache entry is first checked with a single GET of the cached
+        device_type's OID, the entry is deleted and the host fully queried if it no longer
+        matches.
+
+        Yields
+        ------
+        result : tuple
+            (hostname, device_type), device_type is None if there was no match.
+        """
+        snmp_engine = cmdgen.SnmpEngine()
+        auth_data = self._auth_data()
+        pending_hosts = iter(self.hosts)
+        results = queue.Queue()
+        done = object()
+        stopped = threading.Event()
+
+        def send_request(hostname, oids, cached_type=None):
+            try:
+                cmdgen.getCmd(
+                    snmp_engine,
+                    auth_data,
+                    cmdgen.UdpTransportTarget(
+                        (hostname, self.snmp_port),
+                        timeout=self.timeout,
+                        retries=self.retries,
+                    ),
+                    cmdgen.ContextData(),
+                    *[cmdgen.ObjectType(cmdgen.ObjectIdentity(oid)) for oid in oids],
+                    cbFun=process_response,
+                    cbCtx=(hostname, oids, cached_type),
+                    lookupMib=False,
+                )
+            except Exception:
+                # For example, name resolution failure
+                results.put((hostname, None))
+                return False
+            return True
+
+        def send_host(hostname):
+            if self.autodetect_cache is not None:
+                entry = self.autodetect_cache.get("snmp", hostname, self.snmp_port)
+                if entry is not None:
+                    device_type, _ = entry
+                    if device_type in SNMP_MAPPER:
+                        oids = [SNMP_MAPPER[device_type]["oid"]]
+                        return send_request(hostname, oids, device_type)
+                    self.autodetect_cache.delete("snmp", hostname, self.snmp_port)
+            return send_request(hostname, SNMP_MAPPER_OIDS)
+
+        def send_next():
+            # Once the caller stopped iterating, the outstanding requests are left to finish
+            if stopped.is_set():
+                return
+            for hostname in pending_hosts:
+                if send_host(hostname):
+                    return
+
+        def process_response(
+            snmp_engine,
+            send_request_handle,
+            error_indication,
+            error_status,
+            error_index,
+            var_binds,
+            cb_ctx,
+        ):
+            hostname, oids, cached_type = cb_ctx
+            if cached_type is not None:
+                expr = SNMP_MAPPER[cached_type]["expr"]
+                if (
+                    not error_indication
+                    and not error_status
+                    and re.search(expr, str(var_binds[0][1]))
+                ):
+                    results.put((hostname, cached_type))
+                    send_next()
+                    return
+                # The cached device_type no longer matches, query all the OIDs
+                self.autodetect_cache.delete("snmp", hostname, self.snmp_port)
+                if not send_request(hostname, SNMP_MAPPER_OIDS):
+                    send_next()
+                return
+            if not error_indication and error_status and int(error_index):
+                # SNMPv1 fails the whole request if an OID is missing, retry without it
+                oids = [oid for i, oid in enumerate(oids, 1) if i != int(error_index)]
+                if oids and send_request(hostname, oids):
+                    return
+            responses = {}
+            if not error_indication and not error_status:
+                responses = {oid: str(v[1]) for oid, v in zip(oids, var_binds)}
+            device_type = match_snmp_responses(responses)
+            if device_type is not None and self.autodetect_cache is not None:
+                self.autodetect_cache.set("snmp", hostname, self.snmp_port, device_type)
+            results.put((hostname, device_type))
+            send_next()
+
+        def run_dispatcher():
+            dispatcher = snmp_engine.transportDispatcher
+            try:
+                dispatcher.runDispatcher()
+            finally:
+                dispatcher.closeDispatcher()
+                results.put(done)
+
+        thread = None
+        try:
+            for _ in range(self.max_concurrency):
+                send_next()
+            if snmp_engine.transportDispatcher is None:
+                # No request could be sent, the dispatcher was never created
+                results.put(done)
+            else:
+                thread = threading.Thread(target=run_dispatcher, daemon=True)
+                thread.start()
+
+            while True:
+                result = results.get()
+                if result is done:
+                    break
+                yield result
+        finally:
+            # If the caller stops early, no new request is sent: the dispatcher returns (and is
+            # closed by its thread) once the outstanding requests are answered or timed out
+            stopped.set()
+            if thread is None and snmp_engine.transportDispatcher is not None:
+                snmp_engine.transportDispatcher.closeDispatcher()
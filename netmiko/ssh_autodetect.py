@@ -19,6 +19,15 @@ to handle the auto-detection.
 * "priority" : An integer (0-99) which specifies the confidence of the match above
 * "dispatch" : The function to call to try the autodetection (per default SSHDetect._autodetect_std)
 
+Before any command is sent, the login banner and prompt captured when the connection is opened
+are compared with *SSH_HINTS* to score the candidates. The commands are then sent in order of
+likelihood and each read ends as soon as the prompt is seen again (instead of waiting for the
+channel to be quiet).
+
+Results can be stored in a persistent cache (see *netmiko.autodetect_cache*) using the
+'autodetect_cache' argument. A cached device_type is used only if the SSH host key is unchanged
+and the prompt matches the one received when the device was detected.
+
 Examples
 --------
 
@@ -37,11 +46,19 @@ Examples
 # Netmiko connection creation section
 >>> remote_device['device_type'] = best_match
 >>> connection = ConnectHandler(**remote_device)
+
+# Alternatively, reuse the SSH session that was used for auto-detection
+>>> remote_device['device_type'] = 'autodetect'
+>>> guesser = SSHDetect(**remote_device)
+>>> connection = guesser.connect()
+>>> print(connection.device_type)
 """
 import re
 import time
-from netmiko.ssh_dispatcher import ConnectHandler
+from functools import lru_cache
+from netmiko.ssh_dispatcher import ConnectHandler, redispatch
 from netmiko.base_connection import BaseConnection
+from netmiko.autodetect_cache import AutodetectCache, banner_fingerprint
 
 
 # 'dispatch' key is the SSHDetect method to call. dispatch key will be popped off dictionary
@@ -180,6 +197,66 @@ SSH_MAPPER_BASE = {
 }
 
 
+# Responses indicating that the probe command is not supported by the remote device
+INVALID_RESPONSES = [
+    r"% Invalid input detected",
+    r"syntax error, expecting",
+    r"Error: Unrecognized command",
+    r"%Error",
+    r"command not found",
+    r"Syntax Error: unexpected argument",
+]
+INVALID_RESPONSES_RE = re.compile("|".join(INVALID_RESPONSES), flags=re.I)
+
+# Patterns matched against the login banner/initial prompt (SSHDetect.initial_buffer) and the
+# score they add to a device_type. Only used to order the probes, a probe must still match.
+SSH_HINTS = {
+    "alcatel_sros": [(r"^\*?[AB]:\S+#\s*$", 10), (r"Nokia|TiMOS|Alcatel", 20)],
+    "arista_eos": [(r"Arista", 20)],
+    "cisco_asa": [(r"Adaptive Security Appliance", 20)],
+    "cisco_ios": [(r"^[\w.\-]+[>#]\s*$", 2), (r"Cisco", 5)],
+    "cisco_nxos": [(r"^[\w.\-]+#\s*$", 1), (r"Nexus|NX-OS", 20)],
+    "cisco_xr": [(r"^RP/\d+/\S+:\S+#\s*$", 20), (r"IOS XR", 20)],
+    "dell_os10": [(r"OS10", 20)],
+    "f5_linux": [(r"^\[\S+@\S+:\S+\] .*[#\$]\s*$", 5), (r"BIG-IP", 10)],
+    "f5_tmsh": [(r"\(tmos\)#\s*$", 20), (r"BIG-IP", 10)],
+    "huawei": [(r"^<\S+>\s*$", 10), (r"Huawei", 20)],
+    "juniper_junos": [(r"^\S+@\S+[>#%]\s*$", 5), (r"JUNOS|Juniper", 20)],
+    "pica8_picos": [(r"^\S+@\S+[>#]\s*$", 2), (r"PicOS|PICA8", 20)],
+    "linux": [
+        (r"^\S+@\S+:.*[\$#]\s*$", 10),
+        (r"Ubuntu|Debian|CentOS|Red Hat|Fedora|Last login", 5),
+    ],
+    "ubiquiti_edgeswitch": [(r"EdgeSwitch|UBNT", 20)],
+}
+SSH_HINTS_RE = {
+    device_type: [(re.compile(pattern, flags=re.M), score) for pattern, score in hints]
+    for device_type, hints in SSH_HINTS.items()
+}
+
+# Last line of the initial buffer is used as the prompt if it looks like a prompt
+PROMPT_TERMINATOR_RE = re.compile(r"[>#\$%\]]$")
+
+# The autodetect session doesn't disable paging: the output stops at the pager prompt
+PAGING_RE = re.compile(r"(--\s*More\s*--|<--- More --->)\s*$", flags=re.I)
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(search_patterns, re_flags=re.I):
+    """Combine a tuple of search_patterns into a single compiled regular expression."""
+    combined = "|".join(f"(?:{pattern})" for pattern in search_patterns)
+    return re.compile(combined, flags=re_flags)
+
+
+# Compile the SSH_MAPPER_BASE search patterns once at load time, with the arguments of
+# _autodetect_std (lru_cache keys differ if re_flags is omitted)
+for _autodetect_dict in SSH_MAPPER_BASE.values():
+    _compile_patterns(
+        tuple(_autodetect_dict["search_patterns"]),
+        _autodetect_dict.get("re_flags", re.I),
+    )
+
+
 class SSHDetect(object):
     """
     The SSHDetect class tries to automatically guess the device type running on the SSH remote end.
@@ -192,6 +269,9 @@ class SSHDetect(object):
         The same *args that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
     *kwargs : dict
         The same *kwargs that you might provide to the netmiko.ssh_dispatcher.ConnectHandler.
+    autodetect_cache : netmiko.autodetect_cache.AutodetectCache or bool, optional
+        Cache used to skip the probes for known devices (True uses the default cache,
+        default: None).
 
     Attributes
     ----------
@@ -200,11 +280,19 @@ class SSHDetect(object):
     potential_matches: dict
         Dict of (device_type, accuracy) that is populated through an interaction with the
         remote end.
+    initial_buffer : str
+        The data (banner and prompt) read from the remote end when the connection was opened.
+    prompt : str or None
+        The prompt found at the end of initial_buffer (used to detect the end of the output).
+    hint_scores : dict
+        Dict of (device_type, score) computed from the initial_buffer using SSH_HINTS.
 
     Methods
     -------
     autodetect()
         Try to determine the device type.
+    connect()
+        Determine the device type and reuse the SSH session for a connection of that type.
     """
 
     def __init__(self, *args, **kwargs):
@@ -213,10 +301,16 @@ class SSHDetect(object):
         """
         if kwargs["device_type"] != "autodetect":
             raise ValueError("The connection device_type must be 'autodetect'")
+        autodetect_cache = kwargs.pop("autodetect_cache", None)
+        if autodetect_cache is True:
+            autodetect_cache = AutodetectCache()
+        self.autodetect_cache = autodetect_cache
         self.connection = ConnectHandler(*args, **kwargs)
         # Call the _test_channel_read() in base to clear initial data
         output = BaseConnection._test_channel_read(self.connection)
         self.initial_buffer = output
+        self.prompt = self._find_prompt(output)
+        self.hint_scores = self._score_initial_buffer(output)
         self.potential_matches = {}
         self._results_cache = {}
 
@@ -224,13 +318,113 @@ class SSHDetect(object):
         """
         Try to guess the best 'device_type' based on patterns defined in SSH_MAPPER_BASE
 
+        The SSH connection is closed once the device_type is determined (see connect() to keep
+        using it instead).
+
         Returns
         -------
         best_match : str or None
             The device type that is currently the best to use to interact with the device
         """
-        for device_type, autodetect_dict in SSH_MAPPER_BASE.items():
-            tmp_dict = autodetect_dict.copy()
+        best_match = self._find_best_match()
+        self.connection.disconnect()
+        return best_match
+
+    def connect(self, device_type=None, session_prep=True):
+        """
+        Autodetect the device_type and hand off the already authenticated SSH session.
+
+        Instead of disconnecting (and requiring a new TCP/SSH/AAA setup through ConnectHandler),
+        the probe connection is converted to the detected device_type's class using redispatch
+        and that class's session_preparation() is run.
+
+        Parameters
+        ----------
+        device_type : str, optional
+            Skip detection and redispatch to this device_type (default: None, autodetect).
+        session_prep : bool, optional
+            Run session_preparation() of the new class (default: True).
+
+        Returns
+        -------
+        connection : netmiko.base_connection.BaseConnection or None
+            The connection (now an instance of the detected driver class) or None if no
+            device_type matched (in which case the connection is closed). The connection is
+            also closed if the redispatch or the session preparation raises.
+        """
+        if device_type is None:
+            device_type = self._find_best_match()
+        if device_type is None:
+            self.connection.disconnect()
+            return None
+        try:
+            redispatch(
+                self.connection, device_type=device_type, session_prep=session_prep
+            )
+        except Exception:
+            self.connection.disconnect()
+            raise
+        return self.connection
+
+    def _find_best_match(self):
+        """Return the device_type from the cache or else from the probes (or None)."""
+        cached_match = self._cached_match()
+        if cached_match is not None:
+            self.potential_matches[cached_match] = 99
+            return cached_match
+        best_match = self._probe()
+        if best_match is not None and self.autodetect_cache is not None:
+            self.autodetect_cache.set(
+                "ssh",
+                self.connection.host,
+                self.connection.port,
+                best_match,
+                fingerprint=self._fingerprint(),
+                verify=self._verify_string(),
+            )
+        return best_match
+
+    def _cached_match(self):
+        """
+        Return the cached device_type if it is still valid for this device.
+
+        Returns
+        -------
+        device_type : str or None
+            The cached device_type if the host key is unchanged and the prompt (or banner if
+            there is no prompt) matches, otherwise None.
+        """
+        if self.autodetect_cache is None:
+            return None
+        host, port = self.connection.host, self.connection.port
+        entry = self.autodetect_cache.get("ssh", host, port, self._fingerprint())
+        if entry is None:
+            return None
+        device_type, verify = entry
+        if verify == self._verify_string():
+            return device_type
+        self.autodetect_cache.delete("ssh", host, port)
+        return None
+
+    def _fingerprint(self):
+        """Fingerprint of the SSH host key ("" if not available)."""
+        try:
+            transport = self.connection.remote_conn_pre.get_transport()
+            host_key = transport.get_remote_server_key()
+            return f"{host_key.get_name()}:{host_key.get_fingerprint().hex()}"
+        except Exception:
+            return ""
+
+    def _verify_string(self):
+        """The prompt (or a hash of the initial buffer) used to verify a cached result."""
+        if self.prompt:
+            return self.prompt
+        return banner_fingerprint(self.initial_buffer)
+
+    def _probe(self):
+        """Run the SSH_MAPPER_BASE probes and return the best device_type (or None)."""
+        for device_type in self._probe_order():
+            tmp_dict = SSH_MAPPER_BASE[device_type].copy()
             call_method = tmp_dict.pop("dispatch")
             autodetect_method = getattr(self, call_method)
             accuracy = autodetect_method(**tmp_dict)
@@ -240,23 +434,92 @@ class SSHDetect(object):
                     best_match = sorted(
                         self.potential_matches.items(), key=lambda t: t[1], reverse=True
                     )
-                    self.connection.disconnect()
                     return best_match[0][0]
 
         if not self.potential_matches:
-            self.connection.disconnect()
             return None
 
         best_match = sorted(
             self.potential_matches.items(), key=lambda t: t[1], reverse=True
         )
-        self.connection.disconnect()
         return best_match[0][0]
 
+    @staticmethod
+    def _find_prompt(initial_buffer):
+        """
+        Return the last line of the initial buffer if it looks like a prompt.
+
+        Parameters
+        ----------
+        initial_buffer : str
+            The data read from the remote end after the connection was opened.
+
+        Returns
+        -------
+        prompt : str or None
+            The prompt or None if the last line doesn't look like a prompt.
+        """
+        lines = [line.strip() for line in initial_buffer.splitlines() if line.strip()]
+        if lines and PROMPT_TERMINATOR_RE.search(lines[-1]):
+            return lines[-1]
+        return None
+
+    @staticmethod
+    def _score_initial_buffer(initial_buffer):
+        """
+        Score each device_type in SSH_HINTS against the banner/prompt in the initial buffer.
+
+        Parameters
+        ----------
+        initial_buffer : str
+            The data read from the remote end after the connection was opened.
+
+        Returns
+        -------
+        hint_scores : dict
+            Dict of (device_type, score) for the device_types with at least one matching hint.
+        """
+        hint_scores = {}
+        for device_type, hints in SSH_HINTS_RE.items():
+            score = sum(s for pattern, s in hints if pattern.search(initial_buffer))
+            if score:
+                hint_scores[device_type] = score
+        return hint_scores
+
+    def _probe_order(self):
+        """
+        Order the SSH_MAPPER_BASE device_types by likelihood.
+
+        The device_types are sorted by their hint score and then by the number of device_types
+        sharing the same command (the output of a shared command is cached and checked against
+        all of them).
+
+        Returns
+        -------
+        device_types : list
+            The device_types in the order they should be probed.
+        """
+        cmd_count = {}
+        for autodetect_dict in SSH_MAPPER_BASE.values():
+            cmd = autodetect_dict.get("cmd")
+            cmd_count[cmd] = cmd_count.get(cmd, 0) + 1
+        device_types = list(SSH_MAPPER_BASE)
+        return sorted(
+            device_types,
+            key=lambda d: (
+                -self.hint_scores.get(d, 0),
+                -cmd_count[SSH_MAPPER_BASE[d].get("cmd")],
+                device_types.index(d),
+            ),
+        )
+
     def _send_command(self, cmd=""):
         """
         Handle reading/writing channel directly. It is also sanitizing the output received.
 
+        If the prompt is known, reading stops as soon as it is received again. Otherwise (or if
+        the prompt is not received in time), the channel is read until no more data arrives.
+
         Parameters
         ----------
         cmd : str, optional
@@ -268,11 +531,49 @@ class SSHDetect(object):
             The output from the command sent
         """
         self.connection.write_channel(cmd + "\n")
-        time.sleep(1)
-        output = self.connection._read_channel_timing()
+        output, prompt_found = "", False
+        if self.prompt:
+            output, prompt_found = self._read_until_prompt()
+        if not prompt_found:
+            time.sleep(1)
+            output += self.connection._read_channel_timing()
         output = self.connection.strip_backspaces(output)
         return output
 
+    def _read_until_prompt(self, timeout=10, loop_delay=0.05):
+        """
+        Read the channel until the output ends with the prompt (or with a paging prompt such as
+        '--More--', the rest of the output is not sent until a key is pressed).
+
+        Parameters
+        ----------
+        timeout : int, optional
+            Seconds to wait for the prompt, multiplied by the delay factor (default: 10).
+        loop_delay : float, optional
+            Seconds between reads of the channel (default: 0.05).
+
+        Returns
+        -------
+        output : str
+            The data read from the channel.
+        prompt_found : bool
+            Whether the output ends with the prompt or a paging prompt (False if the timeout
+            expired).
+        """
+        delay_factor = self.connection.select_delay_factor(delay_factor=1)
+        prompt_re = re.compile(re.escape(self.prompt) + r"\s*$")
+        deadline = time.time() + timeout * delay_factor
+        output = ""
+        while time.time() < deadline:
+            new_data = self.connection.read_channel()
+            if new_data:
+                output += new_data
+                if prompt_re.search(output) or PAGING_RE.search(output):
+                    return output, True
+            else:
+                time.sleep(loop_delay * delay_factor)
+        return output, False
+
     def _send_command_wrapper(self, cmd):
         """
         Send command to the remote device with a caching feature to avoid sending the same command
@@ -314,28 +615,16 @@ class SSHDetect(object):
         priority: int, optional
             The confidence the match is right between 0 and 99 (default: 99).
         """
-        invalid_responses = [
-            r"% Invalid input detected",
-            r"syntax error, expecting",
-            r"Error: Unrecognized command",
-            r"%Error",
-            r"command not found",
-            r"Syntax Error: unexpected argument",
-        ]
         if not cmd or not search_patterns:
             return 0
         try:
             # _send_command_wrapper will use already cached results if available
             response = self._send_command_wrapper(cmd)
             # Look for error conditions in output
-            for pattern in invalid_responses:
-                match = re.search(pattern, response, flags=re.I)
-                if match:
-                    return 0
-            for pattern in search_patterns:
-                match = re.search(pattern, response, flags=re_flags)
-                if match:
-                    return priority
+            if INVALID_RESPONSES_RE.search(response):
+                return 0
+            if _compile_patterns(tuple(search_patterns), re_flags).search(response):
+                return priority
         except Exception:
             return 0
         return 0
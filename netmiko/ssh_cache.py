@@ -0,0 +1,154 @@
+"""
+Process-wide cache of parsed SSH files.
+
+Parsing the same files again for every connection is expensive in bulk jobs (known_hosts files
+can have tens of thousands of lines and private keys must be decrypted), so the parsed objects
+are shared by all the connections of the process. A cached entry is reused until the
+modification time (or size) of its file changes.
+"""
+import hashlib
+import io
+import os
+import threading
+
+import paramiko
+
+SYSTEM_HOST_KEYS_FILE = "~/.ssh/known_hosts"
+# Tried if SYSTEM_HOST_KEYS_FILE can't be read (the location used on Windows by paramiko)
+WINDOWS_HOST_KEYS_FILE = "~/ssh/known_hosts"
+
+_lock = threading.Lock()
+_key_locks = {}
+_ssh_configs = {}
+_host_keys = {}
+_private_keys = {}
+
+
+def _file_signature(filename):
+    """Return a value that changes when the file is modified."""
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _key_lock(cache, key):
+    with _lock:
+        return _key_locks.setdefault((id(cache), key), threading.Lock())
+
+
+def _cached(cache, key, filename, load):
+    """
+    Return the cached value of key, calling load() if missing or if filename changed.
+
+    Concurrent callers with the same key wait for a single load() call.
+    """
+    with _key_lock(cache, key):
+        signature = _file_signature(filename)
+        with _lock:
+            cached = cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        value = load()
+        with _lock:
+            cache[key] = (signature, value)
+        return value
+
+
+def load_ssh_config(filename):
+    """
+    Return the paramiko.SSHConfig parsed from filename.
+
+    The returned object is shared, it must only be used for lookups.
+
+    :param filename: Path of the OpenSSH configuration file.
+    :type filename: str
+    """
+    full_path = os.path.abspath(os.path.expanduser(filename))
+
+    def load():
+        ssh_config = paramiko.SSHConfig()
+        with io.open(full_path, "rt", encoding="utf-8") as f:
+            ssh_config.parse(f)
+        return ssh_config
+
+    return _cached(_ssh_configs, full_path, full_path, load)
+
+
+def load_host_keys(filename=None):
+    """
+    Return the paramiko.HostKeys parsed from filename.
+
+    The returned object is shared, it must not be modified (see copy_host_keys). If filename is
+    None, the user's known_hosts file is used (SYSTEM_HOST_KEYS_FILE, then
+    WINDOWS_HOST_KEYS_FILE) and an empty HostKeys is returned if it can't be read (like
+    paramiko.SSHClient.load_system_host_keys).
+
+    :param filename: Path of the known_hosts file.
+    :type filename: str
+    """
+    if filename is None:
+        for system_file in (SYSTEM_HOST_KEYS_FILE, WINDOWS_HOST_KEYS_FILE):
+            try:
+                return load_host_keys(system_file)
+            except IOError:
+                continue
+        return paramiko.HostKeys()
+    full_path = os.path.abspath(os.path.expanduser(filename))
+    return _cached(
+        _host_keys, full_path, full_path, lambda: paramiko.HostKeys(full_path)
+    )
+
+
+def copy_host_keys(host_keys):
+    """Return a copy of host_keys that can be modified (without parsing the keys again)."""
+    new_host_keys = paramiko.HostKeys()
+    for entry in host_keys._entries:
+        new_host_keys._entries.append(
+            paramiko.hostkeys.HostKeyEntry(list(entry.hostnames), entry.key)
+        )
+    return new_host_keys
+
+
+def _read_private_key(filename, password):
+    key_classes = [paramiko.RSAKey, paramiko.ECDSAKey, paramiko.Ed25519Key]
+    if hasattr(paramiko, "DSSKey"):
+        key_classes.append(paramiko.DSSKey)
+    for key_class in key_classes:
+        try:
+            return key_class.from_private_key_file(filename, password=password)
+        except paramiko.PasswordRequiredException:
+            raise
+        except paramiko.SSHException:
+            continue
+    raise paramiko.SSHException(f"Unable to load the private key file: {filename}")
+
+
+def load_private_key(filename, password=None):
+    """
+    Return the decrypted paramiko.PKey loaded from the private key file filename.
+
+    Raises IOError if the file can't be read and paramiko.SSHException if it is not a valid
+    private key (or if password is wrong).
+
+    :param filename: Path of the private key file.
+    :type filename: str
+
+    :param password: Password used to decrypt the key (if encrypted).
+    :type password: str
+    """
+    full_path = os.path.abspath(os.path.expanduser(filename))
+    # Don't keep the password itself in the cache keys
+    digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+    return _cached(
+        _private_keys,
+        (full_path, digest),
+        full_path,
+        lambda: _read_private_key(full_path, password),
+    )
+
+
+def clear():
+    """Empty the cache."""
+    with _lock:
+        _ssh_configs.clear()
+        _host_keys.clear()
+        _private_keys.clear()
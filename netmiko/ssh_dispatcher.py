@@ -1,238 +1,219 @@
-"""Controls selection of proper class based on the device type."""
-from netmiko.a10 import A10SSH
-from netmiko.accedian import AccedianSSH
-from netmiko.alcatel import AlcatelAosSSH
-from netmiko.arista import AristaSSH, AristaTelnet
-from netmiko.arista import AristaFileTransfer
-from netmiko.apresia import ApresiaAeosSSH, ApresiaAeosTelnet
-from netmiko.aruba import ArubaSSH
-from netmiko.calix import CalixB6SSH, CalixB6Telnet
-from netmiko.checkpoint import CheckPointGaiaSSH
-from netmiko.ciena import CienaSaosSSH, CienaSaosTelnet, CienaSaosFileTransfer
-from netmiko.cisco import CiscoAsaSSH, CiscoAsaFileTransfer
-from netmiko.cisco import (
-    CiscoIosSSH,
-    CiscoIosFileTransfer,
-    CiscoIosTelnet,
-    CiscoIosSerial,
-)
-from netmiko.cisco import CiscoNxosSSH, CiscoNxosFileTransfer
-from netmiko.cisco import CiscoS300SSH
-from netmiko.cisco import CiscoTpTcCeSSH
-from netmiko.cisco import CiscoWlcSSH
-from netmiko.cisco import CiscoXrSSH, CiscoXrTelnet, CiscoXrFileTransfer
-from netmiko.citrix import NetscalerSSH
-from netmiko.cloudgenix import CloudGenixIonSSH
-from netmiko.coriant import CoriantSSH
-from netmiko.dell import DellDNOS6SSH
-from netmiko.dell import DellDNOS6Telnet
-from netmiko.dell import DellForce10SSH
-from netmiko.dell import DellOS10SSH, DellOS10FileTransfer
-from netmiko.dell import DellPowerConnectSSH
-from netmiko.dell import DellPowerConnectTelnet
-from netmiko.dell import DellIsilonSSH
-from netmiko.eltex import EltexSSH, EltexEsrSSH
-from netmiko.endace import EndaceSSH
-from netmiko.enterasys import EnterasysSSH
-from netmiko.extreme import ExtremeErsSSH
-from netmiko.extreme import ExtremeExosSSH
-from netmiko.extreme import ExtremeExosTelnet
-from netmiko.extreme import ExtremeNetironSSH
-from netmiko.extreme import ExtremeNetironTelnet
-from netmiko.extreme import ExtremeNosSSH
-from netmiko.extreme import ExtremeSlxSSH
-from netmiko.extreme import ExtremeVspSSH
-from netmiko.extreme import ExtremeWingSSH
-from netmiko.f5 import F5TmshSSH
-from netmiko.f5 import F5LinuxSSH
-from netmiko.flexvnf import FlexvnfSSH
-from netmiko.fortinet import FortinetSSH
-from netmiko.hp import HPProcurveSSH, HPProcurveTelnet, HPComwareSSH, HPComwareTelnet
-from netmiko.huawei import HuaweiSSH, HuaweiVrpv8SSH, HuaweiTelnet
-from netmiko.ipinfusion import IpInfusionOcNOSSSH, IpInfusionOcNOSTelnet
-from netmiko.juniper import JuniperSSH, JuniperTelnet, JuniperScreenOsSSH
-from netmiko.juniper import JuniperFileTransfer
-from netmiko.pica8 import pica8SSH, pica8Telnet
-from netmiko.pica8 import pica8FileTransfer
-from netmiko.keymile import KeymileSSH, KeymileNOSSSH
-from netmiko.linux import LinuxSSH, LinuxFileTransfer
-from netmiko.mikrotik import MikrotikRouterOsSSH
-from netmiko.mikrotik import MikrotikSwitchOsSSH
-from netmiko.mellanox import MellanoxMlnxosSSH
-from netmiko.mrv import MrvLxSSH
-from netmiko.mrv import MrvOptiswitchSSH
-from netmiko.netapp import NetAppcDotSSH
-from netmiko.nokia import NokiaSrosSSH
-from netmiko.oneaccess import OneaccessOneOSTelnet, OneaccessOneOSSSH
-from netmiko.ovs import OvsLinuxSSH
-from netmiko.paloalto import PaloAltoPanosSSH
-from netmiko.paloalto import PaloAltoPanosTelnet
-from netmiko.pluribus import PluribusSSH
-from netmiko.quanta import QuantaMeshSSH
-from netmiko.rad import RadETXSSH
-from netmiko.rad import RadETXTelnet
-from netmiko.ruckus import RuckusFastironSSH
-from netmiko.ruckus import RuckusFastironTelnet
-from netmiko.ruijie import RuijieOSSSH, RuijieOSTelnet
-from netmiko.terminal_server import TerminalServerSSH
-from netmiko.terminal_server import TerminalServerTelnet
-from netmiko.ubiquiti import UbiquitiEdgeSSH
-from netmiko.vyos import VyOSSSH
+"""Controls selection of proper class based on the device type.
+
+Driver modules are only imported when a device_type is first used (ConnectHandler, FileTransfer,
+ssh_dispatcher), so importing netmiko or listing the supported platforms does not import all
+of the vendor drivers.
+"""
+from collections.abc import MutableMapping
+import importlib
+
+
+class LazyClassMapper(MutableMapping):
+    """
+    Mapping of device_type to class that imports the driver on first lookup.
+
+    Values are either a class or a (module_name, class_name) tuple that is resolved (and then
+    cached) the first time the entry is accessed. Listing or testing the keys never imports a
+    driver.
+    """
+
+    def __init__(self, entries=None):
+        self._entries = dict(entries or {})
+
+    def __getitem__(self, device_type):
+        value = self._entries[device_type]
+        if isinstance(value, tuple):
+            module_name, class_name = value
+            value = getattr(importlib.import_module(module_name), class_name)
+            self._entries[device_type] = value
+        return value
+
+    def __setitem__(self, device_type, value):
+        self._entries[device_type] = value
+
+    def __delitem__(self, device_type):
+        del self._entries[device_type]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, device_type):
+        return device_type in self._entries
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._entries!r})"
+
+    def raw_items(self):
+        """Return (device_type, value) pairs without importing any drivers."""
+        return self._entries.items()
 
 
 # The keys of this dictionary are the supported device_types
-CLASS_MAPPER_BASE = {
-    "a10": A10SSH,
-    "accedian": AccedianSSH,
-    "alcatel_aos": AlcatelAosSSH,
-    "alcatel_sros": NokiaSrosSSH,
-    "apresia_aeos": ApresiaAeosSSH,
-    "arista_eos": AristaSSH,
-    "aruba_os": ArubaSSH,
-    "avaya_ers": ExtremeErsSSH,
-    "avaya_vsp": ExtremeVspSSH,
-    "brocade_fastiron": RuckusFastironSSH,
-    "brocade_netiron": ExtremeNetironSSH,
-    "brocade_nos": ExtremeNosSSH,
-    "brocade_vdx": ExtremeNosSSH,
-    "brocade_vyos": VyOSSSH,
-    "checkpoint_gaia": CheckPointGaiaSSH,
-    "calix_b6": CalixB6SSH,
-    "ciena_saos": CienaSaosSSH,
-    "cisco_asa": CiscoAsaSSH,
-    "cisco_ios": CiscoIosSSH,
-    "cisco_nxos": CiscoNxosSSH,
-    "cisco_s300": CiscoS300SSH,
-    "cisco_tp": CiscoTpTcCeSSH,
-    "cisco_wlc": CiscoWlcSSH,
-    "cisco_xe": CiscoIosSSH,
-    "cisco_xr": CiscoXrSSH,
-    "cloudgenix_ion": CloudGenixIonSSH,
-    "coriant": CoriantSSH,
-    "dell_dnos9": DellForce10SSH,
-    "dell_force10": DellForce10SSH,
-    "dell_os6": DellDNOS6SSH,
-    "dell_os9": DellForce10SSH,
-    "dell_os10": DellOS10SSH,
-    "dell_powerconnect": DellPowerConnectSSH,
-    "dell_isilon": DellIsilonSSH,
-    "endace": EndaceSSH,
-    "eltex": EltexSSH,
-    "eltex_esr": EltexEsrSSH,
-    "enterasys": EnterasysSSH,
-    "extreme": ExtremeExosSSH,
-    "extreme_ers": ExtremeErsSSH,
-    "extreme_exos": ExtremeExosSSH,
-    "extreme_netiron": ExtremeNetironSSH,
-    "extreme_nos": ExtremeNosSSH,
-    "extreme_slx": ExtremeSlxSSH,
-    "extreme_vdx": ExtremeNosSSH,
-    "extreme_vsp": ExtremeVspSSH,
-    "extreme_wing": ExtremeWingSSH,
-    "f5_ltm": F5TmshSSH,
-    "f5_tmsh": F5TmshSSH,
-    "f5_linux": F5LinuxSSH,
-    "flexvnf": FlexvnfSSH,
-    "fortinet": FortinetSSH,
-    "generic_termserver": TerminalServerSSH,
-    "hp_comware": HPComwareSSH,
-    "hp_procurve": HPProcurveSSH,
-    "huawei": HuaweiSSH,
-    "huawei_vrpv8": HuaweiVrpv8SSH,
-    "ipinfusion_ocnos": IpInfusionOcNOSSSH,
-    "juniper": JuniperSSH,
-    "juniper_junos": JuniperSSH,
-    "pica8": pica8SSH,
-    "pica8_picos": pica8SSH,
-    "juniper_screenos": JuniperScreenOsSSH,
-    "keymile": KeymileSSH,
-    "keymile_nos": KeymileNOSSSH,
-    "linux": LinuxSSH,
-    "mikrotik_routeros": MikrotikRouterOsSSH,
-    "mikrotik_switchos": MikrotikSwitchOsSSH,
-    "mellanox": MellanoxMlnxosSSH,
-    "mellanox_mlnxos": MellanoxMlnxosSSH,
-    "mrv_lx": MrvLxSSH,
-    "mrv_optiswitch": MrvOptiswitchSSH,
-    "netapp_cdot": NetAppcDotSSH,
-    "netscaler": NetscalerSSH,
-    "nokia_sros": NokiaSrosSSH,
-    "oneaccess_oneos": OneaccessOneOSSSH,
-    "ovs_linux": OvsLinuxSSH,
-    "paloalto_panos": PaloAltoPanosSSH,
-    "pluribus": PluribusSSH,
-    "quanta_mesh": QuantaMeshSSH,
-    "rad_etx": RadETXSSH,
-    "ruckus_fastiron": RuckusFastironSSH,
-    "ruijie_os": RuijieOSSSH,
-    "ubiquiti_edge": UbiquitiEdgeSSH,
-    "ubiquiti_edgeswitch": UbiquitiEdgeSSH,
-    "vyatta_vyos": VyOSSSH,
-    "vyos": VyOSSSH,
-}
+CLASS_MAPPER_BASE = LazyClassMapper(
+    {
+        "a10": ("netmiko.a10", "A10SSH"),
+        "accedian": ("netmiko.accedian", "AccedianSSH"),
+        "alcatel_aos": ("netmiko.alcatel", "AlcatelAosSSH"),
+        "alcatel_sros": ("netmiko.nokia", "NokiaSrosSSH"),
+        "apresia_aeos": ("netmiko.apresia", "ApresiaAeosSSH"),
+        "arista_eos": ("netmiko.arista", "AristaSSH"),
+        "aruba_os": ("netmiko.aruba", "ArubaSSH"),
+        "avaya_ers": ("netmiko.extreme", "ExtremeErsSSH"),
+        "avaya_vsp": ("netmiko.extreme", "ExtremeVspSSH"),
+        "brocade_fastiron": ("netmiko.ruckus", "RuckusFastironSSH"),
+        "brocade_netiron": ("netmiko.extreme", "ExtremeNetironSSH"),
+        "brocade_nos": ("netmiko.extreme", "ExtremeNosSSH"),
+        "brocade_vdx": ("netmiko.extreme", "ExtremeNosSSH"),
+        "brocade_vyos": ("netmiko.vyos", "VyOSSSH"),
+        "checkpoint_gaia": ("netmiko.checkpoint", "CheckPointGaiaSSH"),
+        "calix_b6": ("netmiko.calix", "CalixB6SSH"),
+        "ciena_saos": ("netmiko.ciena", "CienaSaosSSH"),
+        "cisco_asa": ("netmiko.cisco", "CiscoAsaSSH"),
+        "cisco_ios": ("netmiko.cisco", "CiscoIosSSH"),
+        "cisco_nxos": ("netmiko.cisco", "CiscoNxosSSH"),
+        "cisco_s300": ("netmiko.cisco", "CiscoS300SSH"),
+        "cisco_tp": ("netmiko.cisco", "CiscoTpTcCeSSH"),
+        "cisco_wlc": ("netmiko.cisco", "CiscoWlcSSH"),
+        "cisco_xe": ("netmiko.cisco", "CiscoIosSSH"),
+        "cisco_xr": ("netmiko.cisco", "CiscoXrSSH"),
+        "cloudgenix_ion": ("netmiko.cloudgenix", "CloudGenixIonSSH"),
+        "coriant": ("netmiko.coriant", "CoriantSSH"),
+        "dell_dnos9": ("netmiko.dell", "DellForce10SSH"),
+        "dell_force10": ("netmiko.dell", "DellForce10SSH"),
+        "dell_os6": ("netmiko.dell", "DellDNOS6SSH"),
+        "dell_os9": ("netmiko.dell", "DellForce10SSH"),
+        "dell_os10": ("netmiko.dell", "DellOS10SSH"),
+        "dell_powerconnect": ("netmiko.dell", "DellPowerConnectSSH"),
+        "dell_isilon": ("netmiko.dell", "DellIsilonSSH"),
+        "endace": ("netmiko.endace", "EndaceSSH"),
+        "eltex": ("netmiko.eltex", "EltexSSH"),
+        "eltex_esr": ("netmiko.eltex", "EltexEsrSSH"),
+        "enterasys": ("netmiko.enterasys", "EnterasysSSH"),
+        "extreme": ("netmiko.extreme", "ExtremeExosSSH"),
+        "extreme_ers": ("netmiko.extreme", "ExtremeErsSSH"),
+        "extreme_exos": ("netmiko.extreme", "ExtremeExosSSH"),
+        "extreme_netiron": ("netmiko.extreme", "ExtremeNetironSSH"),
+        "extreme_nos": ("netmiko.extreme", "ExtremeNosSSH"),
+        "extreme_slx": ("netmiko.extreme", "ExtremeSlxSSH"),
+        "extreme_vdx": ("netmiko.extreme", "ExtremeNosSSH"),
+        "extreme_vsp": ("netmiko.extreme", "ExtremeVspSSH"),
+        "extreme_wing": ("netmiko.extreme", "ExtremeWingSSH"),
+        "f5_ltm": ("netmiko.f5", "F5TmshSSH"),
+        "f5_tmsh": ("netmiko.f5", "F5TmshSSH"),
+        "f5_linux": ("netmiko.f5", "F5LinuxSSH"),
+        "flexvnf": ("netmiko.flexvnf", "FlexvnfSSH"),
+        "fortinet": ("netmiko.fortinet", "FortinetSSH"),
+        "generic_termserver": ("netmiko.terminal_server", "TerminalServerSSH"),
+        "hp_comware": ("netmiko.hp", "HPComwareSSH"),
+        "hp_procurve": ("netmiko.hp", "HPProcurveSSH"),
+        "huawei": ("netmiko.huawei", "HuaweiSSH"),
+        "huawei_vrpv8": ("netmiko.huawei", "HuaweiVrpv8SSH"),
+        "ipinfusion_ocnos": ("netmiko.ipinfusion", "IpInfusionOcNOSSSH"),
+        "juniper": ("netmiko.juniper", "JuniperSSH"),
+        "juniper_junos": ("netmiko.juniper", "JuniperSSH"),
+        "pica8": ("netmiko.pica8", "pica8SSH"),
+        "pica8_picos": ("netmiko.pica8", "pica8SSH"),
+        "juniper_screenos": ("netmiko.juniper", "JuniperScreenOsSSH"),
+        "keymile": ("netmiko.keymile", "KeymileSSH"),
+        "keymile_nos": ("netmiko.keymile", "KeymileNOSSSH"),
+        "linux": ("netmiko.linux", "LinuxSSH"),
+        "mikrotik_routeros": ("netmiko.mikrotik", "MikrotikRouterOsSSH"),
+        "mikrotik_switchos": ("netmiko.mikrotik", "MikrotikSwitchOsSSH"),
+        "mellanox": ("netmiko.mellanox", "MellanoxMlnxosSSH"),
+        "mellanox_mlnxos": ("netmiko.mellanox", "MellanoxMlnxosSSH"),
+        "mrv_lx": ("netmiko.mrv", "MrvLxSSH"),
+        "mrv_optiswitch": ("netmiko.mrv", "MrvOptiswitchSSH"),
+        "netapp_cdot": ("netmiko.netapp", "NetAppcDotSSH"),
+        "netscaler": ("netmiko.citrix", "NetscalerSSH"),
+        "nokia_sros": ("netmiko.nokia", "NokiaSrosSSH"),
+        "oneaccess_oneos": ("netmiko.oneaccess", "OneaccessOneOSSSH"),
+        "ovs_linux": ("netmiko.ovs", "OvsLinuxSSH"),
+        "paloalto_panos": ("netmiko.paloalto", "PaloAltoPanosSSH"),
+        "pluribus": ("netmiko.pluribus", "PluribusSSH"),
+        "quanta_mesh": ("netmiko.quanta", "QuantaMeshSSH"),
+        "rad_etx": ("netmiko.rad", "RadETXSSH"),
+        "ruckus_fastiron": ("netmiko.ruckus", "RuckusFastironSSH"),
+        "ruijie_os": ("netmiko.ruijie", "RuijieOSSSH"),
+        "ubiquiti_edge": ("netmiko.ubiquiti", "UbiquitiEdgeSSH"),
+        "ubiquiti_edgeswitch": ("netmiko.ubiquiti", "UbiquitiEdgeSSH"),
+        "vyatta_vyos": ("netmiko.vyos", "VyOSSSH"),
+        "vyos": ("netmiko.vyos", "VyOSSSH"),
+    }
+)
 
-FILE_TRANSFER_MAP = {
-    "arista_eos": AristaFileTransfer,
-    "ciena_saos": CienaSaosFileTransfer,
-    "cisco_asa": CiscoAsaFileTransfer,
-    "cisco_ios": CiscoIosFileTransfer,
-    "cisco_nxos": CiscoNxosFileTransfer,
-    "cisco_xe": CiscoIosFileTransfer,
-    "cisco_xr": CiscoXrFileTransfer,
-    "dell_os10": DellOS10FileTransfer,
-    "juniper_junos": JuniperFileTransfer,
-    "pica8_picos": pica8FileTransfer,
-    "linux": LinuxFileTransfer,
-}
+FILE_TRANSFER_MAP = LazyClassMapper(
+    {
+        "arista_eos": ("netmiko.arista", "AristaFileTransfer"),
+        "ciena_saos": ("netmiko.ciena", "CienaSaosFileTransfer"),
+        "cisco_asa": ("netmiko.cisco", "CiscoAsaFileTransfer"),
+        "cisco_ios": ("netmiko.cisco", "CiscoIosFileTransfer"),
+        "cisco_nxos": ("netmiko.cisco", "CiscoNxosFileTransfer"),
+        "cisco_xe": ("netmiko.cisco", "CiscoIosFileTransfer"),
+        "cisco_xr": ("netmiko.cisco", "CiscoXrFileTransfer"),
+        "dell_os10": ("netmiko.dell", "DellOS10FileTransfer"),
+        "juniper_junos": ("netmiko.juniper", "JuniperFileTransfer"),
+        "pica8_picos": ("netmiko.pica8", "pica8FileTransfer"),
+        "linux": ("netmiko.linux", "LinuxFileTransfer"),
+    }
+)
 
 # Also support keys that end in _ssh
-new_mapper = {}
-for k, v in CLASS_MAPPER_BASE.items():
+new_mapper = LazyClassMapper()
+for k, v in CLASS_MAPPER_BASE.raw_items():
     new_mapper[k] = v
     alt_key = k + "_ssh"
     new_mapper[alt_key] = v
 CLASS_MAPPER = new_mapper
 
-new_mapper = {}
-for k, v in FILE_TRANSFER_MAP.items():
+new_mapper = LazyClassMapper()
+for k, v in FILE_TRANSFER_MAP.raw_items():
     new_mapper[k] = v
     alt_key = k + "_ssh"
     new_mapper[alt_key] = v
 FILE_TRANSFER_MAP = new_mapper
 
 # Add telnet drivers
-CLASS_MAPPER["apresia_aeos_telnet"] = ApresiaAeosTelnet
-CLASS_MAPPER["arista_eos_telnet"] = AristaTelnet
-CLASS_MAPPER["brocade_fastiron_telnet"] = RuckusFastironTelnet
-CLASS_MAPPER["brocade_netiron_telnet"] = ExtremeNetironTelnet
-CLASS_MAPPER["calix_b6_telnet"] = CalixB6Telnet
-CLASS_MAPPER["ciena_saos_telnet"] = CienaSaosTelnet
-CLASS_MAPPER["cisco_ios_telnet"] = CiscoIosTelnet
-CLASS_MAPPER["cisco_xr_telnet"] = CiscoXrTelnet
-CLASS_MAPPER["dell_dnos6_telnet"] = DellDNOS6Telnet
-CLASS_MAPPER["dell_powerconnect_telnet"] = DellPowerConnectTelnet
-CLASS_MAPPER["extreme_telnet"] = ExtremeExosTelnet
-CLASS_MAPPER["extreme_exos_telnet"] = ExtremeExosTelnet
-CLASS_MAPPER["extreme_netiron_telnet"] = ExtremeNetironTelnet
-CLASS_MAPPER["generic_termserver_telnet"] = TerminalServerTelnet
-CLASS_MAPPER["hp_procurve_telnet"] = HPProcurveTelnet
-CLASS_MAPPER["hp_comware_telnet"] = HPComwareTelnet
-CLASS_MAPPER["huawei_telnet"] = HuaweiTelnet
-CLASS_MAPPER["ipinfusion_ocnos_telnet"] = IpInfusionOcNOSTelnet
-CLASS_MAPPER["juniper_junos_telnet"] = JuniperTelnet
-CLASS_MAPPER["pica8_picos_telnet"] = pica8Telnet
-CLASS_MAPPER["paloalto_panos_telnet"] = PaloAltoPanosTelnet
-CLASS_MAPPER["oneaccess_oneos_telnet"] = OneaccessOneOSTelnet
-CLASS_MAPPER["rad_etx_telnet"] = RadETXTelnet
-CLASS_MAPPER["ruckus_fastiron_telnet"] = RuckusFastironTelnet
-CLASS_MAPPER["ruijie_os_telnet"] = RuijieOSTelnet
+CLASS_MAPPER["apresia_aeos_telnet"] = ("netmiko.apresia", "ApresiaAeosTelnet")
+CLASS_MAPPER["arista_eos_telnet"] = ("netmiko.arista", "AristaTelnet")
+CLASS_MAPPER["brocade_fastiron_telnet"] = ("netmiko.ruckus", "RuckusFastironTelnet")
+CLASS_MAPPER["brocade_netiron_telnet"] = ("netmiko.extreme", "ExtremeNetironTelnet")
+CLASS_MAPPER["calix_b6_telnet"] = ("netmiko.calix", "CalixB6Telnet")
+CLASS_MAPPER["ciena_saos_telnet"] = ("netmiko.ciena", "CienaSaosTelnet")
+CLASS_MAPPER["cisco_ios_telnet"] = ("netmiko.cisco", "CiscoIosTelnet")
+CLASS_MAPPER["cisco_xr_telnet"] = ("netmiko.cisco", "CiscoXrTelnet")
+CLASS_MAPPER["dell_dnos6_telnet"] = ("netmiko.dell", "DellDNOS6Telnet")
+CLASS_MAPPER["dell_powerconnect_telnet"] = ("netmiko.dell", "DellPowerConnectTelnet")
+CLASS_MAPPER["extreme_telnet"] = ("netmiko.extreme", "ExtremeExosTelnet")
+CLASS_MAPPER["extreme_exos_telnet"] = ("netmiko.extreme", "ExtremeExosTelnet")
+CLASS_MAPPER["extreme_netiron_telnet"] = ("netmiko.extreme", "ExtremeNetironTelnet")
+CLASS_MAPPER["generic_termserver_telnet"] = (
+    "netmiko.terminal_server",
+    "TerminalServerTelnet",
+)
+CLASS_MAPPER["hp_procurve_telnet"] = ("netmiko.hp", "HPProcurveTelnet")
+CLASS_MAPPER["hp_comware_telnet"] = ("netmiko.hp", "HPComwareTelnet")
+CLASS_MAPPER["huawei_telnet"] = ("netmiko.huawei", "HuaweiTelnet")
+CLASS_MAPPER["ipinfusion_ocnos_telnet"] = (
+    "netmiko.ipinfusion",
+    "IpInfusionOcNOSTelnet",
+)
+CLASS_MAPPER["juniper_junos_telnet"] = ("netmiko.juniper", "JuniperTelnet")
+CLASS_MAPPER["pica8_picos_telnet"] = ("netmiko.pica8", "pica8Telnet")
+CLASS_MAPPER["paloalto_panos_telnet"] = ("netmiko.paloalto", "PaloAltoPanosTelnet")
+CLASS_MAPPER["oneaccess_oneos_telnet"] = ("netmiko.oneaccess", "OneaccessOneOSTelnet")
+CLASS_MAPPER["rad_etx_telnet"] = ("netmiko.rad", "RadETXTelnet")
+CLASS_MAPPER["ruckus_fastiron_telnet"] = ("netmiko.ruckus", "RuckusFastironTelnet")
+CLASS_MAPPER["ruijie_os_telnet"] = ("netmiko.ruijie", "RuijieOSTelnet")
 
 # Add serial drivers
-CLASS_MAPPER["cisco_ios_serial"] = CiscoIosSerial
+CLASS_MAPPER["cisco_ios_serial"] = ("netmiko.cisco", "CiscoIosSerial")
 
 # Add general terminal_server driver and autodetect
-CLASS_MAPPER["terminal_server"] = TerminalServerSSH
-CLASS_MAPPER["autodetect"] = TerminalServerSSH
+CLASS_MAPPER["terminal_server"] = ("netmiko.terminal_server", "TerminalServerSSH")
+CLASS_MAPPER["autodetect"] = ("netmiko.terminal_server", "TerminalServerSSH")
 
 platforms = list(CLASS_MAPPER.keys())
 platforms.sort()
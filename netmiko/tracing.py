@@ -0,0 +1,405 @@
+"""
+Trace spans of Netmiko connections, in the OpenTelemetry (OTLP/JSON) format.
+
+Spans are emitted for the connection establishment (with a child span for each phase of
+connect_timings, session_preparation included), each command (send_command, send_command_timing,
+send_command_exec and send_config_set, with a child span for each phase of the command), file
+transfers and disconnect. They carry the device_type, host and port of the connection, and the
+command for the command spans.
+
+The spans are logged, at DEBUG level, to the 'netmiko.trace' logger (a child of the netmiko
+logger) with the span in the 'span' attribute of the log record. Tracing is disabled, and costs
+one isEnabledFor() call per operation, unless that logger's level is lowered to DEBUG (by
+enable_tracing()): its level is WARNING, so enabling debug logging (for example with
+logging.basicConfig(level=logging.DEBUG)) doesn't enable tracing. The exporters are
+logging handlers: JSONLinesExporter writes each span as an OTLP/JSON line (which the OpenTelemetry
+collector's otlpjsonfile receiver can read) and SinkHandler passes the Span objects to a callable.
+
+The spans of a connection share a trace ID; spans started with the span() context manager (for
+example around a job) become the parent of the spans created in their thread.
+
+Example:
+------------------
+from netmiko import ConnectHandler
+from netmiko import tracing
+
+exporter = tracing.enable_tracing(path="netmiko_spans.jsonl")
+with tracing.span("backup", site="paris"):
+    with ConnectHandler(**device) as net_connect:
+        net_connect.send_command("show running-config")
+tracing.disable_tracing(exporter)
+------------------
+"""
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from netmiko import log
+
+trace_log = log.getChild("trace")
+trace_log.setLevel(logging.WARNING)
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_local = threading.local()
+_connection_trace_ids = weakref.WeakKeyDictionary()
+
+
+def enabled():
+    """Return True when the spans are emitted (the netmiko.trace logger is enabled for DEBUG)."""
+    return trace_log.isEnabledFor(logging.DEBUG)
+
+
+def _now_ns():
+    # time.time_ns() requires Python 3.7
+    return int(time.time() * 1e9)
+
+
+def _new_id(size):
+    return os.urandom(size).hex()
+
+
+def _span_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def current_span():
+    """Return the innermost span started (and not ended) in this thread, or None."""
+    stack = _span_stack()
+    return stack[-1] if stack else None
+
+
+def connection_attributes(connection):
+    """Return the span attributes identifying a connection."""
+    return {
+        "device_type": getattr(connection, "device_type", None),
+        "host": getattr(connection, "host", None),
+        "port": getattr(connection, "port", None),
+    }
+
+
+def _attribute_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_attribute_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes):
+    return [
+        {"key": key, "value": _attribute_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class Span(object):
+    """
+    A timed operation.
+
+    start_ns and end_ns are epoch times in nanoseconds (end_ns is None until end() is called),
+    status is STATUS_UNSET, STATUS_OK or STATUS_ERROR.
+    """
+
+    def __init__(self, name, trace_id, parent_id=None, attributes=None, start_ns=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_ns = _now_ns() if start_ns is None else start_ns
+        self.end_ns = None
+        self.status = STATUS_UNSET
+        self.exception = None
+
+    @property
+    def duration(self):
+        """Duration in seconds (None until the span is ended)."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def end(self, exception=None, end_ns=None):
+        """Record the end of the span (failed if exception is set)."""
+        self.end_ns = _now_ns() if end_ns is None else end_ns
+        if exception is not None:
+            self.exception = exception
+            self.status = STATUS_ERROR
+        else:
+            self.status = STATUS_OK
+
+    def to_otlp(self):
+        """Return the span as an OTLP/JSON dict."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.exception is not None:
+            message = str(self.exception)
+            span["status"]["message"] = message
+            span["events"] = [
+                {
+                    "name": "exception",
+                    "timeUnixNano": str(self.end_ns),
+                    "attributes": _otlp_attributes(
+                        {
+                            "exception.type": type(self.exception).__name__,
+                            "exception.message": message,
+                        }
+                    ),
+                }
+            ]
+        return span
+
+    def __repr__(self):
+        return f"Span({self.name!r}, trace_id={self.trace_id}, span_id={self.span_id})"
+
+
+def start_span(name, connection=None, attributes=None):
+    """
+    Start a span, child of the current span of the thread, and make it the current span.
+
+    Without a current span, the spans of a connection share the connection's trace ID.
+
+    :param name: Name of the span.
+    :type name: str
+
+    :param connection: Connection the span is about (its attributes are added).
+    :type connection: BaseConnection
+
+    :param attributes: Attributes of the span.
+    :type attributes: dict
+    """
+    span_attributes = connection_attributes(connection) if connection else {}
+    span_attributes.update(attributes or {})
+    parent = current_span()
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    elif connection is not None:
+        trace_id = _connection_trace_ids.get(connection)
+        if trace_id is None:
+            trace_id = _connection_trace_ids[connection] = _new_id(16)
+        parent_id = None
+    else:
+        trace_id, parent_id = _new_id(16), None
+    span = Span(name, trace_id, parent_id, span_attributes)
+    _span_stack().append(span)
+    return span
+
+
+def end_span(span, timings=None, exception=None):
+    """
+    End a span started with start_span() and emit it.
+
+    :param span: The span.
+    :type span: Span
+
+    :param timings: Phases of the operation, emitted as child spans.
+    :type timings: PhaseTimings
+
+    :param exception: Exception raised by the operation (if any).
+    :type exception: Exception
+    """
+    stack = _span_stack()
+    if span in stack:
+        stack.remove(span)
+    span.end(exception)
+    if timings is not None:
+        _emit_phases(span, timings)
+    emit(span)
+
+
+def _emit_phases(span, timings):
+    """Emit a child span for each phase of timings (nested phases are named 'parent.child')."""
+    start_ns = int(timings.start * 1e9)
+    span_ids = {}
+    for name, seconds in timings.phases.items():
+        parent_name, _, short_name = name.rpartition(".")
+        offset = timings.offsets.get(name, 0.0)
+        phase_start = start_ns + int(offset * 1e9)
+        phase = Span(
+            short_name,
+            span.trace_id,
+            span_ids.get(parent_name, span.span_id),
+            start_ns=phase_start,
+        )
+        phase.end(end_ns=phase_start + int(seconds * 1e9))
+        span_ids[name] = phase.span_id
+        emit(phase)
+
+
+def emit(span):
+    """Log the span to the netmiko.trace logger."""
+    trace_log.debug(
+        "span %s %.6fs", span.name, span.duration or 0.0, extra={"span": span}
+    )
+
+
+@contextmanager
+def span(name, connection=None, **attributes):
+    """
+    Context manager tracing the enclosed block (yields the Span, or None if tracing is disabled).
+
+    :param name: Name of the span.
+    :type name: str
+
+    :param connection: Connection the span is about (its attributes are added).
+    :type connection: BaseConnection
+
+    :param attributes: Attributes of the span.
+    """
+    if not enabled():
+        yield None
+        return
+    current = start_span(name, connection, attributes)
+    try:
+        yield current
+    except BaseException as e:
+        end_span(current, exception=e)
+        raise
+    end_span(current)
+
+
+def otlp_request(spans, service_name="netmiko"):
+    """Return an OTLP/JSON ExportTraceServiceRequest dict for the spans."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "netmiko"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class JSONLinesExporter(logging.Handler):
+    """
+    Logging handler writing each span as a line of OTLP/JSON.
+
+    :param path: File the spans are appended to (ignored if stream is set).
+    :type path: str
+
+    :param stream: Stream the spans are written to.
+    :type stream: file
+
+    :param service_name: service.name attribute of the resource (default: 'netmiko').
+    :type service_name: str
+    """
+
+    def __init__(self, path=None, stream=None, service_name="netmiko"):
+        super().__init__(logging.DEBUG)
+        if stream is None and path is None:
+            raise ValueError("Either path or stream must be set")
+        self.service_name = service_name
+        self._owns_stream = stream is None
+        if stream is None:
+            stream = open(os.path.expanduser(path), "a", encoding="utf-8")
+        self.stream = stream
+
+    def emit(self, record):
+        span = getattr(record, "span", None)
+        if span is None:
+            return
+        try:
+            line = json.dumps(otlp_request([span], self.service_name))
+            self.stream.write(line + "\n")
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._owns_stream and not self.stream.closed:
+                self.stream.close()
+        finally:
+            self.release()
+        super().close()
+
+
+class SinkHandler(logging.Handler):
+    """
+    Logging handler passing each span to a callable (for example an OpenTelemetry bridge).
+
+    :param sink: Called with each Span.
+    :type sink: callable
+    """
+
+    def __init__(self, sink):
+        super().__init__(logging.DEBUG)
+        self.sink = sink
+
+    def emit(self, record):
+        span = getattr(record, "span", None)
+        if span is None:
+            return
+        try:
+            self.sink(span)
+        except Exception:
+            self.handleError(record)
+
+
+def enable_tracing(path=None, sink=None, stream=None):
+    """
+    Enable the spans and add an exporter (JSONLinesExporter, or SinkHandler if sink is set).
+
+    Returns the exporter, to pass to disable_tracing().
+
+    :param path: File the spans are appended to as JSON lines.
+    :type path: str
+
+    :param sink: Called with each Span.
+    :type sink: callable
+
+    :param stream: Stream the spans are written to as JSON lines.
+    :type stream: file
+    """
+    if sink is not None:
+        handler = SinkHandler(sink)
+    else:
+        handler = JSONLinesExporter(path=path, stream=stream)
+    trace_log.addHandler(handler)
+    trace_log.setLevel(logging.DEBUG)
+    return handler
+
+
+def disable_tracing(handler=None):
+    """
+    Remove (and close) an exporter added by enable_tracing(); tracing is disabled once the
+    netmiko.trace logger has no handler left.
+    """
+    if handler is not None:
+        trace_log.removeHandler(handler)
+        handler.close()
+    if not trace_log.handlers:
+        trace_log.setLevel(logging.WARNING)
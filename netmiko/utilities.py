@@ -1,21 +1,23 @@
 """Miscellaneous utility functions."""
+from collections import OrderedDict
 from glob import glob
+from functools import lru_cache
+import copy
+import hashlib
 import sys
 import io
 import os
 from pathlib import Path
-import serial.tools.list_ports
+import threading
+import textfsm
 from netmiko._textfsm import _clitable as clitable
 from netmiko._textfsm._clitable import CliTableError
 
-try:
-    from genie.conf.base import Device
-    from genie.libs.parser.utils import get_parser
-    from pyats.datastructures import AttrDict
-
-    GENIE_INSTALLED = True
-except ImportError:
-    GENIE_INSTALLED = False
+# Genie and PyATS are imported on first use (importing them adds seconds to 'import netmiko').
+_GENIE = None
+_GENIE_LOCK = threading.Lock()
+# One Genie Device object per Genie OS (the device abstraction is expensive to set up)
+_GENIE_DEVICES = {}
 
 # Dictionary mapping 'show run' for vendors with different command
 SHOW_RUN_MAPPER = {
@@ -197,6 +199,8 @@ def write_bytes(out_data, encoding="ascii"):
 
 def check_serial_port(name):
     """returns valid COM Port."""
+    import serial.tools.list_ports
+
     try:
         cdc = next(serial.tools.list_ports.grep(name))
         return cdc[0]
@@ -258,17 +262,136 @@ def _textfsm_parse(textfsm_obj, raw_output, attrs, template_file=None):
         return raw_output
 
 
-def get_structured_data(raw_output, platform=None, command=None, template=None):
+def _textfsm_attrs(platform=None, command=None):
+    """Build the CliTable index attributes for platform/command."""
+    if platform is None or command is None:
+        return {}
+    return {"Command": command, "Platform": platform}
+
+
+class StructuredDataCache(object):
+    """
+    LRU cache of parsed (structured) output.
+
+    Entries are keyed by the template (or platform/command) and a hash of the raw output, so
+    byte-identical output (from many devices or from repeated polling) is only parsed once.
+
+    :param maxsize: Maximum number of cached entries; least recently used entries are evicted.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("StructuredDataCache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    @staticmethod
+    def make_key(raw_output, platform=None, command=None, template=None):
+        """Build the cache key for raw_output."""
+        if template is not None:
+            parser_key = ("template", os.path.abspath(os.path.expanduser(template)))
+        else:
+            # The selected template depends on which ntc-templates directory is in use.
+            parser_key = ("index", os.environ.get("NET_TEXTFSM"), platform, command)
+        digest = hashlib.sha1(raw_output.encode("utf-8", "ignore")).hexdigest()
+        return parser_key + (digest,)
+
+    def get(self, key, default=None):
+        """Return a copy of the cached entry (callers are free to modify it)."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = copy.deepcopy(value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Return the cache counters as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+_CACHE_MISS = object()
+
+# Process-wide cache used by get_structured_data (disabled unless enabled explicitly)
+STRUCTURED_DATA_CACHE = None
+
+
+def enable_structured_data_cache(maxsize=1024):
+    """Enable the get_structured_data result cache. Returns the StructuredDataCache object."""
+    global STRUCTURED_DATA_CACHE
+    STRUCTURED_DATA_CACHE = StructuredDataCache(maxsize=maxsize)
+    return STRUCTURED_DATA_CACHE
+
+
+def disable_structured_data_cache():
+    """Disable (and discard) the get_structured_data result cache."""
+    global STRUCTURED_DATA_CACHE
+    STRUCTURED_DATA_CACHE = None
+
+
+def get_structured_data(
+    raw_output, platform=None, command=None, template=None, cache=None
+):
     """
     Convert raw CLI output to structured data using TextFSM template.
 
     You can use a straight TextFSM file i.e. specify "template". If no template is specified,
     then you must use an CliTable index file.
+
+    If a StructuredDataCache is passed in (or enabled using enable_structured_data_cache), output
+    that has already been parsed with the same template is returned from the cache.
     """
-    if platform is None or command is None:
-        attrs = {}
-    else:
-        attrs = {"Command": command, "Platform": platform}
+    if cache is None:
+        cache = STRUCTURED_DATA_CACHE
+    if cache is None:
+        return _get_structured_data(raw_output, platform, command, template)
+
+    key = cache.make_key(
+        raw_output, platform=platform, command=command, template=template
+    )
+    structured_output = cache.get(key, default=_CACHE_MISS)
+    if structured_output is _CACHE_MISS:
+        structured_output = _get_structured_data(
+            raw_output, platform, command, template
+        )
+        cache.set(key, structured_output)
+    return structured_output
+
+
+def _get_structured_data(raw_output, platform=None, command=None, template=None):
+    """Convert raw CLI output to structured data using TextFSM template (uncached)."""
+    attrs = _textfsm_attrs(platform=platform, command=command)
 
     if template is None:
         if attrs == {}:
@@ -290,19 +413,176 @@ def get_structured_data(raw_output, platform=None, command=None, template=None):
         )
 
 
-def get_structured_data_genie(raw_output, platform, command):
-    if not sys.version_info >= (3, 4):
-        raise ValueError("Genie requires Python >= 3.4")
+def get_textfsm_templates(platform=None, command=None, template=None):
+    """
+    Return the list of TextFSM template files that get_structured_data would use.
 
-    if not GENIE_INSTALLED:
-        msg = (
-            "\nGenie and PyATS are not installed. Please PIP install both Genie and PyATS:\n"
-            "pip install genie\npip install pyats\n"
+    Uses the same selection rules as get_structured_data: either an explicit "template" or a
+    lookup of platform/command in the ntc-templates CliTable index.
+
+    Raises CliTableError if no template matches.
+    """
+    attrs = _textfsm_attrs(platform=platform, command=command)
+
+    if template is not None:
+        return [os.path.expanduser(template)]
+    if attrs == {}:
+        raise ValueError("Either 'platform/command' or 'template' must be specified.")
+
+    template_dir = get_template_dir()
+    index_file = os.path.join(template_dir, "index")
+    textfsm_obj = clitable.CliTable(index_file, template_dir)
+    row_idx = textfsm_obj.index.GetRowMatch(attrs)
+    if not row_idx:
+        raise CliTableError(f'No template found for attributes: "{attrs}"')
+    templates = textfsm_obj.index.index[row_idx]["Template"]
+    return [os.path.join(template_dir, tmplt) for tmplt in templates.split(":")]
+
+
+class TextFSMStreamParser(object):
+    """
+    Incremental TextFSM parser.
+
+    Text is fed in as it arrives (chunks do not need to be line aligned) and each record is
+    returned as soon as the template's Record action fires, so parsing overlaps with device I/O
+    and only the current partial line is held in memory.
+
+    Template selection follows get_structured_data. Index entries that combine multiple
+    templates (merged on their Key values) cannot be parsed incrementally; those fall back to
+    buffering the output and parsing it with CliTable when the stream is closed. So do the
+    templates with Fillup values, which TextFSM backfills into the records already emitted.
+
+    Raises CliTableError (on init) if no template matches.
+    """
+
+    def __init__(self, platform=None, command=None, template=None):
+        self.platform = platform
+        self.command = command
+        self.template_files = get_textfsm_templates(
+            platform=platform, command=command, template=template
         )
-        raise ValueError(msg)
+        self._partial = ""
+        self._buffered = [] if len(self.template_files) > 1 else None
+        self._done = False
+        self.fsm = None
+        self.header = []
+        if self._buffered is None:
+            with io.open(self.template_files[0], "rt", encoding="utf-8") as f:
+                self.fsm = textfsm.TextFSM(f)
+            self.header = [value.lower() for value in self.fsm.header]
+            if any("Fillup" in value.OptionNames() for value in self.fsm.values):
+                self._buffered = []
+
+    def _records_to_dict(self, records):
+        return [dict(zip(self.header, record)) for record in records]
+
+    def _parse_lines(self, text, eof=False):
+        """Run text through the FSM and pop any records that were emitted."""
+        if self._done:
+            return []
+        result = self.fsm.ParseText(text, eof=eof)
+        records = self._records_to_dict(result)
+        # ParseText returns the FSM's own result list; drain it to bound memory.
+        del result[:]
+        # A template '-> End' (or '-> EOF') action stops all further processing of the output.
+        if getattr(self.fsm, "_cur_state_name", None) in ("End", "EOF"):
+            self._done = True
+        return records
+
+    def feed(self, data):
+        """Feed a chunk of output. Returns the list of records completed by this chunk."""
+        if self._buffered is not None:
+            self._buffered.append(data)
+            return []
+        data = self._partial + data
+        lines = data.split("\n")
+        self._partial = lines.pop()
+        if not lines:
+            return []
+        return self._parse_lines("\n".join(lines))
+
+    def close(self):
+        """Flush any partial line and trigger EOF processing. Returns the final records."""
+        if self._buffered is not None:
+            raw_output = "".join(self._buffered)
+            self._buffered = []
+            template_dir = os.path.dirname(self.template_files[0])
+            templates = ":".join(os.path.basename(t) for t in self.template_files)
+            textfsm_obj = clitable.CliTable(template_dir=template_dir)
+            textfsm_obj.ParseCmd(raw_output, templates=templates)
+            return clitable_to_dict(textfsm_obj)
+        records = []
+        if self._partial:
+            records += self._parse_lines(self._partial)
+            self._partial = ""
+        records += self._parse_lines("", eof=True)
+        self._done = True
+        return records
+
+
+def get_structured_data_stream(chunks, platform=None, command=None, template=None):
+    """
+    Incrementally convert CLI output to structured data using TextFSM.
 
+    chunks is an iterable of output text (for example, data as it is read from the channel).
+    Yields one dictionary per TextFSM record as soon as the record is complete.
+    """
+    parser = TextFSMStreamParser(platform=platform, command=command, template=template)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def _load_genie():
+    """Import Genie/PyATS on first use. Returns None if they are not installed."""
+    global _GENIE
+    if _GENIE is None:
+        try:
+            from genie.conf.base import Device
+            from genie.libs.parser.utils import get_parser
+            from pyats.datastructures import AttrDict
+
+            _GENIE = (Device, get_parser, AttrDict)
+        except ImportError:
+            _GENIE = False
+    return _GENIE or None
+
+
+def _genie_device(genie_os):
+    """Return the cached Genie Device object used for parsing output of the given Genie OS."""
+    device = _GENIE_DEVICES.get(genie_os)
+    if device is None:
+        Device, _, AttrDict = _load_genie()
+        with _GENIE_LOCK:
+            device = _GENIE_DEVICES.get(genie_os)
+            if device is None:
+                # Genie specific construct for doing parsing (based on Genie in Ansible)
+                device = Device("new_device", os=genie_os)
+                device.custom.setdefault("abstraction", {})
+                device.custom["abstraction"]["order"] = ["os"]
+                device.cli = AttrDict({"execute": None})
+                _GENIE_DEVICES[genie_os] = device
+    return device
+
+
+@lru_cache(maxsize=1024)
+def _genie_parser(genie_os, command):
+    """
+    Memoized Genie parser lookup for (genie_os, command).
+
+    Returns a (parser_class, kwargs) tuple or None if Genie has no parser for the command.
+    """
+    _, get_parser, _ = _load_genie()
+    try:
+        return get_parser(command, _genie_device(genie_os))
+    except Exception:
+        return None
+
+
+def _genie_os(platform):
+    """Map a Netmiko platform to the Genie OS name (None if Genie does not support it)."""
     if "cisco" not in platform:
-        return raw_output
+        return None
 
     genie_device_mapper = {
         "cisco_ios": "ios",
@@ -312,7 +592,6 @@ def get_structured_data_genie(raw_output, platform, command):
         "cisco_asa": "asa",
     }
 
-    os = None
     # platform might be _ssh, _telnet, _serial strip that off
     if platform.count("_") > 1:
         base_platform = platform.split("_")[:-1]
@@ -320,19 +599,63 @@ def get_structured_data_genie(raw_output, platform, command):
     else:
         base_platform = platform
 
-    os = genie_device_mapper.get(base_platform)
+    return genie_device_mapper.get(base_platform)
+
+
+def get_structured_data_genie(raw_output, platform, command):
+    if not sys.version_info >= (3, 4):
+        raise ValueError("Genie requires Python >= 3.4")
+
+    if _load_genie() is None:
+        msg = (
+            "\nGenie and PyATS are not installed. Please PIP install both Genie and PyATS:\n"
+            "pip install genie\npip install pyats\n"
+        )
+        raise ValueError(msg)
+
+    os = _genie_os(platform)
     if os is None:
         return raw_output
 
-    # Genie specific construct for doing parsing (based on Genie in Ansible)
-    device = Device("new_device", os=os)
-    device.custom.setdefault("abstraction", {})
-    device.custom["abstraction"]["order"] = ["os"]
-    device.cli = AttrDict({"execute": None})
+    # Test of whether there is a parser for the given command
+    parser = _genie_parser(os, command)
+    if parser is None:
+        return raw_output
+    parser_class, parser_kwargs = parser
     try:
-        # Test of whether their is a parser for the given command (will return Exception if fails)
-        get_parser(command, device)
-        parsed_output = device.parse(command, output=raw_output)
+        parser_obj = parser_class(device=_genie_device(os))
+        parsed_output = parser_obj.parse(output=raw_output, **parser_kwargs)
         return parsed_output
     except Exception:
         return raw_output
+
+
+def structured_data_converter(
+    raw_output,
+    platform,
+    command,
+    use_textfsm=False,
+    textfsm_template=None,
+    use_genie=False,
+):
+    """
+    Convert raw output to structured data.
+
+    If both TextFSM and Genie are set, try TextFSM then Genie. Return the raw output if neither
+    produced structured data.
+    """
+    if use_textfsm:
+        structured_output = get_structured_data(
+            raw_output, platform=platform, command=command, template=textfsm_template
+        )
+        # If we have structured data; return it.
+        if not isinstance(structured_output, str):
+            return structured_output
+    if use_genie:
+        structured_output = get_structured_data_genie(
+            raw_output, platform=platform, command=command
+        )
+        # If we have structured data; return it.
+        if not isinstance(structured_output, str):
+            return structured_output
+    return raw_output
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""py.test fixtures for the netmiko unit tests."""
+import select
+import socket
+import threading
+from threading import Lock
+
+import pytest
+
+from netmiko.base_connection import BaseConnection
+
+OUTPUTS = {
+    "show version": "Cisco IOS Software, Version 15.2\r\nuptime is 1 week",
+    "interface Gi0/1": "",
+}
+
+
+class FakeChannel(object):
+    """Paramiko channel-like object backed by a socket"""
+
+    def __init__(self, sock):
+        self.sock = sock
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def recv_ready(self):
+        return bool(select.select([self.sock], [], [], 0)[0])
+
+    def recv(self, nbytes):
+        return self.sock.recv(nbytes)
+
+    def sendall(self, data):
+        self.sock.sendall(data)
+
+    def settimeout(self, timeout):
+        pass
+
+    def close(self):
+        self.closed = True
+        self.sock.close()
+
+
+def fake_device(sock, hostname):
+    """Echo each line, send its output and the prompt (until the socket is closed)"""
+    buffer = ""
+    while True:
+        try:
+            data = sock.recv(1024)
+        except OSError:
+            return
+        if not data:
+            return
+        buffer += data.decode()
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            if line.startswith("interface"):
+                prompt = f"{hostname}(config)#"
+            else:
+                prompt = f"{hostname}#"
+            output = OUTPUTS.get(line, "")
+            response = f"{line}\r\n{output}\r\n{prompt}" if line else f"\r\n{prompt}"
+            sock.sendall(response.encode())
+
+
+class FakeSSHClient(object):
+    """Paramiko SSHClient-like object, each shell is served by a fake device thread"""
+
+    def __init__(self, hostname):
+        self.hostname = hostname
+        self.sockets = []
+        self.closed = False
+
+    def invoke_shell(self, *args, **kwargs):
+        client, server = socket.socketpair()
+        self.sockets.extend([client, server])
+        device = threading.Thread(target=fake_device, args=(server, self.hostname))
+        device.daemon = True
+        device.start()
+        return FakeChannel(client)
+
+    def close(self):
+        self.closed = True
+        for sock in self.sockets:
+            sock.close()
+
+
+class FakeConnection(BaseConnection):
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._session_locker = Lock()
+
+
+@pytest.fixture
+def fake_ssh_connection():
+    """Factory of SSH connections to fake devices (each served by a thread)"""
+    clients = []
+
+    def make_connection(hostname="router1", **kwargs):
+        ssh_client = FakeSSHClient(hostname)
+        clients.append(ssh_client)
+        attributes = dict(
+            host=hostname,
+            protocol="ssh",
+            remote_conn_pre=ssh_client,
+            remote_conn=ssh_client.invoke_shell(),
+            blocking_timeout=20,
+            encoding="ascii",
+            ansi_escape_codes=False,
+            session_log=None,
+            _session_log_fin=False,
+            session_log_record_writes=False,
+            base_prompt=hostname,
+            timeout=5,
+            session_timeout=5,
+            global_delay_factor=1,
+            fast_cli=False,
+            RETURN="\n",
+            RESPONSE_RETURN="\n",
+        )
+        # kwargs override the connection attributes
+        attributes.update(kwargs)
+        return FakeConnection(**attributes)
+
+    yield make_connection
+    for ssh_client in clients:
+        ssh_client.close()
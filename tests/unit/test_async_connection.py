@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import asyncio
+
+import pytest
+
+from netmiko import NetmikoTimeoutException
+from netmiko.async_connection import AsyncConnection
+
+
+@pytest.fixture
+def async_connection(fake_ssh_connection):
+    return AsyncConnection(fake_ssh_connection())
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine in a new event loop, closed at the end of the test"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+def test_async_find_prompt(async_connection, run):
+    assert run(async_connection.find_prompt()) == "router1#"
+
+
+def test_async_send_command(async_connection, run):
+    output = run(async_connection.send_command("show version"))
+    assert output == "Cisco IOS Software, Version 15.2\nuptime is 1 week"
+
+    async def send_many():
+        return [
+            await async_connection.send_command("show version", expect_string="#")
+            for _ in range(3)
+        ]
+
+    assert run(send_many()) == [output] * 3
+
+
+def test_async_send_config_set(async_connection, run):
+    output = run(
+        async_connection.send_config_set(
+            ["interface Gi0/1"], enter_config_mode=False, exit_config_mode=False
+        )
+    )
+    assert output == "interface Gi0/1\n\nrouter1(config)#"
+
+
+def test_async_read_until_pattern_timeout(async_connection, run):
+    with pytest.raises(NetmikoTimeoutException):
+        run(async_connection.read_until_pattern("never", timeout=0.2))
+
+
+def test_async_connection_protocol(fake_ssh_connection):
+    with pytest.raises(ValueError):
+        AsyncConnection(fake_ssh_connection(protocol="serial"))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+import json
+from threading import Lock
+
+import paramiko
+import pytest
+
+from netmiko.auth_cache import PASSWORD, PUBLICKEY, AuthMethodCache
+from netmiko.base_connection import BaseConnection
+
+
+class FakeAuthHandler(object):
+    def __init__(self, auth_method):
+        self.auth_method = auth_method
+
+
+class FakeTransport(object):
+    def __init__(self, auth_method):
+        self.auth_handler = FakeAuthHandler(auth_method)
+
+
+class FakeSSHClient(object):
+    """Accepts the password, and the keys only if accept_keys is set"""
+
+    def __init__(self, accept_keys=False):
+        self.accept_keys = accept_keys
+        self.attempts = []
+
+    def connect(self, **params):
+        tries_keys = params["look_for_keys"] or params["allow_agent"]
+        if tries_keys:
+            self.attempts.append(PUBLICKEY)
+            if self.accept_keys:
+                self.transport = FakeTransport(PUBLICKEY)
+                return
+        if params["password"] is None:
+            raise paramiko.ssh_exception.AuthenticationException("rejected")
+        self.attempts.append(PASSWORD)
+        if params["password"] != "secret":
+            raise paramiko.ssh_exception.AuthenticationException("rejected")
+        self.transport = FakeTransport("keyboard-interactive")
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        pass
+
+
+class FakeBaseConnection(BaseConnection):
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._session_locker = Lock()
+
+
+@pytest.fixture
+def make_connection():
+    def make_connection(auth_cache, ssh_client, password="secret", auth_group=None):
+        connection = FakeBaseConnection(
+            host="router1",
+            port=22,
+            username="admin",
+            password=password,
+            use_keys=True,
+            allow_agent=True,
+            key_file=None,
+            pkey=None,
+            passphrase=None,
+            timeout=10,
+            auth_timeout=None,
+            banner_timeout=10,
+            sock=None,
+            ssh_config_file=None,
+            auth_cache=auth_cache,
+            auth_group=auth_group,
+        )
+        connection.remote_conn_pre = ssh_client
+        return connection
+
+    return make_connection
+
+
+def test_auth_method_cache_persistence(tmp_path):
+    path = str(tmp_path / "netmiko" / "auth_methods.json")
+    auth_cache = AuthMethodCache(path=path)
+    auth_cache.set("router1:22", PASSWORD)
+    auth_cache.set("site1", PUBLICKEY)
+    with open(path) as f:
+        assert json.load(f) == {"router1:22": PASSWORD, "site1": PUBLICKEY}
+
+    auth_cache = AuthMethodCache(path=path)
+    assert auth_cache.get("router1:22") == PASSWORD
+    auth_cache.delete("router1:22")
+    assert AuthMethodCache(path=path).get("router1:22") is None
+
+
+def test_learned_password_first(make_connection):
+    auth_cache = AuthMethodCache()
+
+    # First connection: keys are tried (and rejected) before the password
+    ssh_client = FakeSSHClient()
+    connection = make_connection(auth_cache, ssh_client)
+    connection._ssh_connect(connection._connect_params_dict())
+    assert ssh_client.attempts == [PUBLICKEY, PASSWORD]
+    assert auth_cache.get("router1:22") == PASSWORD
+
+    # Next connection: only the password is tried
+    ssh_client = FakeSSHClient()
+    connection = make_connection(auth_cache, ssh_client)
+    connection._ssh_connect(connection._connect_params_dict())
+    assert ssh_client.attempts == [PASSWORD]
+
+
+def test_learned_password_fallback(make_connection):
+    auth_cache = AuthMethodCache()
+    auth_cache.set("site1", PASSWORD)
+
+    # The password is rejected: all the methods are tried again
+    ssh_client = FakeSSHClient(accept_keys=True)
+    connection = make_connection(
+        auth_cache, ssh_client, password="wrong", auth_group="site1"
+    )
+    connection._ssh_connect(connection._connect_params_dict())
+    assert ssh_client.attempts == [PASSWORD, PUBLICKEY]
+    assert auth_cache.get("site1") == PUBLICKEY
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
+import os
 import time
 from os.path import dirname, join
-from threading import Lock
+from threading import Lock, Thread
 
 from netmiko import NetmikoTimeoutException
 from netmiko.base_connection import BaseConnection
+from netmiko.pica8 import pica8SSH
 
 RESOURCE_FOLDER = join(dirname(dirname(__file__)), "etc")
 
@@ -462,3 +464,165 @@ def test_strip_ansi_codes():
 
     # code_next_line must be substituted with a return
     assert connection.strip_ansi_escape_codes("\x1bE") == "\n"
+
+
+def test_send_command_stream():
+    """Echo and trailing prompt are not parsed; records stream as they are read."""
+    os.environ["NET_TEXTFSM"] = RESOURCE_FOLDER
+    reads = [
+        "show ip int brief\r\nInterface                  IP-Address      OK? Method ",
+        "Status                Protocol\r\nFastEthernet4              10.220.88.20    YES",
+        " NVRAM  up                    up\r\nVlan1                      unassigned      ",
+        "YES unset  down                  down\r\npynet-rtr1#",
+    ]
+    written = []
+    connection = FakeBaseConnection(
+        RETURN="\n",
+        RESPONSE_RETURN="\n",
+        device_type="cisco_ios",
+        base_prompt="pynet-rtr1",
+        global_delay_factor=0.01,
+        fast_cli=False,
+        timeout=10,
+    )
+    connection.read_channel = lambda: reads.pop(0) if reads else ""
+    connection.write_channel = written.append
+    connection.clear_buffer = lambda: None
+
+    stream = connection.send_command_stream("show ip int brief", auto_find_prompt=False)
+    assert next(stream) == {
+        "intf": "FastEthernet4",
+        "ipaddr": "10.220.88.20",
+        "status": "up",
+        "proto": "up",
+    }
+    # Second record is only produced once its line has been read
+    assert len(reads) == 1
+    assert next(stream)["intf"] == "Vlan1"
+    assert list(stream) == []
+    assert written == ["show ip int brief\n"]
+
+
+def test_open_channel(fake_ssh_connection):
+    """Channels share the SSH transport but have their own channel and lock"""
+    connection = fake_ssh_connection()
+    channel = connection.open_channel(session_prep=False)
+    assert isinstance(channel, type(connection))
+    assert channel.remote_conn is not connection.remote_conn
+    assert channel._session_locker is not connection._session_locker
+    assert channel.remote_conn_pre is connection.remote_conn_pre
+
+    outputs = {}
+
+    def send_command(conn):
+        outputs[conn] = conn.send_command("show version", auto_find_prompt=False)
+
+    threads = [Thread(target=send_command, args=(c,)) for c in (connection, channel)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert outputs[connection] == outputs[channel]
+    assert "Cisco IOS Software" in outputs[channel]
+
+    # Disconnecting the channel does not close the SSH transport
+    remote_conn = channel.remote_conn
+    channel.disconnect()
+    assert remote_conn.closed
+    assert not connection.remote_conn_pre.closed
+    assert "Cisco IOS Software" in connection.send_command(
+        "show version", auto_find_prompt=False
+    )
+
+
+class FakeExecChannel(object):
+    def __init__(self, responses):
+        self.responses = responses
+        self.chunks = []
+        self.closed = False
+
+    def settimeout(self, timeout):
+        pass
+
+    def set_combine_stderr(self, combine):
+        pass
+
+    def exec_command(self, command):
+        self.chunks, self.status = self.responses[command]
+        self.chunks = list(self.chunks)
+
+    def recv(self, nbytes):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def recv_exit_status(self):
+        return self.status
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport(object):
+    def __init__(self, responses):
+        self.responses = responses
+        self.channels = []
+
+    def open_session(self):
+        channel = FakeExecChannel(self.responses)
+        self.channels.append(channel)
+        return channel
+
+
+class FakeShellChannel(object):
+    def __init__(self, transport):
+        self.transport = transport
+
+    def get_transport(self):
+        return self.transport
+
+
+def test_send_command_exec():
+    """Output is read until EOF of a new exec channel and the exit status is recorded"""
+    transport = FakeTransport(
+        {
+            "uname -a": ([b"Linux host1 5.4.0\r\n", b"x86_64 GNU/Linux\n"], 0),
+            "ls /missing": ([b"ls: cannot access '/missing'\n"], 2),
+            # A multi-byte character split across two reads
+            "cat motd": ([b"caf\xc3", b"\xa9\n"], 0),
+        }
+    )
+    connection = FakeBaseConnection(
+        protocol="ssh",
+        remote_conn=FakeShellChannel(transport),
+        timeout=10,
+        session_log=None,
+        use_exec=True,
+        encoding="utf-8",
+        RESPONSE_RETURN="\n",
+    )
+    output = connection.send_command("uname -a")
+    assert output == "Linux host1 5.4.0\nx86_64 GNU/Linux\n"
+    assert connection.exit_status == 0
+    assert connection.send_command_exec("ls /missing\n").startswith("ls: cannot")
+    assert connection.exit_status == 2
+    assert connection.send_command_exec("cat motd") == "caf\u00e9\n"
+    assert len(transport.channels) == 3
+    assert all(channel.closed for channel in transport.channels)
+
+
+class FakePica8(pica8SSH, FakeBaseConnection):
+    pass
+
+
+def test_send_command_exec_pica8():
+    """Drivers overriding send_command also use the exec channel"""
+    transport = FakeTransport({"show version": ([b"PICOS 4.0\n"], 0)})
+    connection = FakePica8(
+        protocol="ssh",
+        remote_conn=FakeShellChannel(transport),
+        timeout=10,
+        session_log=None,
+        use_exec=True,
+        encoding="utf-8",
+        RESPONSE_RETURN="\n",
+    )
+    assert connection.send_command("show version") == "PICOS 4.0\n"
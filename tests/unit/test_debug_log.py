@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+import logging
+
+from netmiko import base_connection, debug_log
+
+
+def test_summarize():
+    assert debug_log.summarize("show version") == "'show version'"
+    summary = debug_log.summarize("x" * 5000, limit=10)
+    assert summary == "'xxxxxxxxxx'... (5000 characters)"
+
+
+def test_nothing_formatted_when_disabled(fake_ssh_connection, monkeypatch):
+    def summarize(data, limit=None):
+        raise AssertionError("Debug message formatted")
+
+    monkeypatch.setattr(base_connection, "summarize", summarize)
+    monkeypatch.setattr(debug_log, "summarize", summarize)
+    connection = fake_ssh_connection()
+    assert "Cisco IOS Software" in connection.send_command("show version")
+
+
+def test_debug_log_summarized(fake_ssh_connection, caplog, monkeypatch):
+    monkeypatch.setattr(debug_log, "DEBUG_PAYLOAD_LIMIT", 5)
+    connection = fake_ssh_connection()
+    with caplog.at_level(logging.DEBUG, logger="netmiko"):
+        connection.send_command("show version")
+    messages = [r.getMessage() for r in caplog.records if r.name == "netmiko"]
+    assert "write_channel: b'show '... (13 characters)" in messages
+    assert all("Cisco IOS Software" not in message for message in messages)
+    assert not [r for r in caplog.records if r.name == "netmiko.wire"]
+
+
+def test_wire_trace(fake_ssh_connection, caplog):
+    connection = fake_ssh_connection()
+    with caplog.at_level(logging.DEBUG, logger="netmiko.wire"):
+        connection.send_command("show version")
+    records = [r for r in caplog.records if r.name == "netmiko.wire"]
+    assert records[0].getMessage() == ">> b'\\n'"
+    assert ">> b'show version\\n'" in [r.getMessage() for r in records]
+    data = "".join(r.args[1] for r in records if r.args[0] == "<<")
+    assert "Cisco IOS Software" in data
+    assert not [r for r in caplog.records if r.name == "netmiko"]
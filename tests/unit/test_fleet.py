@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+import threading
+import time
+
+import pytest
+
+from netmiko import NetmikoTimeoutException
+from netmiko import fleet
+from netmiko.fleet import FleetExecutor, TokenBucket
+
+INVENTORY = {
+    "rtr1": {"device_type": "cisco_ios", "host": "rtr1", "delay": 0.3},
+    "rtr2": {"device_type": "cisco_ios", "host": "rtr2", "delay": 0.1},
+    "rtr3": {"device_type": "cisco_ios", "host": "rtr3", "delay": 0.2},
+    "sw1": {"device_type": "cisco_ios", "host": "sw1", "delay": 0},
+    "site1": ["rtr1", "rtr2", "rtr3"],
+}
+
+
+class FakeConnection(object):
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, host, delay, **kwargs):
+        self.host = host
+        self.delay = delay
+        self.disconnected = False
+        with self.lock:
+            FakeConnection.active += 1
+            FakeConnection.max_active = max(self.max_active, self.active)
+
+    def send_command(self, command):
+        time.sleep(self.delay)
+        return f"{self.host}: {command}"
+
+    def disconnect(self):
+        if not self.disconnected:
+            self.disconnected = True
+            with self.lock:
+                FakeConnection.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def fake_connect_handler(monkeypatch):
+    FakeConnection.active = FakeConnection.max_active = 0
+    monkeypatch.setattr(fleet, "ConnectHandler", FakeConnection)
+
+
+def test_fleet_commands():
+    """Results are streamed in completion order"""
+    executor = FleetExecutor(INVENTORY, max_workers=4)
+    results = list(executor.run(commands=["show clock"], group="site1"))
+    assert [r.name for r in results] == ["rtr2", "rtr3", "rtr1"]
+    assert results[0].result == {"show clock": "rtr2: show clock"}
+    assert results[0].exception is None
+    assert FakeConnection.active == 0
+
+
+def test_fleet_max_workers():
+    executor = FleetExecutor(INVENTORY, max_workers=2)
+    results = list(executor.run(task=lambda conn: conn.send_command("show clock")))
+    assert sorted(r.name for r in results) == ["rtr1", "rtr2", "rtr3", "sw1"]
+    assert FakeConnection.max_active == 2
+
+
+def test_fleet_task_exception():
+    def task(connection):
+        if connection.host == "sw1":
+            raise ValueError("failed")
+        return connection.host
+
+    results = {r.name: r for r in FleetExecutor(INVENTORY).run(task=task)}
+    assert isinstance(results["sw1"].exception, ValueError)
+    assert results["rtr1"].result == "rtr1"
+
+
+def test_fleet_rate_limit():
+    """Connections to the devices of a group are rate limited"""
+    executor = FleetExecutor(INVENTORY, max_workers=4, rate_limits={"site1": 10})
+    start = time.time()
+    list(executor.run(task=lambda conn: None, group="site1"))
+    assert time.time() - start >= 0.19
+    with pytest.raises(ValueError):
+        FleetExecutor(INVENTORY, rate_limits={"rtr1": 10})
+
+
+def test_fleet_device_timeout():
+    executor = FleetExecutor(INVENTORY, device_timeout=0.15)
+    results = {r.name: r for r in executor.run(commands=["show clock"])}
+    assert isinstance(results["rtr1"].exception, NetmikoTimeoutException)
+    assert results["rtr1"].result is None
+    assert results["rtr2"].exception is None
+
+
+def test_fleet_rate_limit_wait_not_timed():
+    """Waiting for the rate limit doesn't count against the device timeout"""
+    inventory = {
+        name: {"device_type": "cisco_ios", "host": name, "delay": 0}
+        for name in ("sw1", "sw2", "sw3", "sw4")
+    }
+    inventory["site1"] = ["sw1", "sw2", "sw3", "sw4"]
+    executor = FleetExecutor(
+        inventory, max_workers=4, rate_limits={"site1": 10}, device_timeout=0.1
+    )
+    results = list(executor.run(commands=["show clock"]))
+    assert [r.exception for r in results] == [None] * 4
+    assert all(r.elapsed < 0.1 for r in results)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.time()
+    for _ in range(4):
+        bucket.acquire()
+    assert 0.08 <= time.time() - start < 0.5
+
+
+def test_fleet_select():
+    executor = FleetExecutor(INVENTORY)
+    assert sorted(executor.select()) == ["rtr1", "rtr2", "rtr3", "sw1"]
+    assert sorted(executor.select("site1")) == ["rtr1", "rtr2", "rtr3"]
+    assert list(executor.select("sw1")) == ["sw1"]
+    assert list(executor.select(["rtr1", "sw1"])) == ["rtr1", "sw1"]
+    with pytest.raises(ValueError):
+        executor.select("missing")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+from threading import Lock
+
+import pytest
+
+from netmiko import ConnectHandler
+from netmiko.base_connection import BaseConnection
+from netmiko.instrumentation import ConnectionHook, PhaseTimings
+from netmiko.simulator import DeviceSimulator
+
+
+class RecordingHook(ConnectionHook):
+    def __init__(self):
+        self.events = []
+
+    def on_connect(self, connection, timings):
+        self.events.append(("connect", timings))
+
+    def on_connect_error(self, connection, exception, timings):
+        self.events.append(("error", exception))
+
+    def before_command(self, connection, record):
+        self.events.append(("before", record))
+
+    def after_command(self, connection, record):
+        self.events.append(("after", record))
+
+    def on_chunk(self, connection, data):
+        self.events.append(("chunk", data))
+
+
+class FakeConnection(BaseConnection):
+    """Connection establishing nothing, session_preparation calls the timed methods"""
+
+    def __init__(self, hooks, fail=False):
+        self.hooks = hooks
+        self.fail = fail
+        self._session_locker = Lock()
+        self._open()
+
+    def establish_connection(self, width=None, height=None):
+        with self._connect_phase("tcp_connect"):
+            pass
+
+    def session_preparation(self):
+        self.set_base_prompt()
+        self.disable_paging()
+        if self.fail:
+            raise ValueError("session_preparation failed")
+
+    def find_prompt(self, delay_factor=1):
+        return "router1#"
+
+    def disable_paging(self, command="terminal length 0", delay_factor=1):
+        pass
+
+    def disconnect(self):
+        pass
+
+
+def test_phase_timings():
+    timings = PhaseTimings()
+    with timings.phase("outer"):
+        with timings.phase("inner"):
+            pass
+        with timings.phase("inner"):
+            pass
+    timings.add("other", 1.5)
+    timings.stop()
+    assert list(timings.phases) == ["outer", "outer.inner", "other"]
+    assert timings.phases["outer"] >= timings.phases["outer.inner"]
+    assert timings.phases["other"] == 1.5
+    assert timings.as_dict()["total"] == timings.total
+
+
+def test_connect_timings_and_hooks():
+    hook = RecordingHook()
+    connection = FakeConnection(hooks=[hook])
+    assert connection.base_prompt == "router1"
+    assert list(connection.connect_timings.phases) == [
+        "tcp_connect",
+        "session_preparation",
+        "session_preparation.set_base_prompt",
+    ]
+    assert connection.connect_timings.total is not None
+    assert hook.events == [("connect", connection.connect_timings)]
+
+    # The methods are only timed while the connection is established
+    connection.set_base_prompt()
+    assert len(connection.connect_timings.phases) == 3
+
+
+@pytest.mark.parametrize("hooks", [[], [ConnectionHook()]])
+def test_ssh_connect_phases(hooks):
+    with DeviceSimulator("cisco_ios") as simulator:
+        device = simulator.device(fast_cli=True, hooks=hooks)
+        with ConnectHandler(**device) as connection:
+            phases = list(connection.connect_timings.phases)
+    assert phases[0] == "connect_params"
+    if hooks:
+        # Timed separately only when the timings are read
+        assert phases[1:4] == ["tcp_connect", "kex", "auth"]
+    else:
+        assert phases[1] == "ssh_connect"
+        assert "kex" not in phases and "tcp_connect" not in phases
+
+
+def test_connect_error_hook():
+    hook = RecordingHook()
+    with pytest.raises(ValueError):
+        FakeConnection(hooks=[hook], fail=True)
+    assert [event for event, _ in hook.events] == ["error"]
+    assert isinstance(hook.events[0][1], ValueError)
+
+
+def test_command_hooks(fake_ssh_connection):
+    hook = RecordingHook()
+    connection = fake_ssh_connection()
+    connection.hooks = [hook]
+    output = connection.send_command("show version")
+    assert "Cisco IOS Software" in output
+
+    events = [event for event, _ in hook.events]
+    assert events[0] == "before" and events[-1] == "after"
+    record = hook.events[0][1]
+    assert record is hook.events[-1][1]
+    assert record.method == "send_command"
+    assert record.command == "show version"
+    assert record.exception is None
+    assert list(record.phases) == [
+        "prompt_discovery",
+        "clear_buffer",
+        "write",
+        "echo_wait",
+        "prompt_wait",
+        "sanitize",
+    ]
+    chunks = [data for event, data in hook.events if event == "chunk"]
+    assert record.chunks == len(chunks)
+    assert record.bytes_received == len("".join(chunks))
+    assert "Cisco IOS Software" in "".join(chunks)
+    assert connection._command_record is None
+
+
+def test_command_hooks_config_set(fake_ssh_connection):
+    hook = RecordingHook()
+    connection = fake_ssh_connection()
+    connection.hooks = [hook]
+    connection.send_config_set(
+        ["interface Gi0/1"], enter_config_mode=False, exit_config_mode=False
+    )
+    record = hook.events[-1][1]
+    assert record.method == "send_config_set"
+    assert record.command == ["interface Gi0/1"]
+    assert {"write", "echo_wait", "sanitize"} <= set(record.phases)
+    assert record.bytes_received > 0
+
+
+def test_command_hooks_exception(fake_ssh_connection):
+    hook = RecordingHook()
+    connection = fake_ssh_connection()
+    connection.hooks = [hook]
+    with pytest.raises(IOError):
+        connection.send_command("show version", expect_string="never", max_loops=2)
+    record = hook.events[-1][1]
+    assert isinstance(record.exception, IOError)
+    assert record.total is not None
+
+
+def test_no_hooks(fake_ssh_connection):
+    connection = fake_ssh_connection()
+    assert "Cisco IOS Software" in connection.send_command("show version")
+    assert connection._command_record is None
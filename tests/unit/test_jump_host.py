@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+import getpass
+from os.path import dirname, join
+from threading import Lock, Thread
+
+import pytest
+
+from netmiko import jump_host
+from netmiko.base_connection import BaseConnection
+from netmiko.jump_host import JumpHostPool, parse_jump_host
+
+RESOURCE_FOLDER = join(dirname(dirname(__file__)), "etc")
+
+
+class FakeTransport(object):
+    def __init__(self):
+        self.active = True
+        self.channels = []
+
+    def is_active(self):
+        return self.active
+
+    def open_channel(self, kind, dest_addr, src_addr, timeout=None):
+        channel = (kind, dest_addr)
+        self.channels.append(channel)
+        return channel
+
+
+class FakeSSHClient(object):
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+class FakeBaseConnection(BaseConnection):
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._session_locker = Lock()
+
+
+@pytest.mark.parametrize(
+    "entry,expected",
+    [
+        ("jumphost", (None, "jumphost", None)),
+        ("admin@jumphost", ("admin", "jumphost", None)),
+        ("admin@10.1.1.1:2222", ("admin", "10.1.1.1", 2222)),
+        ("2001:db8::1", (None, "2001:db8::1", None)),
+        ("[2001:db8::1]:2222", (None, "2001:db8::1", 2222)),
+    ],
+)
+def test_parse_jump_host(entry, expected):
+    assert parse_jump_host(entry) == expected
+
+
+def test_jump_host_pool_shares_the_connection():
+    pool = JumpHostPool()
+    clients = []
+
+    def connect():
+        clients.append(FakeSSHClient())
+        return clients[-1]
+
+    key = ("bastion", 22, "admin")
+    threads = [
+        Thread(target=pool.open_channel, args=(key, connect, (f"10.0.0.{i}", 22)))
+        for i in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(clients) == 1
+    assert len(clients[0].transport.channels) == 20
+    assert clients[0].transport.channels[0][0] == "direct-tcpip"
+
+    # A dead transport is replaced
+    clients[0].transport.active = False
+    pool.open_channel(key, connect, ("10.0.0.1", 22))
+    assert len(clients) == 2
+    assert clients[0].closed
+
+    pool.close()
+    assert clients[1].closed
+
+
+def test_use_ssh_file_shared_jump_host(monkeypatch):
+    """ProxyJump with shared_jump_host uses a channel of the jump host connection"""
+    calls = []
+
+    def open_channel(key, connect, dest_addr, timeout=None):
+        calls.append((key, dest_addr, timeout))
+        return "channel"
+
+    monkeypatch.setattr(jump_host.jump_host_pool, "open_channel", open_channel)
+    connection = FakeBaseConnection(
+        host="10.10.10.70",
+        port=22,
+        username="",
+        timeout=60,
+        auth_timeout=None,
+        banner_timeout=10,
+        ssh_config_file=join(RESOURCE_FOLDER, "ssh_config_proxyjump"),
+        shared_jump_host=True,
+    )
+    connect_dict = {"hostname": "10.10.10.70", "port": 22, "username": ""}
+
+    result = connection._use_ssh_config(connect_dict)
+    assert result["sock"] == "channel"
+    assert result["port"] == 8022
+    assert calls == [(("host1.domain.com", 22, "myuser"), ("10.10.10.70", 8022), 60)]
+
+
+def test_shared_jump_host_default_user(monkeypatch, tmp_path):
+    """The jump host user defaults to the local user, not the device's username"""
+    calls = []
+
+    def open_channel(key, connect, dest_addr, timeout=None):
+        calls.append(key)
+        return "channel"
+
+    monkeypatch.setattr(jump_host.jump_host_pool, "open_channel", open_channel)
+    monkeypatch.setattr(getpass, "getuser", lambda: "localuser")
+    ssh_config_file = tmp_path / "ssh_config"
+    ssh_config_file.write_text("host *\n  ProxyJump bastion\n")
+    connection = FakeBaseConnection(
+        host="10.10.10.70",
+        port=22,
+        username="admin",
+        timeout=60,
+        auth_timeout=None,
+        banner_timeout=10,
+        ssh_config_file=str(ssh_config_file),
+        shared_jump_host=True,
+    )
+    connect_dict = {"hostname": "10.10.10.70", "port": 22, "username": "admin"}
+    connection._use_ssh_config(connect_dict)
+    assert calls == [("bastion", 22, "localuser")]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+import json
+from urllib.request import urlopen
+
+import pytest
+
+from netmiko import NetmikoTimeoutException
+from netmiko.instrumentation import CommandRecord, PhaseTimings
+from netmiko.metrics import MetricsHook, MetricsRegistry, start_http_server
+
+
+class FakeConnection(object):
+    device_type = "cisco_ios"
+    _command_record = None
+
+
+def make_record(method, command, total, bytes_received=0, exception=None):
+    record = CommandRecord(method, command)
+    record.total = total
+    record.bytes_received = bytes_received
+    record.exception = exception
+    return record
+
+
+def test_prometheus_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "A counter.", ["host"])
+    counter.inc(host="router1")
+    counter.inc(2, host='rou"ter2')
+    histogram = registry.histogram("test_seconds", "A histogram.", buckets=(1, 5))
+    histogram.observe(0.5)
+    histogram.observe(3)
+    assert registry.counter("test_total", "A counter.", ["host"]) is counter
+    with pytest.raises(ValueError):
+        counter.inc(device="router1")
+
+    assert registry.to_prometheus() == (
+        "# HELP test_seconds A histogram.\n"
+        "# TYPE test_seconds histogram\n"
+        'test_seconds_bucket{le="1"} 1\n'
+        'test_seconds_bucket{le="5"} 2\n'
+        'test_seconds_bucket{le="+Inf"} 2\n'
+        "test_seconds_sum 3.5\n"
+        "test_seconds_count 2\n"
+        "# HELP test_total A counter.\n"
+        "# TYPE test_total counter\n"
+        'test_total{host="rou\\"ter2"} 2\n'
+        'test_total{host="router1"} 1\n'
+    )
+    metrics = json.loads(registry.to_json())
+    assert metrics["test_total"]["type"] == "counter"
+    assert metrics["test_total"]["samples"][1] == {
+        "name": "test_total",
+        "labels": {"host": "router1"},
+        "value": 1,
+    }
+
+
+def test_metrics_hook():
+    registry = MetricsRegistry()
+    hook = MetricsHook(registry=registry)
+    connection = FakeConnection()
+
+    timings = PhaseTimings()
+    timings.stop()
+    hook.on_connect(connection, timings)
+    hook.on_connect_error(connection, NetmikoTimeoutException(), timings)
+    hook.after_command(
+        connection, make_record("send_command", "show version\n", 0.3, 1200)
+    )
+    hook.after_command(
+        connection, make_record("send_command", "show run", 10, exception=IOError())
+    )
+
+    assert registry.get("netmiko_connects_total").get(device_type="cisco_ios") == 1
+    assert (
+        registry.get("netmiko_connect_failures_total").get(
+            device_type="cisco_ios", reason="timeout"
+        )
+        == 1
+    )
+    assert registry.get("netmiko_command_seconds").get(
+        device_type="cisco_ios", method="send_command", command="show version"
+    ) == (1, 0.3)
+    assert (
+        registry.get("netmiko_command_failures_total").get(
+            device_type="cisco_ios", method="send_command", reason="error"
+        )
+        == 1
+    )
+    assert (
+        registry.get("netmiko_bytes_received_total").get(device_type="cisco_ios")
+        == 1200
+    )
+
+
+def test_metrics_hook_send_command(fake_ssh_connection):
+    registry = MetricsRegistry()
+    connection = fake_ssh_connection()
+    connection.device_type = "cisco_ios"
+    connection.hooks = [MetricsHook(registry=registry, command_label=False)]
+    connection.send_command("show version")
+    count, _ = registry.get("netmiko_command_seconds").get(
+        device_type="cisco_ios", method="send_command", command=""
+    )
+    assert count == 1
+    assert registry.get("netmiko_bytes_received_total").get(device_type="cisco_ios")
+
+
+def test_start_http_server():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "A counter.").inc()
+    server = start_http_server(0, addr="127.0.0.1", registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        assert "test_total 1" in urlopen(f"{url}/metrics").read().decode()
+        assert "test_total" in json.loads(urlopen(f"{url}/metrics.json").read())
+    finally:
+        server.shutdown()
+        server.server_close()
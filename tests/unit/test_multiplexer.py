@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+import threading
+
+from netmiko import NetmikoTimeoutException
+from netmiko.multiplexer import send_commands
+
+
+def test_send_commands(fake_ssh_connection):
+    """Every command is sent to every connection from the calling thread"""
+    connections = [fake_ssh_connection(f"router{i}") for i in range(20)]
+    thread_count = threading.active_count()
+    results = list(send_commands(connections, ["show version", "show clock"]))
+    assert threading.active_count() == thread_count
+    assert len(results) == 40
+    for connection in connections:
+        outputs = [r for r in results if r.connection is connection]
+        assert [r.command for r in outputs] == ["show version", "show clock"]
+        assert outputs[0].output == "Cisco IOS Software, Version 15.2\nuptime is 1 week"
+        assert outputs[1].output == ""
+        assert outputs[0].exception is None
+
+
+def test_send_commands_timeout(fake_ssh_connection):
+    """A command not completing in time fails only its own connection"""
+    connections = [fake_ssh_connection("router1"), fake_ssh_connection("router2")]
+    connections[1].base_prompt = "wrong_prompt"
+    results = list(send_commands(connections, ["show version"], timeout=0.5))
+    assert len(results) == 2
+    assert results[0].connection is connections[0]
+    assert results[0].exception is None
+    assert results[1].connection is connections[1]
+    assert isinstance(results[1].exception, NetmikoTimeoutException)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+import socket
+import time
+
+import pytest
+
+from netmiko.cisco import CiscoIosSSH
+from netmiko.recording import (
+    READ,
+    WRITE,
+    RecordedEvent,
+    Recording,
+    RecordingChannel,
+    ReplayChannel,
+    ReplayConnectHandler,
+    SessionRecorder,
+)
+
+
+@pytest.fixture
+def recording_file(tmp_path, fake_ssh_connection):
+    """Recording of a cisco_ios session (session_preparation and show version)"""
+    file_name = str(tmp_path / "router1.nmrec")
+    recorder = SessionRecorder(file_name)
+    recorder.start(secrets=["secret123"], device_type="cisco_ios", host="router1")
+    connection = fake_ssh_connection()
+    connection.fast_cli = True
+    connection.global_delay_factor = 0.1
+    connection.remote_conn = RecordingChannel(connection.remote_conn, recorder)
+    CiscoIosSSH.session_preparation(connection)
+    connection.write_channel("secret123\n")
+    connection.send_command("show version")
+    recorder.close()
+    return file_name
+
+
+def make_recording():
+    return Recording(
+        {"device_type": "cisco_ios"},
+        [
+            RecordedEvent(READ, 0.0, b"router1#"),
+            RecordedEvent(WRITE, 0.1, b"show clock\n"),
+            RecordedEvent(READ, 0.4, b"show clock\r\n10:00\r\n"),
+            RecordedEvent(READ, 0.5, b"router1#"),
+        ],
+    )
+
+
+def test_recording_format(recording_file):
+    recording = Recording.load(recording_file)
+    assert recording.header["device_type"] == "cisco_ios"
+    assert recording.header["host"] == "router1"
+    directions = {event.direction for event in recording.events}
+    assert directions == {READ, WRITE}
+    timestamps = [event.timestamp for event in recording.events]
+    assert timestamps == sorted(timestamps)
+    writes = b"".join(e.data for e in recording.events if e.direction == WRITE)
+    assert b"show version\n" in writes
+    assert b"secret123" not in writes and b"********\n" in writes
+    reads = b"".join(e.data for e in recording.events if e.direction == READ)
+    assert b"Cisco IOS Software" in reads
+
+    # A truncated recording is loaded up to its last complete record
+    with open(recording_file, "rb") as f:
+        content = f.read()
+    with open(recording_file, "wb") as f:
+        f.write(content[:-3])
+    assert len(Recording.load(recording_file).events) == len(recording.events) - 1
+
+
+def test_replay_channel_timing():
+    channel = ReplayChannel(make_recording(), speed=1)
+    channel.settimeout(2)
+    assert channel.recv(100) == b"router1#"
+    # The response is only released once the command is written
+    assert not channel.recv_ready()
+    channel.sendall(b"show clock\n")
+    start = time.monotonic()
+    assert channel.recv(100) == b"show clock\r\n10:00\r\n"
+    assert 0.25 <= time.monotonic() - start < 1
+    assert channel.recv(100) == b"router1#"
+    assert channel.recv(100) == b""
+
+    # Accelerated
+    channel = ReplayChannel(make_recording(), speed=10)
+    channel.recv(100)
+    channel.sendall(b"show clock\n")
+    start = time.monotonic()
+    channel.recv(100)
+    assert time.monotonic() - start < 0.1
+
+
+def test_replay_channel_timeout_and_strict():
+    channel = ReplayChannel(make_recording(), speed=None, strict=True)
+    channel.settimeout(0.1)
+    channel.recv(100)
+    with pytest.raises(socket.timeout):
+        channel.recv(100)
+    with pytest.raises(ValueError):
+        channel.sendall(b"show version\n")
+
+
+def test_replay_connect_handler(recording_file):
+    net_connect = ReplayConnectHandler(
+        recording_file, speed=None, strict=True, fast_cli=True, password="secret123"
+    )
+    assert net_connect.device_type == "cisco_ios"
+    assert net_connect.base_prompt == "router1"
+    net_connect.write_channel("secret123\n")
+    assert "Cisco IOS Software" in net_connect.send_command("show version")
+    net_connect.disconnect()
+
+
+def test_replay_unsupported_channels(recording_file):
+    with pytest.raises(ValueError):
+        ReplayConnectHandler(recording_file, speed=None, use_exec=True)
+    net_connect = ReplayConnectHandler(recording_file, speed=None, fast_cli=True)
+    with pytest.raises(ValueError):
+        net_connect.send_command_exec("show version")
+    with pytest.raises(ValueError):
+        net_connect.open_channel()
+    net_connect.disconnect()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+import gzip
+import io
+import threading
+
+import pytest
+
+from netmiko import ConnectHandler
+from netmiko.session_log import SessionLog, secrets_pattern
+from netmiko.simulator import DeviceSimulator
+
+
+def normalize(data):
+    return data.replace("\r\n", "\n")
+
+
+def test_secrets_pattern():
+    pattern = secrets_pattern(["pass", "password", None, ""])
+    assert pattern.sub("***", "password pass") == "*** ***"
+    assert secrets_pattern([None, ""]) is None
+
+
+def test_session_log_file(tmp_path):
+    file_name = str(tmp_path / "session.log")
+    session_log = SessionLog(file_name=file_name)
+    session_log.start(secrets=["secret123"], normalize=normalize)
+    session_log.write("router1#show run\r\n")
+    session_log.write("username admin password secret")
+    session_log.write("123\r\nrouter1#")
+    session_log.flush()
+    with open(file_name) as f:
+        assert f.read() == (
+            "router1#show run\nusername admin password ********\nrouter1#"
+        )
+    session_log.close()
+    assert session_log.closed
+
+    # Append mode
+    session_log = SessionLog(file_name=file_name, file_mode="append")
+    session_log.start()
+    session_log.write("\nrouter1#exit")
+    session_log.close()
+    with open(file_name) as f:
+        assert f.read().endswith("router1#\nrouter1#exit")
+
+
+def test_session_log_buffered_io():
+    buffer = io.BytesIO()
+    session_log = SessionLog(buffered_io=buffer)
+    session_log.start(encoding="ascii")
+    session_log.write("show version\r\n")
+    session_log.close()
+    assert buffer.getvalue() == b"show version\r\n"
+    assert not buffer.closed
+    with pytest.raises(ValueError):
+        SessionLog(buffered_io=buffer, compression="gzip")
+
+
+def test_session_log_gzip_rotation(tmp_path):
+    file_name = str(tmp_path / "session.log.gz")
+    session_log = SessionLog(
+        file_name=file_name, compression="gzip", max_bytes=10, backup_count=2
+    )
+    session_log.start()
+    for line in ["first line\n", "second line\n", "third line\n", "fourth line\n"]:
+        session_log.write(line)
+        session_log.flush()
+    session_log.close()
+    with gzip.open(file_name, "rt") as f:
+        assert f.read() == "fourth line\n"
+    with gzip.open(f"{file_name}.1", "rt") as f:
+        assert f.read() == "third line\n"
+    with gzip.open(f"{file_name}.2", "rt") as f:
+        assert f.read() == "second line\n"
+    assert not (tmp_path / "session.log.gz.3").exists()
+
+
+def test_connection_session_log(fake_ssh_connection):
+    buffer = io.BytesIO()
+    connection = fake_ssh_connection()
+    connection.password = "secret123"
+    connection.secret = None
+    connection._start_session_log(SessionLog(buffered_io=buffer))
+    connection.send_command("show version")
+    connection._write_session_log("password secret123\n")
+    connection.close_session_log()
+    assert connection.session_log is None
+    log_content = buffer.getvalue()
+    assert b"Cisco IOS Software" in log_content
+    assert b"\r" not in log_content
+    assert log_content.endswith(b"password ********\n")
+
+
+def test_session_log_write_error():
+    """An unexpected error is logged, the writer thread keeps running"""
+
+    def bad_normalize(data):
+        raise RuntimeError("bad data")
+
+    buffer = io.BytesIO()
+    session_log = SessionLog(buffered_io=buffer)
+    session_log.start(normalize=bad_normalize)
+    session_log.write("router1#")
+    flushed = threading.Thread(target=session_log.flush, daemon=True)
+    flushed.start()
+    flushed.join(5)
+    assert not flushed.is_alive()
+    session_log._normalize = None
+    session_log.write("router1#")
+    session_log.close()
+    assert buffer.getvalue() == b"router1#"
+
+
+def test_session_log_attribute(tmp_path):
+    """session_log is the object passed, or the SessionLog opened for a file path"""
+    buffer = io.BytesIO()
+    file_name = str(tmp_path / "session.log")
+    with DeviceSimulator() as simulator:
+        device = simulator.device(fast_cli=True, session_log=buffer)
+        with ConnectHandler(**device) as net_connect:
+            assert net_connect.session_log is buffer
+            net_connect.send_command("show clock")
+        assert net_connect.session_log is buffer
+        assert b"show clock" in buffer.getvalue()
+        device = simulator.device(fast_cli=True, session_log=file_name)
+        with ConnectHandler(**device) as net_connect:
+            assert net_connect.session_log.name == file_name
+        assert net_connect.session_log is None
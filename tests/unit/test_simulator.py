@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+import time
+
+import paramiko
+import pytest
+
+from netmiko import ConnectHandler
+from netmiko.simulator import DeviceSimulator, PLATFORMS, ShapedLink, SimulatedCLI
+from netmiko.ssh_exception import NetmikoAuthenticationException
+
+
+def type_line(cli, line):
+    return cli.feed(line.encode("utf-8") + b"\n").decode("utf-8")
+
+
+def test_cli_echo_and_prompt():
+    cli = SimulatedCLI("cisco_ios")
+    assert cli.start() == b"router1#"
+    output = type_line(cli, "show clock")
+    assert output == "show clock\r\n*10:15:32.123 UTC Mon Oct 12 2026\r\nrouter1#"
+    # Keystrokes split across reads, '\r\n' is a single key press
+    assert cli.feed(b"show cl") == b"show cl"
+    assert cli.feed(b"ock\r\n").endswith(b"2026\r\nrouter1#")
+    assert type_line(cli, "") == "\r\nrouter1#"
+    output = type_line(cli, "show bogus")
+    assert output.endswith("% Invalid input detected at '^' marker.\r\nrouter1#")
+
+
+def test_cli_paging():
+    cli = SimulatedCLI("cisco_ios")
+    cli.start()
+    output = type_line(cli, "show running-config")
+    assert output.endswith(" --More-- ")
+    assert output.count("\r\n") == 24
+    output = cli.feed(b" ").decode()
+    assert output.startswith(PLATFORMS["cisco_ios"]["more_erase"])
+    assert output.endswith(" --More-- ")
+    output = cli.feed(b"\n").decode()
+    assert output.count("\r\n") == 1
+    assert cli.feed(b"q").decode().endswith("router1#")
+    # No paging once disabled
+    assert type_line(cli, "terminal length 0") == "terminal length 0\r\nrouter1#"
+    output = type_line(cli, "show running-config")
+    assert "--More--" not in output and output.endswith("end\r\nrouter1#")
+
+
+def test_cli_config_mode():
+    cli = SimulatedCLI("cisco_ios")
+    cli.start()
+    assert type_line(cli, "configure terminal").endswith("router1(config)#")
+    assert type_line(cli, "interface Gi1/0/1").endswith("router1(config-if)#")
+    assert type_line(cli, "exit").endswith("router1(config)#")
+    assert type_line(cli, "end").endswith("\r\nrouter1#")
+
+    junos = SimulatedCLI("juniper_junos")
+    assert junos.start() == b"admin@router1> "
+    assert type_line(junos, "configure").endswith("\r\n[edit]\r\nadmin@router1# ")
+    assert "commit complete" in type_line(junos, "commit")
+    assert type_line(junos, "exit configuration-mode").endswith("admin@router1> ")
+
+
+def test_cli_line_wrapping():
+    cli = SimulatedCLI("cisco_ios", width=80)
+    cli.start()
+    line = "description " + "x" * 200
+    echo = cli.feed(line.encode()).decode()
+    # The echo wraps at the terminal width, the prompt included
+    assert echo.count("\x08") == 20
+    assert echo.replace("\x08", "") == line
+    assert echo.index("\x08") == 80 - len("router1#")
+    # Deleted characters are erased with backspaces
+    assert cli.feed(b"\x7f") == b"\x08 \x08"
+
+
+def test_cli_ansi_any_key_and_logout():
+    cli = SimulatedCLI("hp_procurve")
+    banner = cli.start().decode()
+    assert banner.startswith("\x1b[2J") and banner.endswith(
+        "Press any key to continue\r\n"
+    )
+    assert "router1#" not in banner
+    prompt = cli.feed(b"\n").decode()
+    assert prompt == "\r\n\x1b[24;1H\x1b[2Krouter1# \x1b[?25h"
+    assert type_line(cli, "logout").endswith("Do you want to log out [y/n]? ")
+    assert not cli.closed
+    cli.feed(b"y\n")
+    assert cli.closed
+
+
+def test_cli_platforms():
+    for platform, fixture in PLATFORMS.items():
+        cli = SimulatedCLI(platform, commands={"show extra": "extra output"})
+        cli.start()
+        cli.feed(b"\n")
+        assert "extra output\r\n" in type_line(cli, "show extra")
+        for command, output in fixture["commands"].items():
+            assert cli.run(command) == output.replace("\n", "\r\n")
+    with pytest.raises(ValueError):
+        SimulatedCLI("bogus")
+
+
+class FakeChannel(object):
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append((time.monotonic(), data))
+
+
+def test_shaped_link():
+    channel = FakeChannel()
+    link = ShapedLink(channel, latency=0.1, jitter=0.02)
+    start = time.monotonic()
+    link.send(b"a")
+    link.send(b"b")
+    link.close()
+    assert [data for _, data in channel.sent] == [b"a", b"b"]
+    assert channel.sent[0][0] - start >= 0.08
+    assert channel.sent[0][0] <= channel.sent[1][0]
+
+    channel = FakeChannel()
+    link = ShapedLink(channel, throughput=10000, chunk_size=500)
+    start = time.monotonic()
+    link.send(b"x" * 2000)
+    link.close()
+    assert [len(data) for _, data in channel.sent] == [500] * 4
+    # 1500 bytes at 10000 bytes/s before the last chunk
+    assert channel.sent[-1][0] - start >= 0.14
+
+
+@pytest.fixture(scope="module")
+def host_key():
+    return paramiko.RSAKey.generate(1024)
+
+
+@pytest.mark.parametrize(
+    "platform,command,config",
+    [
+        ("cisco_ios", "show version", ["interface Gi1/0/1", "description test"]),
+        ("arista_eos", "show version", ["interface Ethernet1", "description test"]),
+        ("juniper_junos", "show version", ["set system host-name router2"]),
+        ("hp_procurve", "show version", ["interface 1", "name test"]),
+        ("cisco_nxos", "show version", ["interface Ethernet1/1", "description test"]),
+        ("linux", "uname -a", None),
+    ],
+)
+def test_drivers(host_key, platform, command, config):
+    with DeviceSimulator(platform, host_key=host_key) as simulator:
+        device = simulator.device(fast_cli=True, global_delay_factor=0.1)
+        with ConnectHandler(**device) as net_connect:
+            assert "router1" in net_connect.base_prompt
+            output = net_connect.send_command(command)
+            assert output == PLATFORMS[platform]["commands"][command]
+            if config:
+                output = net_connect.send_config_set(config)
+                assert config[-1] in output
+                assert not net_connect.check_config_mode()
+
+
+def test_simulator_latency_and_auth(host_key):
+    with DeviceSimulator(host_key=host_key) as simulator:
+        with ConnectHandler(**simulator.device(fast_cli=True)) as net_connect:
+            start = time.monotonic()
+            net_connect.send_command("show clock")
+            fast = time.monotonic() - start
+        with pytest.raises(NetmikoAuthenticationException):
+            ConnectHandler(**simulator.device(password="wrong"))
+    with DeviceSimulator(latency=0.1, host_key=host_key) as simulator:
+        with ConnectHandler(**simulator.device(fast_cli=True)) as net_connect:
+            start = time.monotonic()
+            net_connect.send_command("show clock")
+            slow = time.monotonic() - start
+    # At least a round trip for the echo and the output
+    assert slow >= fast + 0.1
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+import time
+
+import pytest
+
+pytest.importorskip("pysnmp")
+
+from netmiko import snmp_autodetect  # noqa
+from netmiko.autodetect_cache import AutodetectCache  # noqa
+from netmiko.snmp_autodetect import SNMP_MAPPER_OIDS, SNMPBulkDetect  # noqa
+
+SYS_DESCR = ".1.3.6.1.2.1.1.1.0"
+
+DEVICES = {
+    "rtr1": {SYS_DESCR: "Cisco IOS Software, C2960 Software"},
+    "rtr2": {SYS_DESCR: "Arista Networks EOS version 4.20"},
+    "srv1": {SYS_DESCR: "Linux srv1 5.10.0"},
+}
+
+SNMP_ARGS = {"snmp_version": "v1", "community": "public"}
+
+
+class FakeDispatcher(object):
+    """Answer the queued requests from DEVICES, in the dispatcher thread."""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.queued = []
+        self.closed = False
+
+    def runDispatcher(self):
+        while self.queued:
+            time.sleep(self.delay)
+            self.queued.pop(0)()
+
+    def closeDispatcher(self):
+        self.closed = True
+
+
+class FakeCmdgen(object):
+    """The parts of pysnmp's cmdgen used by SNMPBulkDetect, SNMPv1 behaviour."""
+
+    def __init__(self, cmdgen, delay=0):
+        self.cmdgen = cmdgen
+        self.delay = delay
+        self.engines = []
+        self.requests = []
+
+    def __getattr__(self, name):
+        # The constants (authentication protocols...)
+        return getattr(self.cmdgen, name)
+
+    def SnmpEngine(self):
+        engine = type("FakeSnmpEngine", (object,), {"transportDispatcher": None})()
+        self.engines.append(engine)
+        return engine
+
+    def CommunityData(self, community, mpModel=1):
+        return community
+
+    def UdpTransportTarget(self, address, timeout=1, retries=5):
+        if address[0] not in DEVICES:
+            raise Exception(f"Bad IPv4/UDP transport address {address[0]}")
+        return address[0]
+
+    def ContextData(self):
+        return None
+
+    def ObjectType(self, oid):
+        return oid
+
+    def ObjectIdentity(self, oid):
+        return oid
+
+    def getCmd(self, engine, auth_data, hostname, context, *oids, **kwargs):
+        if engine.transportDispatcher is None:
+            engine.transportDispatcher = FakeDispatcher(self.delay)
+        self.requests.append((hostname, list(oids)))
+
+        def respond():
+            responses = DEVICES[hostname]
+            var_binds = [(oid, responses.get(oid, "")) for oid in oids]
+            missing = [i for i, oid in enumerate(oids, 1) if oid not in responses]
+            # noSuchName and the index of the first missing OID
+            error_status, error_index = (2, missing[0]) if missing else (0, 0)
+            kwargs["cbFun"](
+                engine, 1, None, error_status, error_index, var_binds, kwargs["cbCtx"]
+            )
+
+        engine.transportDispatcher.queued.append(respond)
+
+
+@pytest.fixture
+def fake_cmdgen(monkeypatch):
+    fake = FakeCmdgen(snmp_autodetect.cmdgen)
+    monkeypatch.setattr(snmp_autodetect, "cmdgen", fake)
+    return fake
+
+
+def test_bulk_detect(fake_cmdgen):
+    hosts = ["rtr1", "rtr2", "srv1", "unresolvable"]
+    detect = SNMPBulkDetect(hosts, max_concurrency=2, **SNMP_ARGS)
+    assert detect.autodetect() == {
+        "rtr1": "cisco_ios",
+        "rtr2": "arista_eos",
+        "srv1": None,
+        "unresolvable": None,
+    }
+    # SNMPv1: each request missing an OID is retried without it
+    assert fake_cmdgen.requests == [
+        ("rtr1", SNMP_MAPPER_OIDS),
+        ("rtr2", SNMP_MAPPER_OIDS),
+        ("rtr1", [SYS_DESCR]),
+        ("rtr2", [SYS_DESCR]),
+        ("srv1", SNMP_MAPPER_OIDS),
+        ("srv1", [SYS_DESCR]),
+    ]
+    assert fake_cmdgen.engines[0].transportDispatcher.closed
+
+
+def test_bulk_detect_no_request(fake_cmdgen):
+    detect = SNMPBulkDetect(["unresolvable"], **SNMP_ARGS)
+    assert detect.autodetect() == {"unresolvable": None}
+
+
+def test_bulk_detect_cache(fake_cmdgen, tmp_path):
+    cache = AutodetectCache(path=str(tmp_path / "cache.sqlite"))
+    cache.set("snmp", "rtr1", 161, "cisco_ios")
+    cache.set("snmp", "rtr2", 161, "cisco_ios")
+    detect = SNMPBulkDetect(["rtr1", "rtr2"], autodetect_cache=cache, **SNMP_ARGS)
+    assert detect.autodetect() == {"rtr1": "cisco_ios", "rtr2": "arista_eos"}
+    # A single GET verifies the cached device_type, a stale entry is replaced
+    assert fake_cmdgen.requests[:2] == [("rtr1", [SYS_DESCR]), ("rtr2", [SYS_DESCR])]
+    assert ("rtr2", SNMP_MAPPER_OIDS) in fake_cmdgen.requests
+    assert ("rtr1", SNMP_MAPPER_OIDS) not in fake_cmdgen.requests
+    assert cache.get("snmp", "rtr2", 161) == ("arista_eos", "")
+
+
+def test_bulk_detect_stop_early(fake_cmdgen):
+    fake_cmdgen.delay = 0.05
+    detect = SNMPBulkDetect(
+        ["rtr1", "rtr2", "srv1"] * 10, max_concurrency=1, **SNMP_ARGS
+    )
+    results = detect.autodetect_iter()
+    assert next(results) == ("rtr1", "cisco_ios")
+    results.close()
+    dispatcher = fake_cmdgen.engines[0].transportDispatcher
+    for _ in range(100):
+        if dispatcher.closed:
+            break
+        time.sleep(0.05)
+    # No new request was sent and the dispatcher was closed
+    assert dispatcher.closed
+    assert len(fake_cmdgen.requests) < 10
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+import time
+
+import pytest
+
+from netmiko.autodetect_cache import AutodetectCache
+from netmiko.ssh_autodetect import SSH_MAPPER_BASE, SSHDetect, _compile_patterns
+from netmiko.terminal_server import TerminalServerSSH
+
+
+class FakeTerminalServer(TerminalServerSSH):
+    """TerminalServerSSH that records disconnects instead of touching a channel"""
+
+    def __init__(self, reads=None):
+        self.device_type = "autodetect"
+        self.host = "10.0.0.1"
+        self.port = 22
+        self.disconnected = False
+        self.global_delay_factor = 1
+        self.fast_cli = False
+        self.written = ""
+        self.reads = list(reads or [])
+
+    def disconnect(self):
+        self.disconnected = True
+
+    def write_channel(self, out_data):
+        self.written += out_data
+
+    def read_channel(self):
+        return self.reads.pop(0) if self.reads else ""
+
+    def _read_channel_timing(self, *args, **kwargs):
+        return "".join(self.reads)
+
+
+def make_detect(matches=None, initial_buffer="", reads=None, autodetect_cache=None):
+    detect = SSHDetect.__new__(SSHDetect)
+    detect.autodetect_cache = autodetect_cache
+    detect.connection = FakeTerminalServer(reads)
+    detect.potential_matches = {}
+    detect._results_cache = {}
+    detect.initial_buffer = initial_buffer
+    detect.prompt = SSHDetect._find_prompt(initial_buffer)
+    detect.hint_scores = SSHDetect._score_initial_buffer(initial_buffer)
+    if matches is not None:
+        detect._find_best_match = lambda: matches
+    return detect
+
+
+def test_autodetect_disconnects():
+    detect = make_detect("cisco_ios")
+    assert detect.autodetect() == "cisco_ios"
+    assert detect.connection.disconnected
+
+
+def test_connect_redispatches_session():
+    """connect() reuses the autodetect SSH session for the detected device_type"""
+    detect = make_detect("cisco_ios")
+    connection = detect.connect(session_prep=False)
+    assert connection is detect.connection
+    assert type(connection).__name__ == "CiscoIosSSH"
+    assert connection.device_type == "cisco_ios"
+    assert not connection.disconnected
+
+
+def test_connect_no_match():
+    detect = make_detect()
+    detect._find_best_match = lambda: None
+    assert detect.connect() is None
+    assert detect.connection.disconnected
+
+
+def test_connect_redispatch_error():
+    detect = make_detect()
+    with pytest.raises(KeyError):
+        detect.connect(device_type="bogus")
+    assert detect.connection.disconnected
+
+
+def test_prompt_and_hints():
+    """The banner and prompt in the initial buffer are used to order the probes"""
+    detect = make_detect(initial_buffer="\n--- JUNOS 18.2R1 Kernel\nadmin@vsrx1> ")
+    assert detect.prompt == "admin@vsrx1>"
+    assert detect._probe_order()[0] == "juniper_junos"
+
+    detect = make_detect(initial_buffer="\r\n<HUAWEI-AR1>")
+    assert detect.prompt == "<HUAWEI-AR1>"
+    assert detect._probe_order()[0] == "huawei"
+
+    detect = make_detect(initial_buffer="Welcome\nPassword ok, continue")
+    assert detect.prompt is None
+    assert detect.hint_scores == {}
+    # Without hints, the command shared by the most device_types is sent first
+    assert detect._probe_order()[0] == "alcatel_sros"
+
+
+def test_send_command_reads_until_prompt():
+    """Reading stops once the prompt is received, remaining data is left on the channel"""
+    reads = ["show version\r\n", "Cisco IOS Software\r\n", "router1#", "extra"]
+    detect = make_detect(initial_buffer="router1#", reads=reads)
+    start = time.time()
+    assert detect._autodetect_std(
+        cmd="show version", search_patterns=["Cisco IOS Software"]
+    )
+    assert time.time() - start < 1
+    assert detect.connection.written == "show version\n"
+    assert detect.connection.reads == ["extra"]
+    assert detect._results_cache["show version"].endswith("router1#")
+
+
+def test_send_command_paged_output():
+    """Reading stops at the paging prompt instead of waiting for the timeout"""
+    reads = ["show version\r\n", "Cisco IOS Software\r\n", " --More-- "]
+    detect = make_detect(initial_buffer="router1#", reads=reads)
+    start = time.time()
+    assert detect._autodetect_std(
+        cmd="show version", search_patterns=["Cisco IOS Software"]
+    )
+    assert time.time() - start < 1
+
+
+def test_autodetect_std_precompiled_patterns():
+    """The patterns compiled at load time are reused by _autodetect_std"""
+    detect = make_detect(
+        initial_buffer="router1#", reads=["Cisco IOS Software\nrouter1#"]
+    )
+    search_patterns = SSH_MAPPER_BASE["cisco_ios"]["search_patterns"]
+    misses = _compile_patterns.cache_info().misses
+    assert detect._autodetect_std(cmd="show version", search_patterns=search_patterns)
+    assert _compile_patterns.cache_info().misses == misses
+
+
+def test_autodetect_std_invalid_response():
+    reads = ["show system\r\n% Invalid input detected at '^' marker.\r\nrouter1#"]
+    detect = make_detect(initial_buffer="router1#", reads=reads)
+    assert detect._autodetect_std(cmd="show system", search_patterns=["Alcatel"]) == 0
+
+
+def test_autodetect_cache(tmp_path):
+    """Entries expire after the TTL and are ignored if the fingerprint changed"""
+    cache = AutodetectCache(path=str(tmp_path / "cache.sqlite"), ttl=60)
+    assert cache.get("ssh", "10.0.0.1", 22, "key1") is None
+    cache.set("ssh", "10.0.0.1", 22, "cisco_ios", fingerprint="key1", verify="r1#")
+    assert cache.get("ssh", "10.0.0.1", 22, "key1") == ("cisco_ios", "r1#")
+    assert cache.get("ssh", "10.0.0.1", 22, "key2") is None
+    assert cache.get("snmp", "10.0.0.1", 22, "key1") is None
+    cache.ttl = -1
+    assert cache.get("ssh", "10.0.0.1", 22, "key1") is None
+    cache.ttl = 60
+    cache.delete("ssh", "10.0.0.1", 22)
+    assert cache.get("ssh", "10.0.0.1", 22, "key1") is None
+
+
+def test_ssh_detect_uses_cache(tmp_path):
+    """A cached device_type skips the probes if the prompt still matches"""
+    cache = AutodetectCache(path=str(tmp_path / "cache.sqlite"))
+    reads = ["show version\r\nCisco IOS Software\r\nrouter1#"]
+    detect = make_detect(initial_buffer="router1#", reads=reads, autodetect_cache=cache)
+    assert detect.autodetect() == "cisco_ios"
+    assert cache.get("ssh", "10.0.0.1", 22) == ("cisco_ios", "router1#")
+
+    detect = make_detect(initial_buffer="router1#", autodetect_cache=cache)
+    assert detect.autodetect() == "cisco_ios"
+    assert detect.connection.written == ""
+
+    # Different prompt: the entry is discarded and the probes are sent
+    detect = make_detect(initial_buffer="admin@vsrx1>", autodetect_cache=cache)
+    detect._probe = lambda: None
+    assert detect.autodetect() is None
+    assert cache.get("ssh", "10.0.0.1", 22) is None
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+import os
+import time
+from threading import Lock, Thread
+
+import paramiko
+import pytest
+
+from netmiko import ssh_cache
+from netmiko.base_connection import BaseConnection
+
+
+class FakeBaseConnection(BaseConnection):
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._session_locker = Lock()
+
+
+def test_load_ssh_config(tmp_path):
+    config_file = tmp_path / "ssh_config"
+    config_file.write_text("host router1\n  hostname 10.1.1.1\n")
+    ssh_config = ssh_cache.load_ssh_config(str(config_file))
+    assert ssh_config.lookup("router1")["hostname"] == "10.1.1.1"
+    assert ssh_cache.load_ssh_config(str(config_file)) is ssh_config
+
+    # The file is parsed again when it changes
+    config_file.write_text("host router1\n  hostname 10.2.2.2\n")
+    os.utime(str(config_file), ns=(0, 0))
+    new_ssh_config = ssh_cache.load_ssh_config(str(config_file))
+    assert new_ssh_config is not ssh_config
+    assert new_ssh_config.lookup("router1")["hostname"] == "10.2.2.2"
+
+
+def test_load_host_keys(tmp_path):
+    key = paramiko.RSAKey.generate(1024)
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(f"router1 {key.get_name()} {key.get_base64()}\n")
+    host_keys = ssh_cache.load_host_keys(str(known_hosts))
+    assert host_keys.lookup("router1")[key.get_name()] == key
+    assert ssh_cache.load_host_keys(str(known_hosts)) is host_keys
+
+    # Modifying a copy doesn't change the cached host keys
+    host_keys_copy = ssh_cache.copy_host_keys(host_keys)
+    host_keys_copy.add("router2", key.get_name(), key)
+    assert host_keys_copy.lookup("router1")[key.get_name()] == key
+    assert host_keys.lookup("router2") is None
+
+
+def test_load_system_host_keys(tmp_path, monkeypatch):
+    key = paramiko.RSAKey.generate(1024)
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(f"router1 {key.get_name()} {key.get_base64()}\n")
+    monkeypatch.setattr(ssh_cache, "SYSTEM_HOST_KEYS_FILE", str(tmp_path / "missing"))
+    monkeypatch.setattr(ssh_cache, "WINDOWS_HOST_KEYS_FILE", str(known_hosts))
+    assert ssh_cache.load_host_keys().lookup("router1")[key.get_name()] == key
+    monkeypatch.setattr(ssh_cache, "WINDOWS_HOST_KEYS_FILE", str(tmp_path / "missing"))
+    assert len(ssh_cache.load_host_keys()) == 0
+
+
+def test_cached_single_load(tmp_path):
+    """Concurrent callers with a cold cache wait for a single load"""
+    file_name = tmp_path / "known_hosts"
+    file_name.write_text("")
+    cache = {}
+    loads = []
+
+    def load():
+        loads.append(1)
+        time.sleep(0.1)
+        return object()
+
+    values = []
+
+    def get():
+        values.append(ssh_cache._cached(cache, "key", str(file_name), load))
+
+    threads = [Thread(target=get) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert len(values) == 10 and all(value is values[0] for value in values)
+
+
+def test_load_private_key(tmp_path):
+    key_file = str(tmp_path / "id_rsa")
+    paramiko.RSAKey.generate(1024).write_private_key_file(key_file, password="pass")
+    pkey = ssh_cache.load_private_key(key_file, "pass")
+    assert isinstance(pkey, paramiko.RSAKey)
+    assert ssh_cache.load_private_key(key_file, "pass") is pkey
+    with pytest.raises(paramiko.SSHException):
+        ssh_cache.load_private_key(key_file, "wrong")
+
+
+def test_build_ssh_client_shares_host_keys(tmp_path, monkeypatch):
+    key = paramiko.RSAKey.generate(1024)
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(f"router1 {key.get_name()} {key.get_base64()}\n")
+    monkeypatch.setattr(ssh_cache, "SYSTEM_HOST_KEYS_FILE", str(known_hosts))
+    connection = FakeBaseConnection(
+        system_host_keys=True,
+        alt_host_keys=True,
+        alt_key_file=str(known_hosts),
+        key_policy=paramiko.RejectPolicy(),
+    )
+    ssh_client = connection._build_ssh_client()
+    other_client = connection._build_ssh_client()
+    assert ssh_client._system_host_keys is other_client._system_host_keys
+    assert ssh_client.get_host_keys() is not other_client.get_host_keys()
+    assert ssh_client.get_host_keys().lookup("router1")[key.get_name()] == key
+    ssh_client.save_host_keys(str(tmp_path / "saved"))
+    assert "router1" in (tmp_path / "saved").read_text()
+
+
+def test_connect_params_cached_key(tmp_path):
+    key_file = str(tmp_path / "id_rsa")
+    paramiko.RSAKey.generate(1024).write_private_key_file(key_file, password="pass")
+    params = dict(
+        host="router1",
+        port=22,
+        username="admin",
+        password="pass",
+        use_keys=True,
+        allow_agent=False,
+        key_file=key_file,
+        pkey=None,
+        passphrase=None,
+        timeout=10,
+        auth_timeout=None,
+        banner_timeout=15,
+        sock=None,
+        ssh_config_file=None,
+    )
+    conn_dict = FakeBaseConnection(**params)._connect_params_dict()
+    assert conn_dict["pkey"] is ssh_cache.load_private_key(key_file, "pass")
+    assert conn_dict["key_filename"] is None
+
+    # Paramiko loads the key_file itself if it can't be decrypted
+    params["password"] = "wrong"
+    conn_dict = FakeBaseConnection(**params)._connect_params_dict()
+    assert conn_dict["pkey"] is None
+    assert conn_dict["key_filename"] == key_file
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import subprocess
+import sys
+
+import pytest
+
+from netmiko.base_connection import BaseConnection
+from netmiko.scp_handler import BaseFileTransfer
+from netmiko.ssh_dispatcher import (
+    CLASS_MAPPER,
+    CLASS_MAPPER_BASE,
+    FILE_TRANSFER_MAP,
+    LazyClassMapper,
+    ssh_dispatcher,
+)
+
+
+def test_class_mapper_resolves():
+    """Every device_type in the registry resolves to a connection class"""
+    for device_type in CLASS_MAPPER:
+        assert issubclass(CLASS_MAPPER[device_type], BaseConnection)
+    for device_type in CLASS_MAPPER_BASE:
+        assert CLASS_MAPPER[device_type] is CLASS_MAPPER[device_type + "_ssh"]
+
+
+def test_file_transfer_map_resolves():
+    """Every SCP device_type in the registry resolves to a file transfer class"""
+    for device_type in FILE_TRANSFER_MAP:
+        assert issubclass(FILE_TRANSFER_MAP[device_type], BaseFileTransfer)
+
+
+def test_lazy_class_mapper():
+    """Modules are imported on first lookup; classes can also be registered directly"""
+    mapper = LazyClassMapper({"fake": ("netmiko.base_connection", "BaseConnection")})
+    assert "fake" in mapper
+    assert list(mapper.raw_items()) == [
+        ("fake", ("netmiko.base_connection", "BaseConnection"))
+    ]
+    assert mapper["fake"] is BaseConnection
+    assert list(mapper.raw_items()) == [("fake", BaseConnection)]
+    mapper["other"] = BaseConnection
+    assert sorted(mapper) == ["fake", "other"]
+    with pytest.raises(KeyError):
+        mapper["missing"]
+    assert ssh_dispatcher("cisco_ios").__name__ == "CiscoIosSSH"
+
+
+def test_import_does_not_load_drivers():
+    """Importing netmiko and listing platforms does not import the drivers or Paramiko"""
+    code = (
+        "import sys, netmiko; "
+        "assert 'cisco_ios' in netmiko.platforms; "
+        "heavy = ['paramiko', 'scp', 'serial', 'telnetlib', 'netmiko.cisco']; "
+        "print([m for m in heavy if m in sys.modules])"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])
+    assert output.strip() == b"[]"
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+import io
+import json
+import logging
+from threading import Lock
+
+import pytest
+
+from netmiko import tracing
+from netmiko.base_connection import BaseConnection
+
+
+class FakeConnection(BaseConnection):
+    """Connection establishing nothing, session_preparation calls the timed methods"""
+
+    def __init__(self, fail=False):
+        self.hooks = []
+        self.device_type = "cisco_ios"
+        self.host = "router1"
+        self.port = 22
+        self.fail = fail
+        self.protocol = "ssh"
+        self.remote_conn = self.remote_conn_pre = self.session_log = None
+        self._session_locker = Lock()
+        self._open()
+
+    def establish_connection(self, width=None, height=None):
+        with self._connect_phase("tcp_connect"):
+            pass
+
+    def session_preparation(self):
+        self.set_base_prompt()
+        if self.fail:
+            raise ValueError("session_preparation failed")
+
+    def find_prompt(self, delay_factor=1):
+        return "router1#"
+
+
+@pytest.fixture
+def spans():
+    spans = []
+    handler = tracing.enable_tracing(sink=spans.append)
+    yield spans
+    tracing.disable_tracing(handler)
+
+
+def test_disabled():
+    assert not tracing.enabled()
+    with tracing.span("job") as span:
+        assert span is None
+
+
+def test_debug_logging_does_not_enable_tracing():
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.DEBUG)
+    try:
+        assert not tracing.enabled()
+    finally:
+        root.setLevel(level)
+
+
+def test_connect_spans(spans):
+    connection = FakeConnection()
+    names = [span.name for span in spans]
+    assert names == ["tcp_connect", "session_preparation", "set_base_prompt", "connect"]
+    tcp_connect, session_preparation, set_base_prompt, connect = spans
+    assert connect.parent_id is None
+    assert connect.attributes == {
+        "device_type": "cisco_ios",
+        "host": "router1",
+        "port": 22,
+    }
+    assert connect.status == tracing.STATUS_OK
+    assert tcp_connect.parent_id == connect.span_id
+    assert session_preparation.parent_id == connect.span_id
+    assert set_base_prompt.parent_id == session_preparation.span_id
+    assert {span.trace_id for span in spans} == {connect.trace_id}
+    assert connect.start_ns <= session_preparation.start_ns <= set_base_prompt.start_ns
+    assert set_base_prompt.end_ns <= connect.end_ns
+
+    # The spans of a connection share the trace ID
+    del spans[:]
+    connection.disconnect()
+    assert [span.name for span in spans] == ["disconnect"]
+    assert spans[0].trace_id == connect.trace_id
+
+
+def test_connect_error_span(spans):
+    with pytest.raises(ValueError):
+        FakeConnection(fail=True)
+    connect = spans[-1]
+    assert connect.name == "connect"
+    assert connect.status == tracing.STATUS_ERROR
+    otlp = connect.to_otlp()
+    assert otlp["status"] == {"code": 2, "message": "session_preparation failed"}
+    assert otlp["events"][0]["name"] == "exception"
+
+
+def test_command_spans(spans, fake_ssh_connection):
+    connection = fake_ssh_connection()
+    with tracing.span("job", site="paris") as job:
+        connection.send_command("show version")
+    command = spans[-2]
+    assert spans[-1] is job
+    assert command.name == "send_command"
+    assert command.parent_id == job.span_id
+    assert command.trace_id == job.trace_id
+    assert command.attributes["command"] == "show version"
+    assert command.attributes["bytes_received"] > 0
+    phases = [span for span in spans if span.parent_id == command.span_id]
+    assert [span.name for span in phases] == [
+        "prompt_discovery",
+        "clear_buffer",
+        "write",
+        "echo_wait",
+        "prompt_wait",
+        "sanitize",
+    ]
+    assert connection._command_record is None
+    assert tracing.current_span() is None
+
+
+def test_json_lines_exporter(fake_ssh_connection):
+    stream = io.StringIO()
+    handler = tracing.enable_tracing(stream=stream)
+    try:
+        fake_ssh_connection().send_command("show version")
+    finally:
+        tracing.disable_tracing(handler)
+    assert not tracing.enabled()
+
+    lines = stream.getvalue().splitlines()
+    request = json.loads(lines[-1])
+    resource_spans = request["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "netmiko"}}
+    ]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "send_command"
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+    attributes = {a["key"]: a["value"] for a in span["attributes"]}
+    assert attributes["command"] == {"stringValue": "show version"}
+    assert attributes["host"] == {"stringValue": "router1"}
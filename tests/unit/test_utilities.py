@@ -6,7 +6,8 @@ import sys
 
 import pytest
 
-from netmiko import utilities
+from netmiko import parse_pool, utilities
+from netmiko.parse_pool import ParsePool
 from netmiko._textfsm import _clitable as clitable
 
 RESOURCE_FOLDER = join(dirname(dirname(__file__)), "etc")
@@ -251,6 +252,208 @@ def test_textfsm_missing_template():
     assert result == raw_output
 
 
+def test_textfsm_stream_parser():
+    """Records are returned as soon as each line that completes them is fed."""
+    os.environ["NET_TEXTFSM"] = RESOURCE_FOLDER
+    with open(join(RESOURCE_FOLDER, "show_ip_int_brief.txt")) as f:
+        raw_output = f.read()
+    expected = utilities.get_structured_data(
+        raw_output, platform="cisco_ios", command="show ip int brief"
+    )
+    assert len(expected) == 4
+
+    parser = utilities.TextFSMStreamParser(
+        platform="cisco_ios", command="show ip int brief"
+    )
+    # Feed chunks that are not aligned to line boundaries
+    records = []
+    records += parser.feed(raw_output[:100])
+    assert records == []
+    records += parser.feed(raw_output[100:200])
+    assert records == expected[:1]
+    records += parser.feed(raw_output[200:])
+    records += parser.close()
+    assert records == expected
+
+
+def test_textfsm_stream_implicit_eof_record():
+    """Implicit EOF record is emitted when the stream is closed."""
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    result = list(
+        utilities.get_structured_data_stream(
+            [raw_output[:10], raw_output[10:]],
+            template=f"{RESOURCE_FOLDER}/cisco_ios_show_version.template",
+        )
+    )
+    assert result == [{"model": "4500"}]
+
+
+def test_textfsm_stream_fillup(tmp_path):
+    """Fillup values are backfilled into the earlier records, as in get_structured_data."""
+    template = tmp_path / "fillup.template"
+    template.write_text(
+        "Value INTERFACE (\\S+)\n"
+        "Value Fillup VRF (\\S+)\n"
+        "\n"
+        "Start\n"
+        "  ^interface ${INTERFACE} -> Record\n"
+        "  ^vrf ${VRF}\n"
+    )
+    raw_output = "interface Gi0/1\ninterface Gi0/2\nvrf mgmt\n"
+    expected = utilities.get_structured_data(raw_output, template=str(template))
+    assert expected[0] == {"interface": "Gi0/1", "vrf": "mgmt"}
+    chunks = raw_output.splitlines(True)
+    result = list(utilities.get_structured_data_stream(chunks, template=str(template)))
+    assert result == expected
+
+
+def test_textfsm_stream_missing_template():
+    """Template lookup failures are raised before any output is consumed."""
+    os.environ["NET_TEXTFSM"] = RESOURCE_FOLDER
+    with pytest.raises(clitable.CliTableError):
+        utilities.TextFSMStreamParser(platform="cisco_ios", command="show clock")
+
+
+def test_structured_data_cache():
+    """Identical output is parsed once; entries are evicted in LRU order."""
+    os.environ["NET_TEXTFSM"] = RESOURCE_FOLDER
+    cache = utilities.StructuredDataCache(maxsize=2)
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    for _ in range(3):
+        result = utilities.get_structured_data(
+            raw_output, platform="cisco_ios", command="show version", cache=cache
+        )
+        assert result == [{"model": "4500"}]
+    assert cache.info()["hits"] == 2
+    assert cache.info()["misses"] == 1
+
+    # Cached results are copies
+    result[0]["model"] = "changed"
+    result = utilities.get_structured_data(
+        raw_output, platform="cisco_ios", command="show version", cache=cache
+    )
+    assert result == [{"model": "4500"}]
+
+    for model in ("3850", "9300"):
+        utilities.get_structured_data(
+            f"Cisco IOS Software, Catalyst {model} L3 Switch Software",
+            platform="cisco_ios",
+            command="show version",
+            cache=cache,
+        )
+    assert len(cache) == 2
+    assert cache.info()["evictions"] == 1
+    assert cache.info()["misses"] == 3
+
+
+def test_structured_data_cache_global():
+    """enable_structured_data_cache() applies to all get_structured_data calls."""
+    template = f"{RESOURCE_FOLDER}/cisco_ios_show_version.template"
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    cache = utilities.enable_structured_data_cache(maxsize=10)
+    try:
+        utilities.get_structured_data(raw_output, template=template)
+        utilities.get_structured_data(raw_output, template=template)
+        # Unparseable output is cached as well
+        assert utilities.get_structured_data("junk", template=template) == "junk"
+        assert utilities.get_structured_data("junk", template=template) == "junk"
+        assert cache.info()["hits"] == 2
+        assert cache.info()["misses"] == 2
+    finally:
+        utilities.disable_structured_data_cache()
+    assert utilities.STRUCTURED_DATA_CACHE is None
+
+
+def test_structured_data_converter():
+    """TextFSM is tried first; raw output is returned if nothing could be parsed."""
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    template = f"{RESOURCE_FOLDER}/cisco_ios_show_version.template"
+    result = utilities.structured_data_converter(
+        raw_output,
+        "cisco_ios",
+        "show version",
+        use_textfsm=True,
+        textfsm_template=template,
+    )
+    assert result == [{"model": "4500"}]
+    result = utilities.structured_data_converter(
+        raw_output, "cisco_ios", "show version"
+    )
+    assert result == raw_output
+
+
+def test_parse_pool():
+    """Parse in worker processes (blocking and returning futures)."""
+    raw_output = "Cisco IOS Software, Catalyst 4500 L3 Switch Software"
+    template = f"{RESOURCE_FOLDER}/cisco_ios_show_version.template"
+    with ParsePool(max_workers=1) as pool:
+        result = pool.parse(
+            raw_output,
+            "cisco_ios",
+            "show version",
+            use_textfsm=True,
+            textfsm_template=template,
+        )
+        assert result == [{"model": "4500"}]
+    with ParsePool(max_workers=1, blocking=False) as pool:
+        future = pool.parse(
+            raw_output,
+            "cisco_ios",
+            "show version",
+            use_textfsm=True,
+            textfsm_template=template,
+        )
+        assert future.result(timeout=30) == [{"model": "4500"}]
+
+
+def test_parse_pool_warm_commands_py36(monkeypatch, caplog):
+    """warm_commands can't be used without the initializer of Python 3.7, a warning is logged"""
+    monkeypatch.setattr(parse_pool.sys, "version_info", (3, 6, 9))
+    with ParsePool(max_workers=1, warm_commands=[("cisco_ios", "show version")]):
+        pass
+    assert "require Python 3.7" in caplog.text
+
+
+def test_genie_device_and_parser_cache(monkeypatch):
+    """Genie Device objects are cached per OS and parser lookups per (os, command)."""
+    calls = {"device": 0, "get_parser": 0}
+
+    class FakeDevice:
+        def __init__(self, name, os):
+            calls["device"] += 1
+            self.os = os
+            self.custom = {}
+
+    class FakeParser:
+        def __init__(self, device):
+            self.device = device
+
+        def parse(self, output):
+            return {"os": self.device.os, "output": output}
+
+    def fake_get_parser(command, device):
+        calls["get_parser"] += 1
+        if command != "show version":
+            raise Exception("Could not find parser")
+        return FakeParser, {}
+
+    monkeypatch.setattr(utilities, "_GENIE", (FakeDevice, fake_get_parser, dict))
+    monkeypatch.setattr(utilities, "_GENIE_DEVICES", {})
+    utilities._genie_parser.cache_clear()
+
+    for _ in range(3):
+        result = utilities.get_structured_data_genie(
+            "raw", platform="cisco_ios", command="show version"
+        )
+        assert result == {"os": "ios", "output": "raw"}
+        result = utilities.get_structured_data_genie(
+            "raw", platform="cisco_ios", command="show clock"
+        )
+        assert result == "raw"
+    assert calls == {"device": 1, "get_parser": 2}
+    utilities._genie_parser.cache_clear()
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 8),
     reason="The genie package is not available for Python 3.8 yet",